@@ -3,22 +3,267 @@ Advanced Hidden Risk Detector
 Enhanced risk detection for bonus challenge
 """
 
+import asyncio
+import functools
 import logging
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+from utils.llm_cache import CachedOpenAIClient
 
 logger = logging.getLogger(__name__)
 
+# Tagged lines in detector responses, e.g. "SEVERITY: high"
+PARSE_RE = re.compile(r'^[ \t]*(RISK|SEVERITY|EVIDENCE|IMPACT):[ \t]*(.*?)[ \t]*$', re.M)
+KEY_TO_FIELD = {
+    "RISK": "type",
+    "SEVERITY": "severity",
+    "EVIDENCE": "evidence",
+    "IMPACT": "impact"
+}
+
+
+# Static detector rubrics. These are sent byte-for-byte identical on every call,
+# ahead of the per-vendor data, so the provider can serve them from its prompt
+# prefix cache. Keep anything vendor-specific out of these strings.
+
+GITHUB_SYSTEM = "You are a GitHub health analyst. Be specific with evidence."
+
+GITHUB_RUBRIC = """Analyze GitHub activity patterns for the repository given at the end of this conversation.
+
+Detect these HIDDEN RISKS:
+1. **Commit Frequency Decline**: Has daily commits dropped to weekly/monthly?
+2. **Key Contributor Loss**: Any maintainers with 1000+ commits stopped contributing?
+3. **Stale PRs**: Are critical pull requests sitting unmerged for months?
+4. **Issue Backlog**: Is issue count growing with slower response times?
+5. **Fork Activity**: Are there active forks suggesting maintainer abandonment?
+
+Format: If risk found, output:
+RISK: [type]
+SEVERITY: [high/medium/low]
+EVIDENCE: [specific data points]
+IMPACT: [what this means for users]
+
+If no clear risk, output: NO_RISK"""
+
+PRICING_SYSTEM = "You are a SaaS pricing analyst. Focus on hidden costs."
+
+PRICING_RUBRIC = """Analyze the pricing structure of the vendor given at the end of this conversation.
+
+Detect PRICING EXPLOSION RISKS:
+1. **Non-linear Scaling**: Does cost grow faster than usage? (e.g., 10x users = 50x cost)
+2. **Hidden Op Fees**: Per-API-call, per-transaction fees that multiply at scale?
+3. **Discount Cliffs**: Does friendly SMB pricing vanish at enterprise tier?
+4. **Threshold Traps**: "Contact sales" at volumes reachable in 6-12 months?
+5. **Bandwidth/Storage**: Are overage fees disproportionately expensive?
+
+Example of REAL risk:
+- Auth0: $0.023/MAU looks cheap, but 1M users = $23k/month
+- Stripe: 2.9% is fine until high volume, then per-transaction adds up
+
+Format: If risk found:
+RISK: pricing_explosion
+SEVERITY: [high/medium/low]
+EVIDENCE: [specific pricing tier data]
+IMPACT: [cost projection at user's scale]
+
+If pricing is transparent and scales reasonably: NO_RISK"""
+
+ACQUISITION_SYSTEM = "You are M&A analyst focusing on customer impact."
+
+ACQUISITION_RUBRIC = """Check the acquisition status of the vendor given at the end of this conversation.
+
+Detect ACQUISITION RISKS:
+1. **Recent Acquisition**: Was company acquired in last 12 months?
+2. **Integration Chaos**: Reports of service disruption, breaking changes?
+3. **Pricing Increases**: Sudden price hikes post-acquisition?
+4. **Feature Sunset**: Deprecated features, forced migrations?
+5. **Support Degradation**: Slower support, reduced documentation?
+
+Format: If risk found:
+RISK: acquisition_disruption
+SEVERITY: [high/medium/low]
+EVIDENCE: [who acquired, when, what changed]
+IMPACT: [how this affects current users]
+
+If no recent acquisition or stable integration: NO_RISK"""
+
+COMPLIANCE_SYSTEM = "You are compliance auditor. Be precise with dates."
+
+COMPLIANCE_RUBRIC = """Check the compliance status of the vendor given at the end of this conversation.
+
+Detect COMPLIANCE RISKS:
+1. **Expired Certs**: Are certifications current or expired?
+2. **Failed Audits**: Any failed SOC 2, ISO, HIPAA audits?
+3. **Regional Issues**: Lost licenses in specific regions?
+4. **Pending Renewals**: Certifications up for renewal soon?
+
+Format: If risk found:
+RISK: compliance_drift
+SEVERITY: [high/medium/low]
+EVIDENCE: [which cert, status, date]
+IMPACT: [legal/regulatory implications]
+
+If all compliances current and valid: NO_RISK"""
+
+DEPRECATION_SYSTEM = "You are technical migration analyst."
+
+DEPRECATION_RUBRIC = """Check the vendor given at the end of this conversation for deprecation risks.
+
+Detect DEPRECATION RISKS:
+1. **API Sunsets**: Are current APIs being deprecated?
+2. **Forced Migration**: Mandatory version upgrades with breaking changes?
+3. **Short Timelines**: Less than 6 months to migrate?
+4. **SDK Abandonment**: Official SDKs no longer maintained?
+
+Format: If risk found:
+RISK: technology_deprecation
+SEVERITY: [high/medium/low]
+EVIDENCE: [what's deprecated, deadline]
+IMPACT: [migration effort required]
+
+If no imminent deprecations: NO_RISK"""
+
+
+# Keywords used to split one broad vendor search into per-detector evidence
+EVIDENCE_TOPICS = {
+    "github": ("github", "commit", "contributor", "maintainer", "repository", "pull request", "issue"),
+    "pricing": ("pricing", "price", "cost", "plan", "tier", "billing"),
+    "acquisition": ("acquisition", "acquire", "merger", "bought", "buyout"),
+    "compliance": ("compliance", "compliant", "certif", "audit", "soc 2", "pci", "iso 27001", "gdpr"),
+    "deprecation": ("deprecat", "sunset", "breaking change", "migration", "end of life", "legacy")
+}
+EVIDENCE_TOPIC_RES = {
+    topic: re.compile("|".join(re.escape(k) for k in keywords), re.I)
+    for topic, keywords in EVIDENCE_TOPICS.items()
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _format_results_tuple(pairs: Tuple[Tuple[str, str], ...]) -> str:
+    """Render (title, snippet) pairs; cached so repeat result sets reuse the same string."""
+    return "\n\n".join(f"- {title}: {snippet}" for title, snippet in pairs)
+
 
 class AdvancedRiskDetector:
     """Advanced risk detection for vendors."""
     
     def __init__(self, clawhub_client, openai_client):
         self.clawhub = clawhub_client
-        self.openai = openai_client
+        # Detector prompts run at temperature 0.2 and repeat across runs for
+        # the same vendor, so serve identical requests from cache.
+        if isinstance(openai_client, CachedOpenAIClient):
+            self.openai = openai_client
+        else:
+            self.openai = CachedOpenAIClient(openai_client)
     
-    async def detect_github_maintainer_risks(self, github_url: str) -> List[Dict]:
+    async def detect_all_risks(
+        self,
+        vendor_name: str,
+        github_url: Optional[str],
+        context: Dict,
+        compliance: List[str],
+        tech_stack: List[str]
+    ) -> List[Dict]:
+        """
+        Run every applicable detector concurrently.
+        
+        Evidence is gathered with a single broad search and split by topic,
+        then each detector's LLM call runs concurrently, so latency is bounded
+        by the slowest call rather than the sum.
+        
+        Args:
+            vendor_name: Vendor being analyzed
+            github_url: Vendor GitHub URL (maintainer check skipped if None)
+            context: Evaluation context (used for scale hints)
+            compliance: Required compliance standards
+            tech_stack: User tech stack
+        
+        Returns:
+            Flattened list of detected risks
+        """
+        evidence = await self._gather_vendor_evidence(vendor_name, github_url, compliance)
+        
+        tasks = []
+        
+        if github_url:
+            tasks.append(self.detect_github_maintainer_risks(github_url, results=evidence["github"]))
+        
+        tasks.append(self.detect_scaling_pricing_risks(vendor_name, context, results=evidence["pricing"]))
+        tasks.append(self.detect_acquisition_risks(vendor_name, results=evidence["acquisition"]))
+        
+        if compliance:
+            tasks.append(self.detect_compliance_drift_risks(vendor_name, compliance, results=evidence["compliance"]))
+        
+        tasks.append(self.detect_technology_deprecation_risks(vendor_name, tech_stack, results=evidence["deprecation"]))
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        risks = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Risk detection failed for {vendor_name}: {result}")
+            elif result:
+                risks.extend(result)
+        
+        logger.debug(f"Risk detector LLM cache stats after {vendor_name}: {self.openai.get_stats()}")
+        return risks
+    
+    async def _gather_vendor_evidence(
+        self,
+        vendor_name: str,
+        github_url: Optional[str],
+        compliance: List[str]
+    ) -> Dict[str, List[Dict]]:
+        """
+        Run one broad vendor search and bucket the results by detector topic.
+        
+        A result can land in several buckets. Topics with no keyword match
+        get the unfiltered results so every detector still has evidence.
+        
+        Args:
+            vendor_name: Vendor being analyzed
+            github_url: Vendor GitHub URL, if known
+            compliance: Required compliance standards
+        
+        Returns:
+            Mapping of topic name to search results
+        """
+        search_query = f"{vendor_name} acquisition pricing compliance deprecation github maintainers"
+        if compliance:
+            search_query += " " + " ".join(compliance)
+        results = await self.clawhub.web_search(search_query, num_results=25)
+        
+        topic_res = dict(EVIDENCE_TOPIC_RES)
+        if compliance:
+            topic_res["compliance"] = re.compile(
+                EVIDENCE_TOPIC_RES["compliance"].pattern + "|" + "|".join(re.escape(c) for c in compliance),
+                re.I
+            )
+        if github_url:
+            topic_res["github"] = re.compile(
+                EVIDENCE_TOPIC_RES["github"].pattern + "|" + re.escape(github_url),
+                re.I
+            )
+        
+        buckets: Dict[str, List[Dict]] = {topic: [] for topic in topic_res}
+        for result in results:
+            text = f"{result.get('title', '')} {result.get('snippet', '')} {result.get('url', '')}"
+            for topic, pattern in topic_res.items():
+                if pattern.search(text):
+                    buckets[topic].append(result)
+        
+        for topic, bucket in buckets.items():
+            if not bucket:
+                buckets[topic] = results
+        
+        return buckets
+    
+    async def detect_github_maintainer_risks(
+        self,
+        github_url: str,
+        results: Optional[List[Dict]] = None
+    ) -> List[Dict]:
         """
         Detect maintainer risks from GitHub activity patterns.
         
@@ -30,40 +275,20 @@ class AdvancedRiskDetector:
         """
         risks = []
         
-        # Search for recent activity
+        # Search for recent activity (unless evidence was pre-gathered)
         search_query = f"{github_url} commits contributors activity last 6 months"
-        results = await self.clawhub.web_search(search_query, num_results=10)
+        if results is None:
+            results = await self.clawhub.web_search(search_query, num_results=10)
         
-        analysis_prompt = f"""Analyze GitHub activity patterns for: {github_url}
-
-Search Results: {self._format_results(results)}
-
-Detect these HIDDEN RISKS:
-1. **Commit Frequency Decline**: Has daily commits dropped to weekly/monthly?
-2. **Key Contributor Loss**: Any maintainers with 1000+ commits stopped contributing?
-3. **Stale PRs**: Are critical pull requests sitting unmerged for months?
-4. **Issue Backlog**: Is issue count growing with slower response times?
-5. **Fork Activity**: Are there active forks suggesting maintainer abandonment?
-
-Format: If risk found, output:
-RISK: [type]
-SEVERITY: [high/medium/low]
-EVIDENCE: [specific data points]
-IMPACT: [what this means for users]
+        formatted_results = self._format_results(results)
+        dynamic_prompt = f"""Repository: {github_url}
 
-If no clear risk, output: NO_RISK"""
+Search Results: {formatted_results}"""
         
-        response = await self.openai.chat_completion(
-            messages=[
-                {"role": "system", "content": "You are a GitHub health analyst. Be specific with evidence."},
-                {"role": "user", "content": analysis_prompt}
-            ],
-            temperature=0.2,
-            max_tokens=400
-        )
+        response = await self._stream_risk_response(self._build_messages(GITHUB_SYSTEM, GITHUB_RUBRIC, dynamic_prompt))
         
         # Parse AI response
-        if "NO_RISK" not in response:
+        if not self._is_no_risk(response):
             risk = self._parse_risk_response(response, "github_maintainer")
             if risk:
                 risks.append(risk)
@@ -73,7 +298,8 @@ If no clear risk, output: NO_RISK"""
     async def detect_scaling_pricing_risks(
         self,
         vendor_name: str,
-        current_context: Dict
+        current_context: Dict,
+        results: Optional[List[Dict]] = None
     ) -> List[Dict]:
         """
         Detect pricing that explodes at scale.
@@ -90,49 +316,29 @@ If no clear risk, output: NO_RISK"""
         scale_hint = current_context.get('scale', 'startup')
         
         search_query = f"{vendor_name} pricing calculator cost at scale enterprise pricing"
-        results = await self.clawhub.web_search(search_query, num_results=10)
+        if results is None:
+            results = await self.clawhub.web_search(search_query, num_results=10)
         
-        analysis_prompt = f"""Analyze pricing structure for: {vendor_name}
-
+        formatted_results = self._format_results(results)
+        dynamic_prompt = f"""Vendor: {vendor_name}
 User Context: {scale_hint}
-Search Results: {self._format_results(results)}
 
-Detect PRICING EXPLOSION RISKS:
-1. **Non-linear Scaling**: Does cost grow faster than usage? (e.g., 10x users = 50x cost)
-2. **Hidden Op Fees**: Per-API-call, per-transaction fees that multiply at scale?
-3. **Discount Cliffs**: Does friendly SMB pricing vanish at enterprise tier?
-4. **Threshold Traps**: "Contact sales" at volumes reachable in 6-12 months?
-5. **Bandwidth/Storage**: Are overage fees disproportionately expensive?
-
-Example of REAL risk:
-- Auth0: $0.023/MAU looks cheap, but 1M users = $23k/month
-- Stripe: 2.9% is fine until high volume, then per-transaction adds up
-
-Format: If risk found:
-RISK: pricing_explosion
-SEVERITY: [high/medium/low]
-EVIDENCE: [specific pricing tier data]
-IMPACT: [cost projection at user's scale]
-
-If pricing is transparent and scales reasonably: NO_RISK"""
+Search Results: {formatted_results}"""
         
-        response = await self.openai.chat_completion(
-            messages=[
-                {"role": "system", "content": "You are a SaaS pricing analyst. Focus on hidden costs."},
-                {"role": "user", "content": analysis_prompt}
-            ],
-            temperature=0.2,
-            max_tokens=400
-        )
+        response = await self._stream_risk_response(self._build_messages(PRICING_SYSTEM, PRICING_RUBRIC, dynamic_prompt))
         
-        if "NO_RISK" not in response:
+        if not self._is_no_risk(response):
             risk = self._parse_risk_response(response, "pricing_explosion")
             if risk:
                 risks.append(risk)
         
         return risks
     
-    async def detect_acquisition_risks(self, vendor_name: str) -> List[Dict]:
+    async def detect_acquisition_risks(
+        self,
+        vendor_name: str,
+        results: Optional[List[Dict]] = None
+    ) -> List[Dict]:
         """
         Detect recent acquisition/merger risks.
         
@@ -145,37 +351,17 @@ If pricing is transparent and scales reasonably: NO_RISK"""
         risks = []
         
         search_query = f"{vendor_name} acquisition merger acquired bought {datetime.now().year}"
-        results = await self.clawhub.web_search(search_query, num_results=10)
+        if results is None:
+            results = await self.clawhub.web_search(search_query, num_results=10)
         
-        analysis_prompt = f"""Check acquisition status for: {vendor_name}
-
-Search Results: {self._format_results(results)}
-
-Detect ACQUISITION RISKS:
-1. **Recent Acquisition**: Was company acquired in last 12 months?
-2. **Integration Chaos**: Reports of service disruption, breaking changes?
-3. **Pricing Increases**: Sudden price hikes post-acquisition?
-4. **Feature Sunset**: Deprecated features, forced migrations?
-5. **Support Degradation**: Slower support, reduced documentation?
-
-Format: If risk found:
-RISK: acquisition_disruption
-SEVERITY: [high/medium/low]
-EVIDENCE: [who acquired, when, what changed]
-IMPACT: [how this affects current users]
+        formatted_results = self._format_results(results)
+        dynamic_prompt = f"""Vendor: {vendor_name}
 
-If no recent acquisition or stable integration: NO_RISK"""
+Search Results: {formatted_results}"""
         
-        response = await self.openai.chat_completion(
-            messages=[
-                {"role": "system", "content": "You are M&A analyst focusing on customer impact."},
-                {"role": "user", "content": analysis_prompt}
-            ],
-            temperature=0.2,
-            max_tokens=400
-        )
+        response = await self._stream_risk_response(self._build_messages(ACQUISITION_SYSTEM, ACQUISITION_RUBRIC, dynamic_prompt))
         
-        if "NO_RISK" not in response:
+        if not self._is_no_risk(response):
             risk = self._parse_risk_response(response, "acquisition")
             if risk:
                 risks.append(risk)
@@ -185,7 +371,8 @@ If no recent acquisition or stable integration: NO_RISK"""
     async def detect_compliance_drift_risks(
         self,
         vendor_name: str,
-        required_compliance: List[str]
+        required_compliance: List[str],
+        results: Optional[List[Dict]] = None
     ) -> List[Dict]:
         """
         Detect compliance certification expiry or loss.
@@ -203,37 +390,18 @@ If no recent acquisition or stable integration: NO_RISK"""
         
         compliance_str = ", ".join(required_compliance)
         search_query = f"{vendor_name} {compliance_str} certification audit status {datetime.now().year}"
-        results = await self.clawhub.web_search(search_query, num_results=10)
+        if results is None:
+            results = await self.clawhub.web_search(search_query, num_results=10)
         
-        analysis_prompt = f"""Check compliance status for: {vendor_name}
-
+        formatted_results = self._format_results(results)
+        dynamic_prompt = f"""Vendor: {vendor_name}
 Required Compliance: {compliance_str}
-Search Results: {self._format_results(results)}
-
-Detect COMPLIANCE RISKS:
-1. **Expired Certs**: Are certifications current or expired?
-2. **Failed Audits**: Any failed SOC 2, ISO, HIPAA audits?
-3. **Regional Issues**: Lost licenses in specific regions?
-4. **Pending Renewals**: Certifications up for renewal soon?
-
-Format: If risk found:
-RISK: compliance_drift
-SEVERITY: [high/medium/low]
-EVIDENCE: [which cert, status, date]
-IMPACT: [legal/regulatory implications]
 
-If all compliances current and valid: NO_RISK"""
+Search Results: {formatted_results}"""
         
-        response = await self.openai.chat_completion(
-            messages=[
-                {"role": "system", "content": "You are compliance auditor. Be precise with dates."},
-                {"role": "user", "content": analysis_prompt}
-            ],
-            temperature=0.2,
-            max_tokens=400
-        )
+        response = await self._stream_risk_response(self._build_messages(COMPLIANCE_SYSTEM, COMPLIANCE_RUBRIC, dynamic_prompt))
         
-        if "NO_RISK" not in response:
+        if not self._is_no_risk(response):
             risk = self._parse_risk_response(response, "compliance")
             if risk:
                 risks.append(risk)
@@ -243,7 +411,8 @@ If all compliances current and valid: NO_RISK"""
     async def detect_technology_deprecation_risks(
         self,
         vendor_name: str,
-        tech_stack: List[str]
+        tech_stack: List[str],
+        results: Optional[List[Dict]] = None
     ) -> List[Dict]:
         """
         Detect deprecated APIs or forced migrations.
@@ -258,37 +427,18 @@ If all compliances current and valid: NO_RISK"""
         
         tech_str = ", ".join(tech_stack[:3]) if tech_stack else ""
         search_query = f"{vendor_name} deprecated sunset breaking changes API {tech_str}"
-        results = await self.clawhub.web_search(search_query, num_results=10)
+        if results is None:
+            results = await self.clawhub.web_search(search_query, num_results=10)
         
-        analysis_prompt = f"""Check for deprecation risks: {vendor_name}
-
+        formatted_results = self._format_results(results)
+        dynamic_prompt = f"""Vendor: {vendor_name}
 Tech Stack: {tech_str}
-Search Results: {self._format_results(results)}
 
-Detect DEPRECATION RISKS:
-1. **API Sunsets**: Are current APIs being deprecated?
-2. **Forced Migration**: Mandatory version upgrades with breaking changes?
-3. **Short Timelines**: Less than 6 months to migrate?
-4. **SDK Abandonment**: Official SDKs no longer maintained?
-
-Format: If risk found:
-RISK: technology_deprecation
-SEVERITY: [high/medium/low]
-EVIDENCE: [what's deprecated, deadline]
-IMPACT: [migration effort required]
-
-If no imminent deprecations: NO_RISK"""
+Search Results: {formatted_results}"""
         
-        response = await self.openai.chat_completion(
-            messages=[
-                {"role": "system", "content": "You are technical migration analyst."},
-                {"role": "user", "content": analysis_prompt}
-            ],
-            temperature=0.2,
-            max_tokens=400
-        )
+        response = await self._stream_risk_response(self._build_messages(DEPRECATION_SYSTEM, DEPRECATION_RUBRIC, dynamic_prompt))
         
-        if "NO_RISK" not in response:
+        if not self._is_no_risk(response):
             risk = self._parse_risk_response(response, "deprecation")
             if risk:
                 risks.append(risk)
@@ -297,16 +447,75 @@ If no imminent deprecations: NO_RISK"""
     
     # Helper methods
     
+    def _build_messages(self, system: str, rubric: str, dynamic_prompt: str) -> List[Dict]:
+        """
+        Build a cache-friendly message list.
+        
+        Static system prompt and rubric come first so they form a stable
+        prefix across vendors; the vendor-specific data is appended last.
+        """
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": rubric},
+            {"role": "user", "content": dynamic_prompt}
+        ]
+    
+    async def _stream_risk_response(self, messages: List[Dict[str, str]]) -> str:
+        """
+        Stream a detector response, stopping as soon as it is usable.
+        
+        Generation is cut off once the model has answered NO_RISK or has
+        finished all four RISK/SEVERITY/EVIDENCE/IMPACT lines, so we do not
+        wait for (or pay for) trailing tokens the parser would ignore.
+        
+        Args:
+            messages: Chat messages from _build_messages
+        
+        Returns:
+            Response text received so far
+        """
+        text = ""
+        stream = self.openai.chat_completion_stream(
+            messages=messages,
+            temperature=0.2,
+            max_tokens=400
+        )
+        
+        try:
+            async for delta in stream:
+                text += delta
+                if text.lstrip().startswith("NO_RISK"):
+                    break
+                if "\n" in delta and self._has_all_risk_fields(text):
+                    break
+        finally:
+            await stream.aclose()
+        
+        return text
+    
+    @staticmethod
+    def _has_all_risk_fields(text: str) -> bool:
+        """True once every tagged field appears on a completed line."""
+        complete = text[:text.rfind("\n")]
+        return len({match.group(1) for match in PARSE_RE.finditer(complete)}) == len(KEY_TO_FIELD)
+    
     def _format_results(self, results: List[Dict]) -> str:
         """Format search results for AI analysis."""
-        return "\n\n".join([
-            f"- {r.get('title', 'N/A')}: {r.get('snippet', 'N/A')}"
+        return _format_results_tuple(tuple(
+            (r.get('title', 'N/A'), r.get('snippet', 'N/A'))
             for r in results[:8]
-        ])
+        ))
+    
+    @staticmethod
+    def _is_no_risk(response: str) -> bool:
+        """True if the model answered NO_RISK (on its own line)."""
+        return response.lstrip().startswith("NO_RISK") or "\nNO_RISK" in response
     
     def _parse_risk_response(self, response: str, risk_category: str) -> Optional[Dict]:
         """Parse AI response into structured risk."""
-        lines = response.strip().split('\n')
+        # Too short to hold a RISK line plus evidence
+        if len(response) < 30:
+            return None
         
         risk_data = {
             "category": risk_category,
@@ -317,19 +526,12 @@ If no imminent deprecations: NO_RISK"""
             "impact": ""
         }
         
-        for line in lines:
-            line = line.strip()
-            if line.startswith("RISK:"):
-                risk_data["type"] = line.replace("RISK:", "").strip()
-            elif line.startswith("SEVERITY:"):
-                risk_data["severity"] = line.replace("SEVERITY:", "").strip()
-            elif line.startswith("EVIDENCE:"):
-                risk_data["evidence"] = line.replace("EVIDENCE:", "").strip()
-            elif line.startswith("IMPACT:"):
-                risk_data["impact"] = line.replace("IMPACT:", "").strip()
-            elif not line.startswith(("RISK:", "SEVERITY:", "EVIDENCE:", "IMPACT:")):
-                # Accumulate description
-                risk_data["description"] += line + " "
+        for match in PARSE_RE.finditer(response):
+            risk_data[KEY_TO_FIELD[match.group(1)]] = match.group(2)
+        
+        # Whatever is left over is free-form description
+        remainder = PARSE_RE.sub('', response)
+        risk_data["description"] = " ".join(remainder.split())
         
         # Validate we got meaningful data
         if risk_data["type"] and (risk_data["evidence"] or risk_data["description"]):
@@ -8,13 +8,39 @@ Autonomously discovers 3-5 relevant vendor candidates based on:
 - Public data sources (web search, GitHub, G2, Stack Overflow)
 """
 
+import asyncio
+import json
 import logging
+import re
+from functools import lru_cache
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from config import config
 
 logger = logging.getLogger(__name__)
 
+# Models often wrap JSON in a Markdown code fence despite being asked not to
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S)
+
+# Separator between a vendor name and the rest of a page title,
+# e.g. "Stripe - Payment processing" or "Stripe | Pricing"
+_TITLE_SEPARATOR_RE = re.compile(r"\s+[-|:\u2013\u2014]\s+")
+
+DEFAULT_SOUL_CONTEXT = "You are a senior tech evaluator."
+SOUL_CONTEXT_MAX_CHARS = 3000  # Truncate for token limits
+MAX_PROMPT_RESULTS = 15  # Search results sent to the model for selection
+MAX_SNIPPET_CHARS = 240
+
+
+@lru_cache(maxsize=1)
+def _load_soul() -> str:
+    """Read SOUL.md once per process; falls back to a default persona."""
+    try:
+        with open("SOUL.md", "r") as f:
+            return f.read()
+    except FileNotFoundError:
+        return DEFAULT_SOUL_CONTEXT
+
 
 @dataclass
 class Candidate:
@@ -42,6 +68,15 @@ class CandidateIdentifier:
         self.clawhub = clawhub_client
         self.openai = openai_client
         self.max_candidates = config.agent.max_candidates
+        
+        # Cap concurrent outbound searches to stay under ClawHub rate limits
+        self._search_semaphore = asyncio.Semaphore(5)
+        
+        # Agent personality from SOUL.md, loaded once and kept as a stable
+        # system-message prefix so provider-side prompt caching can reuse it
+        self._soul_context = _load_soul()
+        self._soul_context_trunc = self._soul_context[:SOUL_CONTEXT_MAX_CHARS]
+        self._selection_rubric = self._build_selection_rubric()
     
     async def identify_candidates(
         self,
@@ -71,6 +106,7 @@ class CandidateIdentifier:
         
         # Step 2: Execute searches via ClawHub
         search_results = await self._execute_searches(search_queries)
+        search_results = self._rank_results(search_results, category, context)
         
         # Step 3: Use AI to select most relevant candidates
         candidates = await self._select_candidates(
@@ -134,31 +170,78 @@ class CandidateIdentifier:
     
     async def _execute_searches(self, queries: List[str]) -> List[Dict]:
         """
-        Execute web searches via ClawHub.
+        Execute web searches via ClawHub concurrently.
         
         Args:
             queries: List of search query strings
         
         Returns:
-            Combined search results
+            Combined search results, de-duplicated by URL (longest snippet wins)
         """
-        all_results = []
-        
-        for query in queries:
-            try:
-                results = await self.clawhub.web_search(
-                    query=query,
-                    num_results=5
-                )
-                all_results.extend(results)
-                logger.debug(f"Search '{query}' returned {len(results)} results")
-            except Exception as e:
-                logger.warning(f"Search failed for query '{query}': {str(e)}")
-                continue
+        results_per_query = await asyncio.gather(
+            *[self._bounded_search(query) for query in queries],
+            return_exceptions=True
+        )
+        
+        results_by_url: Dict[str, Dict] = {}
+        total = 0
         
-        logger.info(f"Total search results collected: {len(all_results)}")
+        for query, results in zip(queries, results_per_query):
+            if isinstance(results, Exception):
+                logger.warning(f"Search failed for query '{query}': {str(results)}")
+                continue
+            
+            logger.debug(f"Search '{query}' returned {len(results)} results")
+            total += len(results)
+            for result in results:
+                url = result.get("url", "")
+                existing = results_by_url.get(url)
+                if existing is None or len(result.get("snippet") or "") > len(existing.get("snippet") or ""):
+                    results_by_url[url] = result
+        
+        all_results = list(results_by_url.values())
+        logger.info(f"Total search results collected: {len(all_results)} unique of {total}")
         return all_results
     
+    def _rank_results(
+        self,
+        search_results: List[Dict],
+        category: str,
+        context: Dict[str, any]
+    ) -> List[Dict]:
+        """
+        Keep the most relevant results for the selection prompt.
+        
+        Results whose title mentions the category, or whose title/snippet
+        mentions the tech stack, are ranked first; ties keep search order.
+        
+        Args:
+            search_results: De-duplicated search results
+            category: Vendor category
+            context: Evaluation context
+        
+        Returns:
+            At most MAX_PROMPT_RESULTS results
+        """
+        category_lower = category.lower()
+        tech_terms = [t.lower() for t in context.get("tech_stack", [])]
+        
+        def relevance(result: Dict) -> int:
+            title = (result.get("title") or "").lower()
+            text = title + " " + (result.get("snippet") or "").lower()
+            score = 2 if category_lower in title else 0
+            if any(term in text for term in tech_terms):
+                score += 1
+            return score
+        
+        ranked = sorted(search_results, key=relevance, reverse=True)
+        return ranked[:MAX_PROMPT_RESULTS]
+    
+    async def _bounded_search(self, query: str) -> List[Dict]:
+        """Run a single search under the concurrency cap."""
+        async with self._search_semaphore:
+            return await self.clawhub.web_search(query=query, num_results=5)
+    
     async def _select_candidates(
         self,
         category: str,
@@ -176,51 +259,77 @@ class CandidateIdentifier:
         Returns:
             List of selected Candidate objects
         """
-        # Read SOUL.md to understand agent personality
-        try:
-            with open("SOUL.md", "r") as f:
-                soul_context = f.read()
-        except FileNotFoundError:
-            soul_context = "You are a senior tech evaluator."
-        
         # Build prompt for candidate selection
-        prompt = self._build_selection_prompt(
-            category,
-            context,
-            search_results,
-            soul_context
-        )
+        prompt = self._build_selection_prompt(category, context, search_results)
         
         # Get AI response
         response = await self.openai.chat_completion(
             messages=[
-                {"role": "system", "content": soul_context[:3000]},  # Truncate for token limits
+                {"role": "system", "content": self._soul_context_trunc},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.7
+            temperature=0.7,
+            response_format={"type": "json_object"}
         )
         
         # Parse AI response into Candidate objects
         candidates = self._parse_candidates_from_response(response)
+        if not candidates:
+            logger.warning("No candidates parsed from AI response; using top search results")
+            candidates = self._candidates_from_results(search_results)
         
         # Limit to max_candidates
         return candidates[:self.max_candidates]
     
+    def _build_selection_rubric(self) -> str:
+        """
+        Static instructions for candidate selection.
+        
+        Kept identical across requests and placed ahead of the per-request
+        data so it forms a cacheable prompt prefix.
+        """
+        return f"""Based on the search results at the end of this message, identify {self.max_candidates} most relevant vendor candidates for evaluation.
+
+YOUR TASK:
+1. Identify {self.max_candidates} diverse, relevant vendors (mix of established leaders, emerging alternatives, and region-specific options)
+2. For each candidate, provide:
+   - Name
+   - Brief description (one line)
+   - Website URL (if found)
+   - GitHub URL (if applicable)
+   - Rationale for inclusion (why relevant to this context)
+   - Discovery source (which search result led you to this candidate)
+
+OUTPUT FORMAT (JSON):
+{{
+  "candidates": [
+    {{
+      "name": "Vendor Name",
+      "description": "Brief description",
+      "website": "https://...",
+      "github_url": "https://github.com/...",
+      "rationale": "Why this vendor is relevant",
+      "discovery_source": "Search query or URL"
+    }}
+  ]
+}}
+
+Focus on candidates that match the context (tech stack, domain, region, scale, compliance).
+Include a mix of: established leaders, emerging alternatives, and any region-specific or open-source options."""
+    
     def _build_selection_prompt(
         self,
         category: str,
         context: Dict[str, any],
-        search_results: List[Dict],
-        soul_context: str
+        search_results: List[Dict]
     ) -> str:
         """Build prompt for AI candidate selection."""
-        # Format search results
-        results_text = "\n\n".join([
-            f"Source: {r.get('url', 'N/A')}\n"
-            f"Title: {r.get('title', 'N/A')}\n"
-            f"Snippet: {r.get('snippet', 'N/A')}"
-            for r in search_results[:30]  # Limit to 30 results for token economy
-        ])
+        # Format search results compactly; snippets are often long
+        results_text = "\n".join(
+            f"[{i}] {r.get('title', 'N/A')} - {(r.get('snippet') or 'N/A')[:MAX_SNIPPET_CHARS]}\n"
+            f"{r.get('url', 'N/A')}"
+            for i, r in enumerate(search_results[:MAX_PROMPT_RESULTS], 1)
+        )
         
         # Format context
         context_items = []
@@ -237,7 +346,7 @@ class CandidateIdentifier:
         
         context_text = "\n".join(context_items)
         
-        prompt = f"""Based on the following search results, identify {self.max_candidates} most relevant vendor candidates for evaluation.
+        prompt = f"""{self._selection_rubric}
 
 CATEGORY: {category}
 
@@ -246,33 +355,6 @@ CONTEXT:
 
 SEARCH RESULTS:
 {results_text}
-
-YOUR TASK:
-1. Identify {self.max_candidates} diverse, relevant vendors (mix of established leaders, emerging alternatives, and region-specific options)
-2. For each candidate, provide:
-   - Name
-   - Brief description (one line)
-   - Website URL (if found)
-   - GitHub URL (if applicable)
-   - Rationale for inclusion (why relevant to this context)
-   - Discovery source (which search result led you to this candidate)
-
-OUTPUT FORMAT (JSON):
-{{
-  "candidates": [
-    {{
-      "name": "Vendor Name",
-      "description": "Brief description",
-      "website": "https://...",
-      "github_url": "https://github.com/...",
-      "rationale": "Why this vendor is relevant",
-      "discovery_source": "Search query or URL"
-    }}
-  ]
-}}
-
-Focus on candidates that match the context (tech stack, domain, region, scale, compliance).
-Include a mix of: established leaders, emerging alternatives, and any region-specific or open-source options.
 """
         return prompt
     
@@ -286,51 +368,66 @@ Include a mix of: established leaders, emerging alternatives, and any region-spe
         Returns:
             List of Candidate objects
         """
-        import json
+        fenced = _FENCE_RE.search(response)
+        if fenced:
+            response = fenced.group(1)
         
         try:
             # Try to parse as JSON
             data = json.loads(response)
             candidates_data = data.get("candidates", [])
-            
-            candidates = []
-            for c in candidates_data:
-                candidate = Candidate(
-                    name=c.get("name", "Unknown"),
-                    category="",  # Will be set by caller
-                    description=c.get("description", ""),
-                    website=c.get("website"),
-                    github_url=c.get("github_url"),
-                    rationale=c.get("rationale", ""),
-                    discovery_source=c.get("discovery_source", "")
-                )
-                candidates.append(candidate)
-            
-            return candidates
-        
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, AttributeError):
+            # JSON mode only yields invalid output if the response was cut off
             logger.error("Failed to parse AI response as JSON")
-            # Fallback: extract vendor names from text
-            return self._fallback_parse(response)
+            return []
+        
+        if not isinstance(candidates_data, list):
+            logger.error("AI response has no candidate list")
+            return []
+        
+        return [
+            Candidate(
+                name=c.get("name", "Unknown"),
+                category="",  # Will be set by caller
+                description=c.get("description", ""),
+                website=c.get("website"),
+                github_url=c.get("github_url"),
+                rationale=c.get("rationale", ""),
+                discovery_source=c.get("discovery_source", "")
+            )
+            for c in candidates_data
+            if isinstance(c, dict)
+        ]
     
-    def _fallback_parse(self, response: str) -> List[Candidate]:
-        """Fallback parser if JSON parsing fails."""
-        # Simple extraction of vendor names
-        # This is a basic fallback - the actual implementation would be more robust
+    def _candidates_from_results(self, search_results: List[Dict]) -> List[Candidate]:
+        """
+        Fallback candidates taken from the ranked search results.
+        
+        Args:
+            search_results: Ranked search results
+        
+        Returns:
+            Up to max_candidates distinct vendors, named after their page titles
+        """
         candidates = []
-        lines = response.split("\n")
-        
-        for line in lines:
-            # Look for patterns like "1. Vendor Name" or "- Vendor Name"
-            if line.strip() and (line.strip()[0].isdigit() or line.strip().startswith("-")):
-                # Extract vendor name (very basic)
-                name = line.strip().lstrip("0123456789.-) ").split(":")[0].strip()
-                if name and len(name) > 2:
-                    candidates.append(Candidate(
-                        name=name,
-                        category="",
-                        description="",
-                        rationale="Extracted from AI response"
-                    ))
+        seen = set()
         
-        return candidates[:self.max_candidates]
+        for result in search_results:
+            title = (result.get("title") or "").strip()
+            name = _TITLE_SEPARATOR_RE.split(title, 1)[0].strip()
+            if len(name) < 2 or name.lower() in seen:
+                continue
+            seen.add(name.lower())
+            url = result.get("url")
+            candidates.append(Candidate(
+                name=name,
+                category="",  # Will be set by caller
+                description=result.get("snippet") or "",
+                website=url,
+                rationale="Top-ranked search result",
+                discovery_source=url or ""
+            ))
+            if len(candidates) >= self.max_candidates:
+                break
+        
+        return candidates
@@ -9,62 +9,280 @@ Performs deep investigation across multiple dimensions:
 - Hidden Risks: Maintainer health, pricing traps, lock-in, acquisition, compliance, deprecation
 """
 
+import hashlib
 import logging
 import asyncio
-from typing import List, Dict, Optional
+import re
+import time
+from typing import Any, FrozenSet, List, Dict, NamedTuple, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass, field
+from functools import wraps
 from datetime import datetime
 from agents.candidate_identifier import Candidate
 from agents.advanced_risk_detector import AdvancedRiskDetector
+from utils.llm_cache import LLMCache
+from utils.search_batcher import SearchBatcher
+from utils.analysis_batcher import AnalysisBatcher
+from utils import json_codec
+from utils.keyword_scan import scan_keywords
 from config import config
 
 logger = logging.getLogger(__name__)
 
+ANALYSIS_SYSTEM_PROMPT = "You are analyzing vendor research data. Be specific and evidence-based."
+# Shared by every analysis request rather than rebuilt per call
+_ANALYSIS_SYSTEM_MESSAGE = {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT}
 
-@dataclass
-class ResearchFindings:
-    """Research findings for a single vendor."""
-    vendor_name: str
+# Process-wide cache of dimension analyses. Keys are built from a normalized
+# prompt (case, whitespace and most punctuation folded), so exact repeats
+# and trivially re-worded duplicates share one entry. "+", "#" and "." are
+# kept so stacks like C/C++/C# or Node.js/Node js stay distinct.
+_analysis_cache = LLMCache(max_size=2048, ttl=6 * 3600.0)
+_WORD_RE = re.compile(r"\w+")
+_KEY_TOKEN_RE = re.compile(r"[\w+#.]+")
+
+# Input budget for search results in one analysis prompt. Tokens are
+# estimated at ~4 characters each for English text.
+RESULTS_TOKEN_BUDGET = 1500
+CHARS_PER_TOKEN = 4
+
+# Completion budget per analysis; batched calls get this much per task
+ANALYSIS_MAX_TOKENS = 200
+
+
+def _analysis_cache_key(prompt: str) -> str:
+    """Stable cache key for an analysis prompt."""
+    normalized = " ".join(_KEY_TOKEN_RE.findall(prompt.casefold()))
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+# Phrases in an analysis that flag a hidden risk
+LOCKIN_KEYWORDS = ("lock-in", "difficult to migrate")
+
+RISK_KEYWORDS = {
+    "vendor_lockin": LOCKIN_KEYWORDS,
+}
+
+# All risk keywords in one case-insensitive pattern; the named group of each
+# match tells which risk type it belongs to.
+_RISK_RE = re.compile(
+    "|".join(
+        f"(?P<{risk_type}>{'|'.join(map(re.escape, keywords))})"
+        for risk_type, keywords in RISK_KEYWORDS.items()
+    ),
+    re.I
+)
+
+
+def risk_signals(text: str) -> FrozenSet[str]:
+    """Risk types whose keywords appear in text, found in a single scan."""
+    return frozenset(match.lastgroup for match in _RISK_RE.finditer(text))
+
+
+def _finalize_findings(sdk_analyses: List[str], tech_stack: Sequence[str]) -> List[Dict[str, bool]]:
+    """Tech stack support maps for a batch of SDK analyses."""
+    return scan_keywords(sdk_analyses, tech_stack)
+
+
+def _freeze(value):
+    """Make list/dict arguments usable in a memo key."""
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    return value
+
+
+def _vendor_key(vendor_name: str, *args):
+    """Memo key for per-vendor research (case/whitespace-insensitive name)."""
+    return (" ".join(vendor_name.lower().split()),) + tuple(_freeze(a) for a in args)
+
+
+# First words of vendor names that identify a multi-product parent company
+PARENT_COMPANIES = {
+    "aws": "amazon", "amazon": "amazon",
+    "google": "google", "gcp": "google",
+    "microsoft": "microsoft", "azure": "microsoft",
+    "oracle": "oracle", "ibm": "ibm", "adobe": "adobe",
+    "atlassian": "atlassian", "salesforce": "salesforce", "cisco": "cisco"
+}
+
+
+def _parent_vendor_key(vendor_name: str, *args):
+    """
+    Memo key scoped to the parent company, e.g. "AWS Rekognition" and
+    "AWS Transcribe" share one key. Vendors without a known parent are keyed
+    by their full name. Only for company-level research.
+    """
+    parts = vendor_name.lower().split()
+    parent = PARENT_COMPANIES.get(parts[0]) if parts else None
+    if parent is None:
+        return _vendor_key(vendor_name, *args)
+    return (parent,) + tuple(_freeze(a) for a in args)
+
+
+def async_memoize(key=_vendor_key):
+    """
+    Memoize an async researcher method per instance.
+    
+    Results are stored as tasks in `self._memo` (a bounded TTL cache), so
+    concurrent callers with the same key await one shared call instead of
+    duplicating the work, and results are refreshed once they expire.
+    Failed or cancelled calls are retried by the next caller.
+    
+    Args:
+        key: Builds the memo key from the method's positional arguments
+    """
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(self, *args):
+            memo_key = (fn.__name__,) + key(*args)
+            task = await self._memo.get(memo_key)
+            
+            # A failed or cancelled call is replaced rather than re-awaited
+            if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+                task = asyncio.ensure_future(fn(self, *args))
+                await self._memo.set(memo_key, task)
+            
+            return await asyncio.shield(task)
+        
+        return wrapper
+    
+    return decorator
+
+
+# Per-researcher memo of dimension research; the researcher lives as long as
+# the orchestrator, so entries are bounded and expire like search results
+MEMO_MAX_SIZE = 512
+MEMO_TTL = 3600.0
+
+
+# Research dimensions, grouped technical / operational / business
+DIMENSIONS = (
+    "sdk_quality", "api_quality", "integration_complexity", "performance",
+    "uptime_reliability", "support_quality", "scalability",
+    "pricing", "vendor_health", "compliance"
+)
+
+
+class ResearchScope(NamedTuple):
+    """Evaluation context fields used by research, extracted once per request."""
+    tech_stack: Tuple[str, ...]
+    scale: str
+    compliance: Tuple[str, ...]
     
-    # Technical dimensions
-    sdk_quality: Dict[str, any] = field(default_factory=dict)
-    api_quality: Dict[str, any] = field(default_factory=dict)
-    integration_complexity: Dict[str, any] = field(default_factory=dict)
-    performance: Dict[str, any] = field(default_factory=dict)
+    @classmethod
+    def from_context(cls, context: Dict[str, Any]) -> "ResearchScope":
+        """Pull the research fields out of an evaluation context dict."""
+        return cls(
+            tuple(context.get("tech_stack") or ()),
+            context.get("scale") or "",
+            tuple(context.get("compliance") or ())
+        )
+
+
+class DimensionResult(NamedTuple):
+    """Result for one research dimension: analysis text plus optional extras."""
+    analysis: str
+    extra: Tuple[Tuple[str, Any], ...] = ()
     
-    # Operational dimensions
-    uptime_reliability: Dict[str, any] = field(default_factory=dict)
-    support_quality: Dict[str, any] = field(default_factory=dict)
-    scalability: Dict[str, any] = field(default_factory=dict)
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup ("analysis" or an extra field) for existing callers."""
+        if key == "analysis":
+            return self.analysis
+        for extra_key, value in self.extra:
+            if extra_key == key:
+                return value
+        return default
+
+
+def _dimension_property(name: str) -> property:
+    """DimensionResult view of one dimension, backed by analyses/details."""
+    def getter(self) -> DimensionResult:
+        return DimensionResult(self.analyses[name], tuple(self.details.get(name, {}).items()))
     
-    # Business dimensions
-    pricing: Dict[str, any] = field(default_factory=dict)
-    vendor_health: Dict[str, any] = field(default_factory=dict)
-    compliance: Dict[str, any] = field(default_factory=dict)
+    def setter(self, value: Union[DimensionResult, Dict[str, Any]]):
+        if isinstance(value, DimensionResult):
+            value = dict(value.extra, analysis=value.analysis)
+        else:
+            value = dict(value)
+        self.analyses[name] = value.pop("analysis", "")
+        if value:
+            self.details[name] = value
+        else:
+            self.details.pop(name, None)
+    
+    return property(getter, setter, doc=f"{name} findings")
+
+
+@dataclass(slots=True)
+class ResearchFindings:
+    """
+    Research findings for a single vendor.
+    
+    Analysis text for every dimension lives in one flat `analyses` dict;
+    the few dimensions with structured extras (GitHub URL, tech stack
+    support, required compliance) keep them in `details`. Attribute access
+    such as `findings.pricing` returns a DimensionResult, which supports
+    the same `.get("analysis")` lookups as the old dicts.
+    """
+    vendor_name: str
+    
+    # Dimension name -> analysis text
+    analyses: Dict[str, str] = field(default_factory=lambda: dict.fromkeys(DIMENSIONS, ""))
+    # Dimension name -> extra structured fields
+    details: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     
     # Hidden risks
     hidden_risks: List[Dict[str, str]] = field(default_factory=list)
     
     # Metadata
-    research_timestamp: datetime = field(default_factory=datetime.now)
+    research_timestamp_ns: int = field(default_factory=time.time_ns)
     evidence_sources: List[str] = field(default_factory=list)
+    
+    @property
+    def research_timestamp(self) -> datetime:
+        """Research time as a local datetime (converted on access)."""
+        return datetime.fromtimestamp(self.research_timestamp_ns / 1e9)
+
+
+for _name in DIMENSIONS:
+    setattr(ResearchFindings, _name, _dimension_property(_name))
+del _name
 
 
 class MultiCriteriaResearcher:
     """Conducts deep multi-dimensional research on vendor candidates."""
     
-    def __init__(self, clawhub_client, openai_client):
+    def __init__(
+        self,
+        clawhub_client,
+        openai_client,
+        research_timeout: Optional[float] = config.agent.research_timeout
+    ):
         """
         Initialize researcher.
         
         Args:
             clawhub_client: ClawHub integration for web search
             openai_client: OpenAI client for analysis
+            research_timeout: Seconds before one candidate's research is
+                abandoned; None waits indefinitely
         """
         self.clawhub = clawhub_client
         self.openai = openai_client
+        # Dimension searches from concurrent tasks are coalesced into batches
+        self._search_batcher = SearchBatcher(clawhub_client, num_results=5)
+        # Concurrent dimension analyses are coalesced into one completion
+        self._analysis_batcher = AnalysisBatcher(self._ai_analyze_batch)
+        # Bound outbound calls so large candidate lists don't trip rate limits
+        self._llm_sem = asyncio.Semaphore(config.agent.max_concurrent_llm)
+        self._search_sem = asyncio.Semaphore(config.agent.max_concurrent_search)
+        # Shared results of @async_memoize'd research methods
+        self._memo = LLMCache(max_size=MEMO_MAX_SIZE, ttl=MEMO_TTL)
         self.research_depth = config.agent.research_depth
         self.enable_hidden_risk_detection = config.agent.enable_hidden_risk_detection
+        self.research_timeout = research_timeout
         
         # Initialize advanced risk detector for bonus challenge
         self.risk_detector = AdvancedRiskDetector(clawhub_client, openai_client)
@@ -72,7 +290,7 @@ class MultiCriteriaResearcher:
     async def research_candidates(
         self,
         candidates: List[Candidate],
-        context: Dict[str, any]
+        context: Dict[str, Any]
     ) -> List[ResearchFindings]:
         """
         Research all candidates in parallel.
@@ -84,23 +302,44 @@ class MultiCriteriaResearcher:
         Returns:
             List of ResearchFindings for each candidate
         """
-        logger.info(f"Starting research on {len(candidates)} candidates")
-        
-        # Research candidates in parallel
-        research_tasks = [
-            self.research_single_candidate(candidate, context)
+        logger.info("Starting research on %d candidates", len(candidates))
+        scope = ResearchScope.from_context(context)
+        
+        # Research candidates in parallel; outbound calls are throttled by
+        # the LLM/search semaphores rather than by limiting fan-out here
+        results = await asyncio.gather(*[
+            asyncio.wait_for(
+                self._research_candidate(candidate, scope, context),
+                self.research_timeout
+            )
             for candidate in candidates
-        ]
-        
-        findings_list = await asyncio.gather(*research_tasks)
-        
-        logger.info(f"Research completed for {len(findings_list)} candidates")
+        ], return_exceptions=True)
+        
+        # A candidate that fails or times out is dropped rather than failing
+        # the whole evaluation
+        findings_list = []
+        errors = []
+        for candidate, result in zip(candidates, results):
+            if isinstance(result, Exception):
+                logger.warning("Research failed for %s: %r", candidate.name, result)
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                findings_list.append(result)
+        if errors and not findings_list:
+            raise errors[0]
+        
+        # Keyword scans run once over every candidate's analysis
+        self._apply_tech_stack_support(findings_list, scope.tech_stack)
+        
+        logger.info("Research completed for %d candidates", len(findings_list))
         return findings_list
     
     async def research_single_candidate(
         self,
         candidate: Candidate,
-        context: Dict[str, any]
+        context: Dict[str, Any]
     ) -> ResearchFindings:
         """
         Research a single candidate across all dimensions.
@@ -112,118 +351,136 @@ class MultiCriteriaResearcher:
         Returns:
             ResearchFindings for this candidate
         """
-        logger.info(f"Researching: {candidate.name}")
+        scope = ResearchScope.from_context(context)
+        findings = await self._research_candidate(candidate, scope, context)
+        self._apply_tech_stack_support([findings], scope.tech_stack)
+        return findings
+    
+    def _apply_tech_stack_support(
+        self,
+        findings_list: List[ResearchFindings],
+        tech_stack: Sequence[str]
+    ):
+        """Fill sdk_quality tech_stack_support for a batch of findings."""
+        support_maps = _finalize_findings(
+            [findings.analyses["sdk_quality"] for findings in findings_list],
+            tech_stack
+        )
+        for findings, support in zip(findings_list, support_maps):
+            findings.details.setdefault("sdk_quality", {})["tech_stack_support"] = support
+    
+    async def _research_candidate(
+        self,
+        candidate: Candidate,
+        scope: ResearchScope,
+        context: Dict[str, Any]
+    ) -> ResearchFindings:
+        """
+        Research one candidate; tech stack support is filled in by the caller.
+        
+        Dimension research takes its inputs from `scope`; the raw context is
+        only handed on to the advanced risk detector.
+        """
+        logger.info("Researching: %s", candidate.name)
         
         findings = ResearchFindings(vendor_name=candidate.name)
         
         # Execute research in parallel across dimensions
         research_tasks = [
-            self._research_technical_dimensions(candidate, context, findings),
-            self._research_operational_dimensions(candidate, context, findings),
-            self._research_business_dimensions(candidate, context, findings),
+            self._research_technical_dimensions(candidate, scope.tech_stack, findings),
+            self._research_operational_dimensions(candidate, scope.scale, findings),
+            self._research_business_dimensions(candidate, scope.compliance, findings),
         ]
         
         # Add hidden risk detection if enabled
         if self.enable_hidden_risk_detection:
             research_tasks.append(
-                self._detect_hidden_risks(candidate, context, findings)
+                self._detect_hidden_risks(candidate, scope, context, findings)
             )
         
         await asyncio.gather(*research_tasks)
         
-        logger.info(f"Research completed for {candidate.name}")
+        logger.info("Research completed for %s", candidate.name)
         return findings
     
     async def _research_technical_dimensions(
         self,
         candidate: Candidate,
-        context: Dict[str, any],
+        tech_stack: Tuple[str, ...],
         findings: ResearchFindings
     ):
         """Research technical aspects: SDK, API, integration, performance."""
         vendor_name = candidate.name
-        tech_stack = context.get("tech_stack", [])
         
         # SDK Quality Research
         if candidate.github_url:
-            findings.sdk_quality = await self._research_sdk_quality(
+            sdk_quality = self._research_sdk_quality(
                 candidate.github_url,
                 tech_stack
             )
         else:
-            # Search for GitHub repo
-            github_search = await self.clawhub.web_search(
-                f"{vendor_name} github repository",
-                num_results=3
-            )
-            findings.sdk_quality = await self._analyze_sdk_from_search(
-                github_search,
-                tech_stack
-            )
-        
-        # API Quality Research
-        findings.api_quality = await self._research_api_quality(
-            vendor_name,
-            candidate.website
+            sdk_quality = self._research_sdk_from_search(vendor_name, tech_stack)
+        
+        # Dimensions run concurrently so their searches and analyses are
+        # batched together
+        (
+            findings.sdk_quality,
+            findings.api_quality,
+            findings.integration_complexity,
+            findings.performance
+        ) = await asyncio.gather(
+            sdk_quality,
+            self._research_api_quality(vendor_name, candidate.website),
+            self._research_integration_complexity(vendor_name, tech_stack),
+            self._research_performance(vendor_name)
         )
-        
-        # Integration Complexity
-        findings.integration_complexity = await self._research_integration_complexity(
-            vendor_name,
-            tech_stack
-        )
-        
-        # Performance
-        findings.performance = await self._research_performance(vendor_name)
     
     async def _research_operational_dimensions(
         self,
         candidate: Candidate,
-        context: Dict[str, any],
+        scale: str,
         findings: ResearchFindings
     ):
         """Research operational aspects: uptime, support, scalability."""
         vendor_name = candidate.name
         
-        # Uptime/Reliability Research
-        findings.uptime_reliability = await self._research_uptime(vendor_name)
-        
-        # Support Quality
-        findings.support_quality = await self._research_support(vendor_name)
-        
-        # Scalability
-        scale = context.get("scale", "")
-        findings.scalability = await self._research_scalability(vendor_name, scale)
+        (
+            findings.uptime_reliability,
+            findings.support_quality,
+            findings.scalability
+        ) = await asyncio.gather(
+            self._research_uptime(vendor_name),
+            self._research_support(vendor_name),
+            self._research_scalability(vendor_name, scale)
+        )
     
     async def _research_business_dimensions(
         self,
         candidate: Candidate,
-        context: Dict[str, any],
+        compliance_reqs: Tuple[str, ...],
         findings: ResearchFindings
     ):
         """Research business aspects: pricing, vendor health, compliance."""
         vendor_name = candidate.name
         
-        # Pricing Research
-        findings.pricing = await self._research_pricing(
-            vendor_name,
-            candidate.website
-        )
-        
-        # Vendor Health
-        findings.vendor_health = await self._research_vendor_health(vendor_name)
-        
-        # Compliance
-        compliance_reqs = context.get("compliance", [])
-        findings.compliance = await self._research_compliance(
-            vendor_name,
-            compliance_reqs
+        (
+            findings.pricing,
+            findings.vendor_health,
+            findings.compliance
+        ) = await asyncio.gather(
+            self._research_pricing(vendor_name, candidate.website),
+            self._research_vendor_health(vendor_name),
+            self._research_compliance(vendor_name, compliance_reqs)
         )
     
     async def _detect_hidden_risks(
         self,
         candidate: Candidate,
-        con
+        scope: ResearchScope,
+        context: Dict[str, Any],
+        findings: ResearchFindings
+    ):
+        """
         Detect hidden risks using both basic and advanced detection.
         
         Detects 8 types of hidden risks for bonus challenge:
@@ -239,111 +496,100 @@ class MultiCriteriaResearcher:
         vendor_name = candidate.name
         risks = []
         
-        # Run all risk detection in parallel for speed
-        risk_tasks = []
-        
-        # 1. GitHub Maintainer Risk (Advanced)
-        if candidate.github_url:
-            risk_tasks.append(
-                self.risk_detector.detect_github_maintainer_risks(candidate.github_url)
-            )
-        
-        # 2. Pricing Explosion Risk (Advanced)
-        risk_tasks.append(
-            self.risk_detector.detect_scaling_pricing_risks(vendor_name, context)
-        )
-        
-        # 3. Acquisition Risk (Advanced)
-        risk_tasks.append(
-            self.risk_detector.detect_acquisition_risks(vendor_name)
-        )
-        
-        # 4. Compliance Drift Risk (Advanced)
-        compliance_reqs = context.get('compliance', [])
-        if compliance_reqs:
-            risk_tasks.append(
-                self.risk_detector.detect_compliance_drift_risks(vendor_name, compliance_reqs)
-            )
-        
-        # 5. Technology Deprecation Risk (Advanced)
-        tech_stack = context.get('tech_stack', [])
-        risk_tasks.append(
-            self.risk_detector.detect_technology_deprecation_risks(vendor_name, tech_stack)
-        )
-        
-        # 6. Basic Lock-in Risk (fallback)
-        risk_tasks.append(
-            self._detect_lockin_risk(vendor_name)
+        # Run all risk detection in parallel for speed. The advanced detector
+        # fans out its own checks (GitHub maintainer, pricing explosion,
+        # acquisition, compliance drift, deprecation) from one evidence search.
+        risk_results = await asyncio.gather(
+            self._safe_detect(
+                vendor_name,
+                self.risk_detector.detect_all_risks(
+                    vendor_name,
+                    candidate.github_url,
+                    context,
+                    scope.compliance,
+                    scope.tech_stack
+                )
+            ),
+            # Basic lock-in risk (fallback)
+            self._safe_detect(vendor_name, self._detect_lockin_risk(vendor_name))
         )
         
-        # Execute all risk detections in parallel
-        risk_results = await asyncio.gather(*risk_tasks, return_exceptions=True)
-        
-        # Flatten results and filter out exceptions/None
+        # Flatten results and filter out None
         for result in risk_results:
             if isinstance(result, list):
                 risks.extend(result)
-            elif isinstance(result, dict) and result:
+            elif result:
                 risks.append(result)
-            elif isinstance(result, Exception):
-                logger.warning(f"Risk detection failed: {result}")
         
-        logger.info(f"Detected {len(risks)} hidden risks for {vendor_name}")lockin_risk = await self._detect_lockin_risk(vendor_name)
-        if lockin_risk:
-            risks.append(lockin_risk)
+        logger.info("Detected %d hidden risks for %s", len(risks), vendor_name)
         
         findings.hidden_risks = risks
     
+    async def _safe_detect(self, vendor_name: str, detection):
+        """Await one risk detection, logging and skipping it on failure."""
+        try:
+            return await detection
+        except Exception as e:
+            logger.warning("Risk detection failed for %s: %s", vendor_name, e)
+            return None
+    
     # ==================== Individual Research Methods ====================
     
+    @async_memoize()
     async def _research_sdk_quality(
         self,
         github_url: str,
-        tech_stack: List[str]
-    ) -> Dict[str, any]:
+        tech_stack: Tuple[str, ...]
+    ) -> DimensionResult:
         """Research SDK quality from GitHub."""
         # Search for GitHub metrics
         search_query = f"{github_url} stars issues pull requests"
-        results = await self.clawhub.web_search(search_query, num_results=5)
+        results = await self._search(search_query)
         
         # Use AI to analyze results
         analysis = await self._ai_analyze(
             f"Analyze SDK quality for {github_url}",
-            f"Tech stack requirements: {tech_stack}",
+            f"Tech stack requirements: {', '.join(tech_stack)}",
             results
         )
         
-        return {
-            "github_url": github_url,
-            "analysis": analysis,
-            "tech_stack_support": self._check_tech_stack_support(analysis, tech_stack)
-        }
+        return DimensionResult(analysis, (("github_url", github_url),))
+    
+    async def _research_sdk_from_search(
+        self,
+        vendor_name: str,
+        tech_stack: Tuple[str, ...]
+    ) -> DimensionResult:
+        """Search for the vendor's GitHub repo and analyze its SDK."""
+        github_search = await self._search(
+            f"{vendor_name} github repository",
+            num_results=3
+        )
+        return await self._analyze_sdk_from_search(github_search, tech_stack)
     
     async def _analyze_sdk_from_search(
         self,
         search_results: List[Dict],
-        tech_stack: List[str]
-    ) -> Dict[str, any]:
+        tech_stack: Tuple[str, ...]
+    ) -> DimensionResult:
         """Analyze SDK when GitHub URL not directly available."""
         analysis = await self._ai_analyze(
             "Analyze SDK availability and quality",
-            f"Tech stack: {tech_stack}",
+            f"Tech stack: {', '.join(tech_stack)}",
             search_results
         )
         
-        return {
-            "analysis": analysis,
-            "tech_stack_support": self._check_tech_stack_support(analysis, tech_stack)
-        }
+        return DimensionResult(analysis)
     
+    @async_memoize()
     async def _research_api_quality(
         self,
         vendor_name: str,
         website: Optional[str]
-    ) -> Dict[str, any]:
+    ) -> DimensionResult:
         """Research API quality and documentation."""
         search_query = f"{vendor_name} API documentation quality review"
-        results = await self.clawhub.web_search(search_query, num_results=5)
+        results = await self._search(search_query)
         
         analysis = await self._ai_analyze(
             f"Analyze API quality for {vendor_name}",
@@ -351,30 +597,32 @@ class MultiCriteriaResearcher:
             results
         )
         
-        return {"analysis": analysis}
+        return DimensionResult(analysis)
     
+    @async_memoize()
     async def _research_integration_complexity(
         self,
         vendor_name: str,
-        tech_stack: List[str]
-    ) -> Dict[str, any]:
+        tech_stack: Tuple[str, ...]
+    ) -> DimensionResult:
         """Research integration complexity."""
         tech_str = " ".join(tech_stack[:2]) if tech_stack else ""
         search_query = f"{vendor_name} integration {tech_str} difficulty time"
-        results = await self.clawhub.web_search(search_query, num_results=5)
+        results = await self._search(search_query)
         
         analysis = await self._ai_analyze(
             f"Analyze integration complexity for {vendor_name}",
-            f"Tech stack: {tech_stack}",
+            f"Tech stack: {', '.join(tech_stack)}",
             results
         )
         
-        return {"analysis": analysis}
+        return DimensionResult(analysis)
     
-    async def _research_performance(self, vendor_name: str) -> Dict[str, any]:
+    @async_memoize()
+    async def _research_performance(self, vendor_name: str) -> DimensionResult:
         """Research performance benchmarks."""
         search_query = f"{vendor_name} performance benchmark latency throughput"
-        results = await self.clawhub.web_search(search_query, num_results=5)
+        results = await self._search(search_query)
         
         analysis = await self._ai_analyze(
             f"Analyze performance for {vendor_name}",
@@ -382,12 +630,13 @@ class MultiCriteriaResearcher:
             results
         )
         
-        return {"analysis": analysis}
+        return DimensionResult(analysis)
     
-    async def _research_uptime(self, vendor_name: str) -> Dict[str, any]:
+    @async_memoize()
+    async def _research_uptime(self, vendor_name: str) -> DimensionResult:
         """Research uptime and reliability history."""
         search_query = f"{vendor_name} status page uptime history incidents outages"
-        results = await self.clawhub.web_search(search_query, num_results=5)
+        results = await self._search(search_query)
         
         analysis = await self._ai_analyze(
             f"Analyze uptime history for {vendor_name}",
@@ -395,12 +644,13 @@ class MultiCriteriaResearcher:
             results
         )
         
-        return {"analysis": analysis}
+        return DimensionResult(analysis)
     
-    async def _research_support(self, vendor_name: str) -> Dict[str, any]:
+    @async_memoize()
+    async def _research_support(self, vendor_name: str) -> DimensionResult:
         """Research support quality."""
         search_query = f"{vendor_name} customer support quality response time reviews"
-        results = await self.clawhub.web_search(search_query, num_results=5)
+        results = await self._search(search_query)
         
         analysis = await self._ai_analyze(
             f"Analyze support quality for {vendor_name}",
@@ -408,16 +658,17 @@ class MultiCriteriaResearcher:
             results
         )
         
-        return {"analysis": analysis}
+        return DimensionResult(analysis)
     
+    @async_memoize()
     async def _research_scalability(
         self,
         vendor_name: str,
         scale: str
-    ) -> Dict[str, any]:
+    ) -> DimensionResult:
         """Research scalability limits and performance at scale."""
         search_query = f"{vendor_name} scalability limits {scale} enterprise"
-        results = await self.clawhub.web_search(search_query, num_results=5)
+        results = await self._search(search_query)
         
         analysis = await self._ai_analyze(
             f"Analyze scalability for {vendor_name}",
@@ -425,16 +676,17 @@ class MultiCriteriaResearcher:
             results
         )
         
-        return {"analysis": analysis}
+        return DimensionResult(analysis)
     
+    @async_memoize()
     async def _research_pricing(
         self,
         vendor_name: str,
         website: Optional[str]
-    ) -> Dict[str, any]:
+    ) -> DimensionResult:
         """Research pricing structure and hidden costs."""
         search_query = f"{vendor_name} pricing costs tiers hidden fees"
-        results = await self.clawhub.web_search(search_query, num_results=5)
+        results = await self._search(search_query)
         
         analysis = await self._ai_analyze(
             f"Analyze pricing for {vendor_name}",
@@ -442,12 +694,13 @@ class MultiCriteriaResearcher:
             results
         )
         
-        return {"analysis": analysis}
+        return DimensionResult(analysis)
     
-    async def _research_vendor_health(self, vendor_name: str) -> Dict[str, any]:
+    @async_memoize(key=_parent_vendor_key)
+    async def _research_vendor_health(self, vendor_name: str) -> DimensionResult:
         """Research vendor financial health and stability."""
         search_query = f"{vendor_name} company funding employees growth news"
-        results = await self.clawhub.web_search(search_query, num_results=5)
+        results = await self._search(search_query)
         
         analysis = await self._ai_analyze(
             f"Analyze vendor health for {vendor_name}",
@@ -455,78 +708,33 @@ class MultiCriteriaResearcher:
             results
         )
         
-        return {"analysis": analysis}
+        return DimensionResult(analysis)
     
+    @async_memoize()
     async def _research_compliance(
         self,
         vendor_name: str,
-        compliance_reqs: List[str]
-    ) -> Dict[str, any]:
+        compliance_reqs: Tuple[str, ...]
+    ) -> DimensionResult:
         """Research compliance certifications."""
         comp_str = " ".join(compliance_reqs) if compliance_reqs else "compliance"
         search_query = f"{vendor_name} {comp_str} certification audit"
-        results = await self.clawhub.web_search(search_query, num_results=5)
+        results = await self._search(search_query)
         
         analysis = await self._ai_analyze(
             f"Analyze compliance for {vendor_name}",
-            f"Required: {compliance_reqs}",
+            f"Required: {', '.join(compliance_reqs)}",
             results
         )
         
-        return {
-            "analysis": analysis,
-            "required": compliance_reqs
-        }
+        return DimensionResult(analysis, (("required", compliance_reqs),))
     
     # ==================== Hidden Risk Detection ====================
     
-    async def _detect_maintainer_risk(self, github_url: str) -> Optional[Dict[str, str]]:
-        """Detect maintainer churn or bus factor risk."""
-        search_query = f"{github_url} contributors commits activity maintainers"
-        results = await self.clawhub.web_search(search_query, num_results=5)
-        
-        analysis = await self._ai_analyze(
-            "Detect maintainer risks",
-            "Look for: contributor churn, single maintainer, decreased activity",
-            results
-        )
-        
-        # Check if risk detected
-        if "risk" in analysis.lower() or "concern" in analysis.lower():
-            return {
-                "type": "maintainer_health",
-                "severity": "medium",
-                "description": analysis,
-                "evidence": github_url
-            }
-        
-        return None
-    
-    async def _detect_pricing_traps(
-        self,
-        vendor_name: str,
-        pricing_info: Dict[str, any]
-    ) -> Optional[Dict[str, str]]:
-        """Detect pricing traps (sudden jumps at scale)."""
-        analysis = pricing_info.get("analysis", "")
-        
-        # Look for keywords indicating pricing traps
-        trap_keywords = ["sudden", "jump", "expensive at scale", "hidden fee", "surprise"]
-        
-        if any(keyword in analysis.lower() for keyword in trap_keywords):
-            return {
-                "type": "pricing_trap",
-                "severity": "medium",
-                "description": f"Potential pricing trap detected for {vendor_name}",
-                "evidence": analysis[:200]
-            }
-        
-        return None
-    
     async def _detect_lockin_risk(self, vendor_name: str) -> Optional[Dict[str, str]]:
         """Detect vendor lock-in risks."""
         search_query = f"{vendor_name} migration export data portability lock-in"
-        results = await self.clawhub.web_search(search_query, num_results=5)
+        results = await self._search(search_query)
         
         analysis = await self._ai_analyze(
             f"Assess lock-in risk for {vendor_name}",
@@ -534,7 +742,7 @@ class MultiCriteriaResearcher:
             results
         )
         
-        if "lock-in" in analysis.lower() or "difficult to migrate" in analysis.lower():
+        if "vendor_lockin" in risk_signals(analysis):
             return {
                 "type": "vendor_lockin",
                 "severity": "low",
@@ -546,20 +754,76 @@ class MultiCriteriaResearcher:
     
     # ==================== Helper Methods ====================
     
+    async def _search(self, query: str, num_results: Optional[int] = None) -> List[Dict]:
+        """
+        Web search through the batcher, bounded by the search semaphore.
+        
+        Results are cached (in memory, and on disk when enabled) by the ClawHub client.
+        """
+        async with self._search_sem:
+            return await self._search_batcher.submit(query, num_results)
+    
     async def _ai_analyze(
         self,
         task: str,
         context: str,
         search_results: List[Dict]
     ) -> str:
-        """Use AI to analyze search results."""
-        # Format search results
-        results_text = "\n\n".join([
-            f"Source: {r.get('title', 'N/A')}\n{r.get('snippet', 'N/A')}"
-            for r in search_results[:10]
-        ])
+        """Use AI to analyze search results (batched with concurrent analyses)."""
+        return await self._analysis_batcher.submit((task, context, search_results))
+    
+    async def _ai_analyze_batch(
+        self,
+        tasks: List[Tuple[str, str, List[Dict]]]
+    ) -> List[str]:
+        """
+        Analyze several (task, context, search_results) tuples together.
+        
+        Cached analyses are served directly. A single remaining task uses a
+        plain completion; several go out as one JSON-mode completion, and
+        any task missing from its answer (or every task, if that call fails)
+        falls back to its own call.
         
-        prompt = f"""Task: {task}
+        Args:
+            tasks: Analysis tasks in submission order
+        
+        Returns:
+            One analysis per task, in the same order; a task whose own call
+            failed gets the exception instead, so only its caller sees it
+        """
+        prompts = [
+            self._build_analysis_prompt(task, context, self._pack_results(search_results))
+            for task, context, search_results in tasks
+        ]
+        cache_keys = [_analysis_cache_key(prompt) for prompt in prompts]
+        analyses: List[Optional[str]] = [await _analysis_cache.get(key) for key in cache_keys]
+        missing = [i for i, analysis in enumerate(analyses) if analysis is None]
+        
+        if len(missing) > 1:
+            try:
+                batched = await self._complete_analysis_batch([prompts[i] for i in missing])
+            except Exception as e:
+                logger.warning("Batched analysis failed, falling back to single calls: %s", e)
+            else:
+                for i, analysis in zip(missing, batched):
+                    analyses[i] = analysis
+                missing = [i for i in missing if analyses[i] is None]
+        
+        if missing:
+            singles = await asyncio.gather(*[
+                self._complete_analysis(prompts[i]) for i in missing
+            ], return_exceptions=True)
+            for i, analysis in zip(missing, singles):
+                analyses[i] = analysis
+        
+        for key, analysis in zip(cache_keys, analyses):
+            if isinstance(analysis, str):
+                await _analysis_cache.set(key, analysis)
+        return analyses
+    
+    def _build_analysis_prompt(self, task: str, context: str, results_text: str) -> str:
+        """Prompt for one analysis task."""
+        return f"""Task: {task}
 
 Context: {context}
 
@@ -568,29 +832,93 @@ Search Results:
 
 Provide a concise analysis (2-3 sentences) with specific evidence. If data is insufficient, state that clearly.
 """
+    
+    async def _complete_analysis(self, prompt: str) -> str:
+        """Run one analysis prompt."""
+        async with self._llm_sem:
+            return await self.openai.chat_completion(
+                messages=[_ANALYSIS_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+                temperature=0.3,
+                max_tokens=ANALYSIS_MAX_TOKENS
+            )
+    
+    async def _complete_analysis_batch(self, prompts: List[str]) -> List[Optional[str]]:
+        """
+        Run several analysis prompts in one JSON-mode completion.
         
-        response = await self.openai.chat_completion(
-            messages=[
-                {"role": "system", "content": "You are analyzing vendor research data. Be specific and evidence-based."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            max_tokens=200
+        Returns:
+            One analysis per prompt; None where the response has no usable entry
+        """
+        tasks_text = "\n\n".join(
+            f"=== TASK {idx} ===\n{prompt}" for idx, prompt in enumerate(prompts)
         )
+        prompt = f"""Complete each of the {len(prompts)} analysis tasks below independently.
+
+Respond with a JSON object of the form:
+{{"analyses": [{{"idx": 0, "analysis": "..."}}, ...]}}
+with exactly one entry per task, where "analysis" is the plain-text answer to that task.
+
+{tasks_text}"""
+        
+        async with self._llm_sem:
+            response = await self.openai.chat_completion(
+                messages=[_ANALYSIS_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+                temperature=0.3,
+                max_tokens=ANALYSIS_MAX_TOKENS * len(prompts),
+                response_format={"type": "json_object"}
+            )
         
-        return response
+        analyses: List[Optional[str]] = [None] * len(prompts)
+        try:
+            entries = json_codec.loads(response).get("analyses", [])
+        except (ValueError, AttributeError):
+            logger.warning("Batched analysis response was not valid JSON")
+            return analyses
+        
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            idx = entry.get("idx")
+            analysis = entry.get("analysis")
+            if isinstance(idx, int) and 0 <= idx < len(prompts) and isinstance(analysis, str) and analysis:
+                analyses[idx] = analysis
+        return analyses
     
-    def _check_tech_stack_support(
+    def _pack_results(
         self,
-        analysis: str,
-        tech_stack: List[str]
-    ) -> Dict[str, bool]:
-        """Check which tech stack items are supported."""
-        support_map = {}
-        
-        for tech in tech_stack:
-            # Simple keyword matching
-            supported = tech.lower() in analysis.lower()
-            support_map[tech] = supported
-        
-        return support_map
+        search_results: List[Dict],
+        token_budget: int = RESULTS_TOKEN_BUDGET
+    ) -> str:
+        """
+        Format search results for a prompt within a token budget.
+        
+        Results whose snippet repeats an earlier one (ignoring case,
+        punctuation and spacing) are skipped, and packing stops once the
+        estimated token budget is used up.
+        
+        Args:
+            search_results: Raw search results
+            token_budget: Approximate maximum tokens for the formatted text
+        
+        Returns:
+            Formatted results text
+        """
+        char_budget = token_budget * CHARS_PER_TOKEN
+        seen = set()
+        blocks = []
+        used = 0
+        
+        for r in search_results[:10]:
+            snippet = r.get('snippet') or 'N/A'
+            fingerprint = " ".join(_WORD_RE.findall(snippet.casefold()))
+            if fingerprint in seen:
+                continue
+            seen.add(fingerprint)
+            
+            block = f"Source: {r.get('title', 'N/A')}\n{snippet}"
+            if blocks and used + len(block) > char_budget:
+                break
+            blocks.append(block[:char_budget])
+            used += len(block) + 2
+        
+        return "\n\n".join(blocks)
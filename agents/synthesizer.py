@@ -10,27 +10,123 @@ Shows:
 - Alternative suggestions for different contexts
 """
 
+import asyncio
+import hashlib
+import heapq
+import io
 import logging
-from typing import List, Dict, Optional
+import re
+import sys
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter, mul
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from agents.researcher import ResearchFindings
+from agents.candidate_identifier import _load_soul
+from agents.researcher import DIMENSIONS, ResearchFindings
 from agents.weight_adjuster import CriterionWeight, WeightAdjustment
+from utils.keyword_scan import scan_keywords
+from utils.llm_cache import LLMCache
 
 logger = logging.getLogger(__name__)
 
+SOUL_CONTEXT_MAX_CHARS = 2000  # Truncate for token limits
 
-@dataclass
+# Process-wide cache of recommendation texts. The prompt is built only from
+# the evaluation inputs (context, scores, discoveries, risks), so a repeat
+# evaluation with the same outcome reuses the earlier recommendation.
+_recommendation_cache = LLMCache(max_size=256, ttl=24 * 3600.0)
+
+# Completion budget for one recommendation
+RECOMMENDATION_MAX_TOKENS = 2000
+
+# Indicator words for scoring an analysis
+POSITIVE_WORDS = ("excellent", "great", "strong", "robust", "high quality", "reliable", "fast", "comprehensive")
+NEGATIVE_WORDS = ("poor", "weak", "limited", "slow", "unreliable", "lacking", "difficult", "complex", "expensive")
+SCORING_WORDS = POSITIVE_WORDS + NEGATIVE_WORDS
+
+
+def _score_counts(positive_count: int, negative_count: int) -> float:
+    """Score (1-10) for a given number of positive and negative indicators."""
+    if positive_count > negative_count:
+        score = 7.0 + min(positive_count, 3) * 1.0
+    elif negative_count > positive_count:
+        score = 5.0 - min(negative_count, 4) * 1.0
+    else:
+        score = 6.0
+    return max(1.0, min(10.0, score))
+
+
+# Every possible (positive, negative) count pair is precomputed, so scoring
+# an analysis is a table lookup instead of branching per call
+SCORE_TABLE = tuple(
+    tuple(_score_counts(p, n) for n in range(len(SCORING_WORDS) + 1))
+    for p in range(len(SCORING_WORDS) + 1)
+)
+
+# Scoring at least this many vendors runs on a worker thread so the event
+# loop keeps serving other evaluations; fewer are scored inline
+SCORING_OFFLOAD_MIN_VENDORS = 20
+
+# Criteria whose analysis excerpts are kept as evidence on each VendorScore
+EVIDENCE_CRITERIA = ("sdk_quality", "api_quality", "uptime_reliability", "pricing")
+EVIDENCE_MAX_CHARS = 150
+
+# Criteria where negative indicators (e.g. "complex", "expensive") mean a better score
+INVERSE_CRITERIA = frozenset({"integration_complexity", "pricing"})
+
+# Section headers of the recommendation response, optionally wrapped in
+# Markdown bold/heading markers ("**RATIONALE:**", "## Next Steps:")
+_SECTION_HEADER = r"^[ \t#*]*(RECOMMENDED VENDOR|RATIONALE|TRADE[- ]?OFFS?|ALTERNATIVES?|NEXT STEPS)[ \t*]*:[ \t*]*"
+_SECTION_RE = re.compile(
+    _SECTION_HEADER + r"(.*?)(?=" + _SECTION_HEADER + r"|\Z)",
+    re.M | re.S | re.I
+)
+# One header line of a streamed response; group 2 is any text after it
+_HEADER_LINE_RE = re.compile(_SECTION_HEADER + r"(.*)$", re.I)
+# Bulleted or numbered list items within a section. Numbered markers need
+# trailing whitespace so body lines such as "3.5% fee on..." are not items.
+_BULLET_RE = re.compile(r"^[ \t]*(?:[-*•][ \t]*|\d+[.)][ \t]+)(.+?)[ \t]*$", re.M)
+
+
+@lru_cache(maxsize=64)
+def display_name(name: str) -> str:
+    """Human-readable form of a criterion or risk type, e.g. 'vendor_health' -> 'Vendor Health'."""
+    return name.replace("_", " ").title()
+
+
+@lru_cache(maxsize=16)
+def _matrix_templates(num_vendors: int) -> Tuple[str, str, str]:
+    """Separator, criterion-row and total-row format strings for a comparison matrix."""
+    separator = "|---|" + "---|" * num_vendors
+    row_template = "| {} ({:.1f}%) | " + " | ".join(["{:.1f}/10"] * num_vendors) + " |"
+    total_template = "| **Weighted Score** | " + " | ".join(["**{:.1f}/10**"] * num_vendors) + " |"
+    return separator, row_template, total_template
+
+
+# Column of each criterion in VendorScore.scores
+_CRITERIA_INDEX = {criterion: i for i, criterion in enumerate(DIMENSIONS)}
+# (criterion, column) for each evidence criterion
+_EVIDENCE_COLUMNS = tuple((criterion, _CRITERIA_INDEX[criterion]) for criterion in EVIDENCE_CRITERIA)
+
+
+@dataclass(slots=True)
 class VendorScore:
     """Score for a single vendor."""
     vendor_name: str
-    criterion_scores: Dict[str, float]  # criterion -> score (0-10)
+    scores: List[float]  # score (0-10) per criterion, in DIMENSIONS order
     weighted_score: float
     strengths: List[str]
     weaknesses: List[str]
     evidence: Dict[str, str]  # criterion -> evidence
+    
+    @property
+    def criterion_scores(self) -> Dict[str, float]:
+        """Scores keyed by criterion name."""
+        return dict(zip(DIMENSIONS, self.scores))
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalRecommendation:
     """Final recommendation output."""
     recommended_vendor: str
@@ -50,6 +146,47 @@ class FinalRecommendation:
     hidden_risks: List[Dict[str, any]]
 
 
+class RecommendationStreamParser:
+    """
+    Incremental section parser for a streamed recommendation.
+    
+    Chunks are buffered into complete lines; each line yields events as soon
+    as it is known: ("vendor", name) once for the recommended vendor and
+    ("rationale_chunk", text) for every rationale line.
+    """
+    
+    def __init__(self):
+        self._buffer = ""
+        self._section: Optional[str] = None
+        self.vendor = ""
+    
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        """Consume a chunk and return events for the lines it completed."""
+        *lines, self._buffer = (self._buffer + chunk).split("\n")
+        return [event for line in lines for event in self._parse_line(line)]
+    
+    def close(self) -> List[Tuple[str, str]]:
+        """Flush the final, unterminated line."""
+        line, self._buffer = self._buffer, ""
+        return self._parse_line(line)
+    
+    def _parse_line(self, line: str) -> List[Tuple[str, str]]:
+        header = _HEADER_LINE_RE.match(line)
+        if header:
+            self._section = header.group(1).upper()
+            line = header.group(2)
+        
+        text = line.strip(" \t*")
+        if not text:
+            return []
+        if self._section == "RECOMMENDED VENDOR" and not self.vendor:
+            self.vendor = text
+            return [("vendor", text)]
+        if self._section == "RATIONALE":
+            return [("rationale_chunk", text)]
+        return []
+
+
 class RecommendationSynthesizer:
     """Synthesizes final recommendation from all research and analysis."""
     
@@ -61,6 +198,10 @@ class RecommendationSynthesizer:
             openai_client: OpenAI client for generating recommendations
         """
         self.openai = openai_client
+        
+        # Agent personality from SOUL.md; the file is read once per process
+        # and truncated once here rather than on every recommendation
+        self._soul_context = _load_soul()[:SOUL_CONTEXT_MAX_CHARS]
     
     async def synthesize_recommendation(
         self,
@@ -69,7 +210,9 @@ class RecommendationSynthesizer:
         research_findings: List[ResearchFindings],
         initial_weights: Dict[str, CriterionWeight],
         final_weights: Dict[str, CriterionWeight],
-        weight_adjustments: List[WeightAdjustment]
+        weight_adjustments: List[WeightAdjustment],
+        on_vendor: Optional[Callable[[str], Awaitable[None]]] = None,
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None
     ) -> FinalRecommendation:
         """
         Synthesize final recommendation from all data.
@@ -81,6 +224,10 @@ class RecommendationSynthesizer:
             initial_weights: Initial criterion weights
             final_weights: Final adjusted weights
             weight_adjustments: List of weight adjustments made
+            on_vendor: Optional coroutine called with the recommended vendor
+                as soon as it appears in the streamed response
+            on_chunk: Optional coroutine called with each piece of the
+                recommendation text as it streams in
         
         Returns:
             FinalRecommendation object
@@ -110,7 +257,9 @@ class RecommendationSynthesizer:
             context,
             vendor_scores,
             key_discoveries,
-            hidden_risks
+            hidden_risks,
+            on_vendor,
+            on_chunk
         )
         
         # Step 6: Parse recommendation into structured format
@@ -145,60 +294,119 @@ class RecommendationSynthesizer:
         Returns:
             List of VendorScore objects
         """
-        vendor_scores = []
-        
-        for findings in research_findings:
-            # Extract scores for each criterion
-            criterion_scores = {
-                "sdk_quality": self._score_from_analysis(findings.sdk_quality.get("analysis", "")),
-                "api_quality": self._score_from_analysis(findings.api_quality.get("analysis", "")),
-                "integration_complexity": self._score_from_analysis(findings.integration_complexity.get("analysis", ""), inverse=True),
-                "performance": self._score_from_analysis(findings.performance.get("analysis", "")),
-                "uptime_reliability": self._score_from_analysis(findings.uptime_reliability.get("analysis", "")),
-                "support_quality": self._score_from_analysis(findings.support_quality.get("analysis", "")),
-                "scalability": self._score_from_analysis(findings.scalability.get("analysis", "")),
-                "pricing": self._score_from_analysis(findings.pricing.get("analysis", ""), inverse=True),
-                "vendor_health": self._score_from_analysis(findings.vendor_health.get("analysis", "")),
-                "compliance": self._score_from_analysis(findings.compliance.get("analysis", ""))
-            }
-            
-            # Calculate weighted score
-            weighted_score = sum(
-                criterion_scores[criterion] * (weights[criterion].current_weight / 100.0)
-                for criterion in criterion_scores
-                if criterion in weights
-            )
-            
-            # Extract strengths and weaknesses
-            strengths, weaknesses = self._extract_strengths_weaknesses(
+        if len(research_findings) >= SCORING_OFFLOAD_MIN_VENDORS:
+            return await asyncio.to_thread(self._score_vendors_sync, research_findings, weights)
+        return self._score_vendors_sync(research_findings, weights)
+    
+    def _score_vendors_sync(
+        self,
+        research_findings: List[ResearchFindings],
+        weights: Dict[str, CriterionWeight]
+    ) -> List[VendorScore]:
+        """Score and rank all vendors (pure CPU work, safe to run off the event loop)."""
+        # Indicator words for every vendor and criterion, found in one scan
+        analyses = [
+            vendor_analyses[criterion]
+            for vendor_analyses in self._dedupe_analyses(research_findings)
+            for criterion in DIMENSIONS
+        ]
+        hits = scan_keywords(analyses, SCORING_WORDS)
+        inverse_flags = [criterion in INVERSE_CRITERIA for criterion in DIMENSIONS]
+        
+        # Weight vector in DIMENSIONS order, built once for all vendors
+        weight_vector = [
+            weights[criterion].current_weight / 100.0 if criterion in weights else 0.0
+            for criterion in DIMENSIONS
+        ]
+        
+        num_criteria = len(DIMENSIONS)
+        vendor_scores = [
+            self._score_one_vendor(
                 findings,
-                criterion_scores
-            )
-            
-            # Collect evidence
-            evidence = {
-                "sdk_quality": findings.sdk_quality.get("analysis", "")[:150],
-                "api_quality": findings.api_quality.get("analysis", "")[:150],
-                "uptime_reliability": findings.uptime_reliability.get("analysis", "")[:150],
-                "pricing": findings.pricing.get("analysis", "")[:150],
-            }
-            
-            vendor_score = VendorScore(
-                vendor_name=findings.vendor_name,
-                criterion_scores=criterion_scores,
-                weighted_score=weighted_score,
-                strengths=strengths,
-                weaknesses=weaknesses,
-                evidence=evidence
+                analyses[i * num_criteria:(i + 1) * num_criteria],
+                hits[i * num_criteria:(i + 1) * num_criteria],
+                inverse_flags,
+                weight_vector
             )
-            
-            vendor_scores.append(vendor_score)
+            for i, findings in enumerate(research_findings)
+        ]
         
         # Sort by weighted score (descending)
         vendor_scores.sort(key=lambda x: x.weighted_score, reverse=True)
         
         return vendor_scores
     
+    @staticmethod
+    def _dedupe_analyses(research_findings: List[ResearchFindings]) -> List[Dict[str, str]]:
+        """
+        Copies of each vendor's analyses that share identical strings.
+        
+        Vendors often get the same templated analysis (e.g. "No data
+        available"); keeping one copy of each blob and interning the criterion
+        keys cuts peak memory during large batch synthesis. The findings
+        themselves are left untouched, since the event loop may be reading
+        them while scoring runs on a worker thread.
+        """
+        dedup: Dict[str, str] = {}
+        return [
+            {
+                sys.intern(criterion): dedup.setdefault(text, text)
+                for criterion, text in findings.analyses.items()
+            }
+            for findings in research_findings
+        ]
+    
+    def _score_one_vendor(
+        self,
+        findings: ResearchFindings,
+        analyses: List[str],
+        hits: List[Dict[str, bool]],
+        inverse_flags: List[bool],
+        weight_vector: List[float]
+    ) -> VendorScore:
+        """
+        Score one vendor from its scanned analyses.
+        
+        Args:
+            findings: Research findings for the vendor
+            analyses: The vendor's analyses in DIMENSIONS order
+            hits: Indicator-word hits for each analysis
+            inverse_flags: Whether each criterion is inverse-scored
+            weight_vector: Criterion weights (fractions) in DIMENSIONS order
+        
+        Returns:
+            VendorScore for this vendor
+        """
+        # Score row for this vendor, one entry per criterion
+        row = [
+            self._score_from_hits(analysis, analysis_hits, inverse)
+            for analysis, analysis_hits, inverse in zip(analyses, hits, inverse_flags)
+        ]
+        # Calculate weighted score
+        weighted_score = sum(map(mul, row, weight_vector))
+        
+        # Extract strengths and weaknesses
+        strengths, weaknesses = self._extract_strengths_weaknesses(
+            findings,
+            list(zip(DIMENSIONS, row))
+        )
+        
+        # Collect evidence from the analyses already gathered for scoring,
+        # indexed by column (short analyses are shared rather than copied)
+        evidence = {
+            criterion: analyses[col][:EVIDENCE_MAX_CHARS]
+            for criterion, col in _EVIDENCE_COLUMNS
+        }
+        
+        return VendorScore(
+            vendor_name=findings.vendor_name,
+            scores=row,
+            weighted_score=weighted_score,
+            strengths=strengths,
+            weaknesses=weaknesses,
+            evidence=evidence
+        )
+    
     def _score_from_analysis(self, analysis: str, inverse: bool = False) -> float:
         """
         Extract a score (0-10) from analysis text.
@@ -213,65 +421,71 @@ class RecommendationSynthesizer:
         if not analysis:
             return 5.0  # Neutral score if no data
         
-        analysis_lower = analysis.lower()
-        
-        # Positive indicators
-        positive_words = ["excellent", "great", "strong", "robust", "high quality", "reliable", "fast", "comprehensive"]
-        negative_words = ["poor", "weak", "limited", "slow", "unreliable", "lacking", "difficult", "complex", "expensive"]
+        return self._score_from_hits(analysis, scan_keywords([analysis], SCORING_WORDS)[0], inverse)
+    
+    def _score_from_hits(self, analysis: str, hits: Dict[str, bool], inverse: bool = False) -> float:
+        """
+        Score an analysis from its precomputed indicator-word hits.
         
-        positive_count = sum(1 for word in positive_words if word in analysis_lower)
-        negative_count = sum(1 for word in negative_words if word in analysis_lower)
+        Args:
+            analysis: Analysis text
+            hits: {word: found} map over SCORING_WORDS for this analysis
+            inverse: If True, negative indicators increase score
         
-        if inverse:
-            positive_count, negative_count = negative_count, positive_count
+        Returns:
+            Score from 0-10
+        """
+        if not analysis:
+            return 5.0  # Neutral score if no data
         
-        # Base score calculation
-        if positive_count > negative_count:
-            score = 7.0 + min(positive_count, 3) * 1.0
-        elif negative_count > positive_count:
-            score = 5.0 - min(negative_count, 4) * 1.0
-        else:
-            score = 6.0
+        positive_count = sum(hits[word] for word in POSITIVE_WORDS)
+        negative_count = sum(hits[word] for word in NEGATIVE_WORDS)
         
-        return max(1.0, min(10.0, score))
+        if inverse:
+            return SCORE_TABLE[negative_count][positive_count]
+        return SCORE_TABLE[positive_count][negative_count]
     
     def _extract_strengths_weaknesses(
         self,
         findings: ResearchFindings,
-        scores: Dict[str, float]
+        scores: List[Tuple[str, float]]
     ) -> tuple:
-        """Extract top strengths and weaknesses."""
-        # Sort criteria by score
-        sorted_criteria = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        """Extract top strengths and weaknesses from (criterion, score) pairs."""
+        # Only the top and bottom 3 criteria are needed, not a full sort.
+        # Scanning in reverse for the bottom 3 (then flipping) picks the same
+        # tied criteria, in the same order, as the tail of a stable
+        # descending sort.
+        top_criteria = heapq.nlargest(3, scores, key=itemgetter(1))
+        bottom_criteria = heapq.nsmallest(3, reversed(scores), key=itemgetter(1))[::-1]
         
         # Top 3 as strengths (if score >= 7)
         strengths = [
             self._format_strength(criterion, score)
-            for criterion, score in sorted_criteria[:3]
+            for criterion, score in top_criteria
             if score >= 7.0
         ]
         
         # Bottom 3 as weaknesses (if score <= 5)
         weaknesses = [
             self._format_weakness(criterion, score)
-            for criterion, score in sorted_criteria[-3:]
+            for criterion, score in bottom_criteria
             if score <= 5.0
         ]
         
         # Add hidden risks as weaknesses
         for risk in findings.hidden_risks:
-            weaknesses.append(f"{risk['type'].replace('_', ' ').title()}: {risk['description'][:80]}")
+            weaknesses.append(f"{display_name(risk['type'])}: {risk['description'][:80]}")
         
         return strengths[:3], weaknesses[:3]
     
     def _format_strength(self, criterion: str, score: float) -> str:
         """Format a strength description."""
-        criterion_display = criterion.replace("_", " ").title()
+        criterion_display = display_name(criterion)
         return f"Strong {criterion_display} (Score: {score:.1f}/10)"
     
     def _format_weakness(self, criterion: str, score: float) -> str:
         """Format a weakness description."""
-        criterion_display = criterion.replace("_", " ").title()
+        criterion_display = display_name(criterion)
         return f"Weaker {criterion_display} (Score: {score:.1f}/10)"
     
     def _extract_key_discoveries(
@@ -285,7 +499,7 @@ class RecommendationSynthesizer:
             discovery = {
                 "finding": adj.discovery,
                 "evidence": adj.evidence[:150],
-                "impact": f"Increased {adj.criterion.replace('_', ' ').title()} weight from {adj.weight_before:.1f}% to {adj.weight_after:.1f}%",
+                "impact": f"Increased {display_name(adj.criterion)} weight from {adj.weight_before:.1f}% to {adj.weight_after:.1f}%",
                 "triggered": ", ".join(adj.additional_research_triggered) if adj.additional_research_triggered else "None"
             }
             discoveries.append(discovery)
@@ -296,16 +510,11 @@ class RecommendationSynthesizer:
         self,
         research_findings: List[ResearchFindings]
     ) -> List[Dict[str, any]]:
-        """Collect all hidden risks found."""
-        all_risks = []
-        
-        for findings in research_findings:
-            for risk in findings.hidden_risks:
-                risk_with_vendor = risk.copy()
-                risk_with_vendor["vendor"] = findings.vendor_name
-                all_risks.append(risk_with_vendor)
-        
-        return all_risks
+        """Collect all hidden risks found, each tagged with its vendor."""
+        return list(chain.from_iterable(
+            ({**risk, "vendor": findings.vendor_name} for risk in findings.hidden_risks)
+            for findings in research_findings
+        ))
     
     def _generate_comparison_matrix(
         self,
@@ -320,30 +529,26 @@ class RecommendationSynthesizer:
             reverse=True
         )
         
+        # Row layout is fixed by the vendor count, so each row is one format call
+        separator, row_template, total_template = _matrix_templates(len(vendor_scores))
+        
         # Build table
-        lines = []
-        lines.append("| Criterion (Weight) | " + " | ".join([v.vendor_name for v in vendor_scores]) + " |")
-        lines.append("|" + "---|" * (len(vendor_scores) + 1))
+        lines = ["| Criterion (Weight) | " + " | ".join([v.vendor_name for v in vendor_scores]) + " |", separator]
         
         for criterion, weight_obj in sorted_weights[:8]:  # Top 8 criteria
             if weight_obj.current_weight < 1.0:
                 continue
             
-            criterion_display = criterion.replace("_", " ").title()
-            row = f"| {criterion_display} ({weight_obj.current_weight:.1f}%) | "
-            
-            scores = [
-                f"{v.criterion_scores.get(criterion, 0):.1f}/10"
-                for v in vendor_scores
-            ]
-            row += " | ".join(scores) + " |"
-            lines.append(row)
+            col = _CRITERIA_INDEX.get(criterion)
+            lines.append(row_template.format(
+                display_name(criterion),
+                weight_obj.current_weight,
+                *[0 if col is None else v.scores[col] for v in vendor_scores]
+            ))
         
         # Add weighted total
-        lines.append("|---|" + "---|" * len(vendor_scores))
-        total_row = "| **Weighted Score** | "
-        total_row += " | ".join([f"**{v.weighted_score:.1f}/10**" for v in vendor_scores]) + " |"
-        lines.append(total_row)
+        lines.append(separator)
+        lines.append(total_template.format(*[v.weighted_score for v in vendor_scores]))
         
         return "\n".join(lines)
     
@@ -352,16 +557,43 @@ class RecommendationSynthesizer:
         context: Dict[str, any],
         vendor_scores: List[VendorScore],
         key_discoveries: List[Dict[str, str]],
-        hidden_risks: List[Dict[str, any]]
+        hidden_risks: List[Dict[str, any]],
+        on_vendor: Optional[Callable[[str], Awaitable[None]]] = None,
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None
     ) -> str:
-        """Use AI to generate final recommendation text."""
-        # Read SOUL.md for context
-        try:
-            with open("SOUL.md", "r") as f:
-                soul_context = f.read()
-        except FileNotFoundError:
-            soul_context = "You are a senior tech evaluator providing vendor recommendations."
+        """Use AI to generate final recommendation text (streamed)."""
+        parts = []
+        async for kind, text in self._generate_recommendation_stream(
+            context,
+            vendor_scores,
+            key_discoveries,
+            hidden_risks
+        ):
+            if kind == "chunk":
+                parts.append(text)
+                if on_chunk:
+                    await on_chunk(text)
+            elif kind == "vendor":
+                logger.info(f"Recommended vendor (streaming): {text}")
+                if on_vendor:
+                    await on_vendor(text)
+        
+        return "".join(parts)
+    
+    async def _generate_recommendation_stream(
+        self,
+        context: Dict[str, any],
+        vendor_scores: List[VendorScore],
+        key_discoveries: List[Dict[str, str]],
+        hidden_risks: List[Dict[str, any]]
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Stream the recommendation as parsed events.
         
+        Yields ("chunk", text) for every piece of raw response text, plus the
+        RecommendationStreamParser events as their lines complete. A cached
+        recommendation is replayed as a single chunk.
+        """
         # Build prompt
         prompt = self._build_recommendation_prompt(
             context,
@@ -369,18 +601,38 @@ class RecommendationSynthesizer:
             key_discoveries,
             hidden_risks
         )
+        parser = RecommendationStreamParser()
         
-        # Get AI recommendation
-        response = await self.openai.chat_completion(
+        cache_key = self._recommendation_cache_key(prompt)
+        cached = await _recommendation_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Recommendation cache hit")
+            yield ("chunk", cached)
+            for event in parser.feed(cached) + parser.close():
+                yield event
+            return
+        
+        parts = []
+        async for chunk in self.openai.chat_completion_stream(
             messages=[
-                {"role": "system", "content": soul_context[:2000]},
+                {"role": "system", "content": self._soul_context},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.7,
-            max_tokens=2000
-        )
-        
-        return response
+            max_tokens=RECOMMENDATION_MAX_TOKENS
+        ):
+            parts.append(chunk)
+            yield ("chunk", chunk)
+            for event in parser.feed(chunk):
+                yield event
+        
+        for event in parser.close():
+            yield event
+        await _recommendation_cache.set(cache_key, "".join(parts))
+    
+    def _recommendation_cache_key(self, prompt: str) -> str:
+        """Cache key for a recommendation prompt under the current system prompt."""
+        return hashlib.blake2b(f"{self._soul_context}\0{prompt}".encode(), digest_size=16).hexdigest()
     
     def _build_recommendation_prompt(
         self,
@@ -476,8 +728,6 @@ Be specific, evidence-based, and context-aware. Show how the discoveries influen
         hidden_risks: List[Dict[str, any]]
     ) -> FinalRecommendation:
         """Parse AI recommendation text into structured format."""
-        lines = recommendation_text.split("\n")
-        
         # Extract sections
         recommended_vendor = ""
         rationale = ""
@@ -485,33 +735,25 @@ Be specific, evidence-based, and context-aware. Show how the discoveries influen
         alternatives = []
         next_steps = []
         
-        current_section = None
-        
-        for line in lines:
-            line = line.strip()
+        for match in _SECTION_RE.finditer(recommendation_text):
+            header = match.group(1).upper()
+            body = match.group(2)
             
-            if "RECOMMENDED VENDOR:" in line.upper():
-                recommended_vendor = line.split(":", 1)[1].strip()
-                current_section = None
-            elif "RATIONALE:" in line.upper():
-                current_section = "rationale"
-            elif "TRADE-OFFS:" in line.upper() or "TRADE-OFF:" in line.upper():
-                current_section = "tradeoffs"
-            elif "ALTERNATIVES:" in line.upper() or "ALTERNATIVE:" in line.upper():
-                current_section = "alternatives"
-            elif "NEXT STEPS:" in line.upper():
-                current_section = "nextsteps"
-            elif line:
-                if current_section == "rationale":
-                    rationale += line + " "
-                elif current_section == "tradeoffs" and line.startswith("-"):
-                    trade_offs.append(line.lstrip("- "))
-                elif current_section == "alternatives" and line.startswith("-"):
-                    # Parse "If X: Consider Y because Z"
-                    alt_text = line.lstrip("- ")
-                    alternatives.append({"text": alt_text})
-                elif current_section == "nextsteps" and (line.startswith("-") or line[0].isdigit()):
-                    next_steps.append(line.lstrip("0123456789.-) "))
+            if header == "RECOMMENDED VENDOR":
+                # Vendor name is the first non-empty line after the header
+                recommended_vendor = next(
+                    (line.strip(" \t*") for line in body.splitlines() if line.strip(" \t*")),
+                    ""
+                )
+            elif header == "RATIONALE":
+                rationale += " ".join(body.split()) + " "
+            elif header.startswith("TRADE"):
+                trade_offs.extend(_BULLET_RE.findall(body))
+            elif header.startswith("ALTERNATIVE"):
+                # Each item reads "If X: Consider Y because Z"
+                alternatives.extend({"text": alt_text} for alt_text in _BULLET_RE.findall(body))
+            else:
+                next_steps.extend(_BULLET_RE.findall(body))
         
         # If parsing failed, use top-scored vendor
         if not recommended_vendor and vendor_scores:
@@ -561,61 +803,71 @@ Be specific, evidence-based, and context-aware. Show how the discoveries influen
     
     def format_as_markdown(self, recommendation: FinalRecommendation) -> str:
         """Format recommendation as markdown for display."""
-        md = []
-        
-        md.append(f"# Vendor Evaluation Report")
-        md.append(f"\n## Context\n{recommendation.context_summary}")
-        md.append(f"\n## Candidates Evaluated\n" + ", ".join(recommendation.candidates))
-        
-        # Key discoveries
-        md.append(f"\n## Key Discoveries That Shaped This Evaluation")
-        for i, discovery in enumerate(recommendation.key_discoveries, 1):
-            md.append(f"\n### Discovery {i}: {discovery['finding']}")
-            md.append(f"**Evidence**: {discovery['evidence']}")
-            md.append(f"**Impact**: {discovery['impact']}")
-            if discovery['triggered'] != "None":
-                md.append(f"**Triggered**: {discovery['triggered']}")
-        
-        # Weight adjustments
-        if recommendation.weight_adjustments:
-            md.append(f"\n## Criteria Weight Adjustments")
-            md.append("| Criterion | Initial | Final | Change | Reason |")
-            md.append("|-----------|---------|-------|--------|--------|")
-            for adj in recommendation.weight_adjustments:
-                change = f"+{adj.weight_after - adj.weight_before:.1f}%"
-                criterion_display = adj.criterion.replace("_", " ").title()
-                md.append(f"| {criterion_display} | {adj.weight_before:.1f}% | {adj.weight_after:.1f}% | {change} | {adj.discovery[:40]}... |")
-        
-        # Comparison matrix
-        md.append(f"\n## Comparison Matrix")
-        md.append(recommendation.comparison_matrix)
-        
-        # Recommendation
-        md.append(f"\n## Recommendation")
-        md.append(f"\n### Recommended: **{recommendation.recommended_vendor}**")
-        md.append(f"\n**Why:**\n{recommendation.rationale}")
-        
-        if recommendation.trade_offs:
-            md.append(f"\n**Trade-offs:**")
-            for tradeoff in recommendation.trade_offs:
-                md.append(f"- ❌ {tradeoff}")
-        
-        if recommendation.alternatives:
-            md.append(f"\n**Alternatives:**")
-            for alt in recommendation.alternatives:
-                md.append(f"- {alt['text']}")
-        
-        # Hidden risks
-        if recommendation.hidden_risks:
-            md.append(f"\n## Hidden Risks Detected")
-            for risk in recommendation.hidden_risks:
-                severity_emoji = "🚨" if risk['severity'] == "high" else "⚠️"
-                md.append(f"\n{severity_emoji} **{risk['vendor']}**: {risk['description'][:100]}")
-        
-        # Next steps
-        if recommendation.next_steps:
-            md.append(f"\n## Next Steps")
-            for i, step in enumerate(recommendation.next_steps, 1):
-                md.append(f"{i}. {step}")
-        
-        return "\n".join(md)
+        return format_as_markdown(recommendation)
+
+
+def format_as_markdown(recommendation: FinalRecommendation) -> str:
+    """Format recommendation as markdown for display."""
+    md = io.StringIO()
+    write = md.write
+    
+    write("# Vendor Evaluation Report")
+    write("\n\n## Context\n")
+    write(recommendation.context_summary)
+    write("\n\n## Candidates Evaluated\n")
+    write(", ".join(recommendation.candidates))
+    
+    # Key discoveries
+    write("\n\n## Key Discoveries That Shaped This Evaluation")
+    for i, discovery in enumerate(recommendation.key_discoveries, 1):
+        write(f"\n\n### Discovery {i}: {discovery['finding']}")
+        write(f"\n**Evidence**: {discovery['evidence']}")
+        write(f"\n**Impact**: {discovery['impact']}")
+        if discovery['triggered'] != "None":
+            write(f"\n**Triggered**: {discovery['triggered']}")
+    
+    # Weight adjustments
+    if recommendation.weight_adjustments:
+        write("\n\n## Criteria Weight Adjustments")
+        write("\n| Criterion | Initial | Final | Change | Reason |")
+        write("\n|-----------|---------|-------|--------|--------|")
+        for adj in recommendation.weight_adjustments:
+            write(
+                f"\n| {display_name(adj.criterion)} | {adj.weight_before:.1f}% | {adj.weight_after:.1f}% "
+                f"| +{adj.weight_after - adj.weight_before:.1f}% | {adj.discovery[:40]}... |"
+            )
+    
+    # Comparison matrix
+    write("\n\n## Comparison Matrix\n")
+    write(recommendation.comparison_matrix)
+    
+    # Recommendation
+    write("\n\n## Recommendation")
+    write(f"\n\n### Recommended: **{recommendation.recommended_vendor}**")
+    write("\n\n**Why:**\n")
+    write(recommendation.rationale)
+    
+    if recommendation.trade_offs:
+        write("\n\n**Trade-offs:**")
+        for tradeoff in recommendation.trade_offs:
+            write(f"\n- ❌ {tradeoff}")
+    
+    if recommendation.alternatives:
+        write("\n\n**Alternatives:**")
+        for alt in recommendation.alternatives:
+            write(f"\n- {alt['text']}")
+    
+    # Hidden risks
+    if recommendation.hidden_risks:
+        write("\n\n## Hidden Risks Detected")
+        for risk in recommendation.hidden_risks:
+            severity_emoji = "🚨" if risk['severity'] == "high" else "⚠️"
+            write(f"\n\n{severity_emoji} **{risk['vendor']}**: {risk['description'][:100]}")
+    
+    # Next steps
+    if recommendation.next_steps:
+        write("\n\n## Next Steps")
+        for i, step in enumerate(recommendation.next_steps, 1):
+            write(f"\n{i}. {step}")
+    
+    return md.getvalue()
@@ -13,15 +13,34 @@ Examples:
 """
 
 import logging
-from typing import List, Dict, Tuple, Optional
+import re
+from functools import lru_cache
+from operator import attrgetter
+from typing import FrozenSet, List, Dict, Tuple, Optional
 from dataclasses import dataclass, field
 from agents.researcher import ResearchFindings
 from config import config
 
 logger = logging.getLogger(__name__)
 
+# Phrases in an analysis that signal a problem worth reweighting for
+UPTIME_ISSUE_KEYWORDS = ("outage", "downtime", "incident", "unavailable")
+PRICING_ISSUE_KEYWORDS = ("expensive", "jump", "hidden fee", "trap")
+COMPLIANCE_ISSUE_KEYWORDS = ("not certified", "lacking", "missing")
 
-@dataclass
+
+def _keyword_pattern(keywords: Tuple[str, ...]) -> "re.Pattern":
+    """One case-insensitive pattern matching any of the keywords."""
+    return re.compile("|".join(map(re.escape, keywords)), re.I)
+
+
+# Compiled once; each check is a single scan with no lower-cased copy
+_UPTIME_ISSUE_RE = _keyword_pattern(UPTIME_ISSUE_KEYWORDS)
+_PRICING_ISSUE_RE = _keyword_pattern(PRICING_ISSUE_KEYWORDS)
+_COMPLIANCE_ISSUE_RE = _keyword_pattern(COMPLIANCE_ISSUE_KEYWORDS)
+
+
+@dataclass(slots=True)
 class CriterionWeight:
     """Represents a single evaluation criterion with its weight."""
     name: str
@@ -31,7 +50,7 @@ class CriterionWeight:
     triggered_by: List[str] = field(default_factory=list)  # Which discoveries triggered adjustments
 
 
-@dataclass
+@dataclass(slots=True)
 class WeightAdjustment:
     """Represents a single weight adjustment event."""
     criterion: str
@@ -41,6 +60,72 @@ class WeightAdjustment:
     weight_after: float
     additional_research_triggered: List[str] = field(default_factory=list)
 
+# Weight change (percentage points) per discovery type
+ADJUSTMENT_BY_TYPE = {
+    "uptime_issue": 10.0,  # Increase uptime weight by 10%
+    "missing_sdk": 8.0,     # Increase integration complexity by 8%
+    "pricing_concern": 7.0, # Increase pricing weight by 7%
+    "compliance_gap": 12.0, # Increase compliance weight by 12%
+    "hidden_risk_maintainer_health": 5.0,  # Increase vendor health by 5%
+    "hidden_risk_pricing_trap": 8.0,       # Increase pricing by 8%
+    "hidden_risk_vendor_lockin": 4.0       # Moderate concern
+}
+DEFAULT_ADJUSTMENT = 5.0
+
+# Criterion each hidden risk type reweights
+RISK_TO_CRITERION = {
+    "maintainer_health": "vendor_health",
+    "pricing_trap": "pricing",
+    "vendor_lockin": "integration_complexity"
+}
+
+_current_weight = attrgetter("current_weight")
+
+
+@lru_cache(maxsize=None)
+def _initial_weight_table(has_compliance: bool, security_focus: bool) -> Tuple[Tuple[str, float], ...]:
+    """
+    Initial (criterion, weight) pairs for a context signature.
+    
+    The weights depend only on whether compliance requirements exist and
+    whether the evaluation is security-focused, so there are just four
+    distinct tables; each is computed once.
+    """
+    # Default weights (balanced)
+    default_weights = {
+        "sdk_quality": 15.0,
+        "api_quality": 10.0,
+        "integration_complexity": 15.0,
+        "performance": 10.0,
+        "uptime_reliability": 15.0,
+        "support_quality": 10.0,
+        "scalability": 10.0,
+        "pricing": 10.0,
+        "vendor_health": 5.0,
+        "compliance": 0.0  # Will be adjusted if compliance requirements exist
+    }
+    
+    # If compliance requirements exist, allocate weight
+    if has_compliance:
+        default_weights["compliance"] = 15.0
+        # Reduce other weights proportionally
+        total_other = sum(v for k, v in default_weights.items() if k != "compliance")
+        factor = (100 - default_weights["compliance"]) / total_other
+        for key in default_weights:
+            if key != "compliance":
+                default_weights[key] *= factor
+    
+    # Adjust based on stated priorities
+    if security_focus:
+        default_weights["compliance"] += 5.0
+        default_weights["uptime_reliability"] += 5.0
+        default_weights["vendor_health"] += 3.0
+        # Normalize
+        total = sum(default_weights.values())
+        default_weights = {k: (v / total) * 100 for k, v in default_weights.items()}
+    
+    return tuple(default_weights.items())
+
 
 class DynamicWeightAdjuster:
     """Dynamically adjusts evaluation criteria weights based on research discoveries."""
@@ -65,52 +150,24 @@ class DynamicWeightAdjuster:
         Returns:
             Dictionary of criterion name -> CriterionWeight
         """
-        # Default weights (balanced)
-        default_weights = {
-            "sdk_quality": 15.0,
-            "api_quality": 10.0,
-            "integration_complexity": 15.0,
-            "performance": 10.0,
-            "uptime_reliability": 15.0,
-            "support_quality": 10.0,
-            "scalability": 10.0,
-            "pricing": 10.0,
-            "vendor_health": 5.0,
-            "compliance": 0.0  # Will be adjusted if compliance requirements exist
-        }
-        
         # Adjust initial weights based on context
         priorities = context.get("priorities", [])
         compliance_reqs = context.get("compliance", [])
         domain = context.get("domain", "")
         
-        # If compliance requirements exist, allocate weight
-        if compliance_reqs:
-            default_weights["compliance"] = 15.0
-            # Reduce other weights proportionally
-            total_other = sum(v for k, v in default_weights.items() if k != "compliance")
-            factor = (100 - default_weights["compliance"]) / total_other
-            for key in default_weights:
-                if key != "compliance":
-                    default_weights[key] *= factor
-        
-        # Adjust based on stated priorities
-        if "security" in str(priorities).lower() or "fintech" in domain.lower():
-            default_weights["compliance"] += 5.0
-            default_weights["uptime_reliability"] += 5.0
-            default_weights["vendor_health"] += 3.0
-            # Normalize
-            total = sum(default_weights.values())
-            default_weights = {k: (v / total) * 100 for k, v in default_weights.items()}
-        
-        # Convert to CriterionWeight objects
+        weight_table = _initial_weight_table(
+            bool(compliance_reqs),
+            "security" in str(priorities).lower() or "fintech" in domain.lower()
+        )
+        
+        # Convert to CriterionWeight objects (fresh per call; callers mutate them)
         weights = {
             name: CriterionWeight(
                 name=name,
                 initial_weight=weight,
                 current_weight=weight
             )
-            for name, weight in default_weights.items()
+            for name, weight in weight_table
         }
         
         logger.info(f"Initial weights: {self._format_weights(weights)}")
@@ -139,34 +196,45 @@ class DynamicWeightAdjuster:
         
         logger.info("Starting dynamic weight adjustment")
         
-        # Make a copy of initial weights
-        current_weights = {k: CriterionWeight(
-            name=v.name,
-            initial_weight=v.initial_weight,
-            current_weight=v.current_weight
-        ) for k, v in initial_weights.items()}
-        
-        adjustments = []
-        
         # Analyze findings and discover adjustment triggers
         discoveries = self._extract_significant_discoveries(research_findings)
         
         logger.info(f"Found {len(discoveries)} significant discoveries")
         
-        # Process each discovery and adjust weights
+        if not discoveries:
+            return initial_weights, []
+        
+        adjustments = []
+        # Criteria named by a stated priority, resolved once for all discoveries
+        priorities = [priority.lower() for priority in context.get("priorities", [])]
+        priority_hits = frozenset(
+            criterion for criterion in initial_weights
+            if any(priority in criterion.lower() for priority in priorities)
+        )
+        
+        # Weights are copied on the first adjustment; until then the initial
+        # weights are only read. Discoveries are applied in order since each
+        # adjustment starts from the weight left by the previous one.
+        current_weights = initial_weights
         for discovery in discoveries:
-            adjustment = await self._process_discovery(
+            adjustment = self._process_discovery(
                 discovery,
-                current_weights,
-                context
+                self._calculate_adjustment_amount(discovery, priority_hits),
+                current_weights
             )
             
             if adjustment:
+                if current_weights is initial_weights:
+                    current_weights = self._copy_weights(initial_weights)
                 adjustments.append(adjustment)
                 # Apply adjustment
                 current_weights[adjustment.criterion].current_weight = adjustment.weight_after
                 current_weights[adjustment.criterion].triggered_by.append(discovery["description"])
         
+        if not adjustments:
+            logger.info("No weight adjustments needed")
+            return initial_weights, []
+        
         # Normalize weights to sum to 100
         current_weights = self._normalize_weights(current_weights)
         
@@ -175,6 +243,19 @@ class DynamicWeightAdjuster:
         
         return current_weights, adjustments
     
+    @staticmethod
+    def _copy_weights(weights: Dict[str, CriterionWeight]) -> Dict[str, CriterionWeight]:
+        """
+        Copy weights with an empty adjustment history.
+        
+        A direct constructor call is cheaper than dataclasses.replace().
+        """
+        return {k: CriterionWeight(
+            name=v.name,
+            initial_weight=v.initial_weight,
+            current_weight=v.current_weight
+        ) for k, v in weights.items()}
+    
     def _extract_significant_discoveries(
         self,
         research_findings: List[ResearchFindings]
@@ -192,10 +273,14 @@ class DynamicWeightAdjuster:
         
         for findings in research_findings:
             vendor_name = findings.vendor_name
+            # Read the backing dicts directly; the per-dimension attribute
+            # views build a fresh DimensionResult on every access
+            analyses = findings.analyses
+            details = findings.details
             
             # Check uptime/reliability issues
-            uptime_analysis = findings.uptime_reliability.get("analysis", "")
-            if self._indicates_issue(uptime_analysis, ["outage", "downtime", "incident", "unavailable"]):
+            uptime_analysis = analyses["uptime_reliability"]
+            if self._indicates_issue(uptime_analysis, _UPTIME_ISSUE_RE):
                 discoveries.append({
                     "type": "uptime_issue",
                     "vendor": vendor_name,
@@ -205,7 +290,7 @@ class DynamicWeightAdjuster:
                 })
             
             # Check SDK/integration issues
-            sdk_support = findings.sdk_quality.get("tech_stack_support", {})
+            sdk_support = details.get("sdk_quality", {}).get("tech_stack_support", {})
             if sdk_support and not all(sdk_support.values()):
                 missing_sdks = [tech for tech, supported in sdk_support.items() if not supported]
                 if missing_sdks:
@@ -218,8 +303,8 @@ class DynamicWeightAdjuster:
                     })
             
             # Check pricing issues
-            pricing_analysis = findings.pricing.get("analysis", "")
-            if self._indicates_issue(pricing_analysis, ["expensive", "jump", "hidden fee", "trap"]):
+            pricing_analysis = analyses["pricing"]
+            if self._indicates_issue(pricing_analysis, _PRICING_ISSUE_RE):
                 discoveries.append({
                     "type": "pricing_concern",
                     "vendor": vendor_name,
@@ -239,9 +324,9 @@ class DynamicWeightAdjuster:
                 })
             
             # Check compliance gaps
-            compliance_analysis = findings.compliance.get("analysis", "")
-            required = findings.compliance.get("required", [])
-            if required and self._indicates_issue(compliance_analysis, ["not certified", "lacking", "missing"]):
+            compliance_analysis = analyses["compliance"]
+            required = details.get("compliance", {}).get("required", [])
+            if required and self._indicates_issue(compliance_analysis, _COMPLIANCE_ISSUE_RE):
                 discoveries.append({
                     "type": "compliance_gap",
                     "vendor": vendor_name,
@@ -252,19 +337,19 @@ class DynamicWeightAdjuster:
         
         return discoveries
     
-    async def _process_discovery(
+    def _process_discovery(
         self,
         discovery: Dict[str, any],
-        current_weights: Dict[str, CriterionWeight],
-        context: Dict[str, any]
+        adjustment_amount: float,
+        current_weights: Dict[str, CriterionWeight]
     ) -> Optional[WeightAdjustment]:
         """
-        Process a single discovery and determine if/how to adjust weights.
+        Turn a discovery into a weight adjustment.
         
         Args:
             discovery: Discovery information
+            adjustment_amount: Amount from _calculate_adjustment_amount()
             current_weights: Current criterion weights
-            context: Evaluation context
         
         Returns:
             WeightAdjustment if adjustment made, None otherwise
@@ -274,9 +359,6 @@ class DynamicWeightAdjuster:
         if not affected_criterion or affected_criterion not in current_weights:
             return None
         
-        # Determine weight adjustment based on discovery type
-        adjustment_amount = self._calculate_adjustment_amount(discovery, context)
-        
         if adjustment_amount == 0:
             return None
         
@@ -311,39 +393,23 @@ class DynamicWeightAdjuster:
     def _calculate_adjustment_amount(
         self,
         discovery: Dict[str, any],
-        context: Dict[str, any]
+        priority_hits: FrozenSet[str]
     ) -> float:
         """
         Calculate how much to adjust weight based on discovery.
         
         Args:
             discovery: Discovery information
-            context: Evaluation context
+            priority_hits: Criteria matching a stated priority
         
         Returns:
             Adjustment amount (positive to increase, negative to decrease)
         """
-        discovery_type = discovery["type"]
-        
-        # Base adjustments by discovery type
-        adjustments = {
-            "uptime_issue": 10.0,  # Increase uptime weight by 10%
-            "missing_sdk": 8.0,     # Increase integration complexity by 8%
-            "pricing_concern": 7.0, # Increase pricing weight by 7%
-            "compliance_gap": 12.0, # Increase compliance weight by 12%
-            "hidden_risk_maintainer_health": 5.0,  # Increase vendor health by 5%
-            "hidden_risk_pricing_trap": 8.0,       # Increase pricing by 8%
-            "hidden_risk_vendor_lockin": 4.0       # Moderate concern
-        }
-        
-        base_adjustment = adjustments.get(discovery_type, 5.0)
-        
-        # Adjust based on context priorities
-        priorities = context.get("priorities", [])
-        affected_criterion = discovery.get("affected_criterion", "")
+        # Base adjustment by discovery type
+        base_adjustment = ADJUSTMENT_BY_TYPE.get(discovery["type"], DEFAULT_ADJUSTMENT)
         
         # If discovery relates to a stated priority, increase adjustment
-        if any(priority.lower() in affected_criterion.lower() for priority in priorities):
+        if discovery.get("affected_criterion") in priority_hits:
             base_adjustment *= 1.5
         
         return base_adjustment
@@ -361,34 +427,30 @@ class DynamicWeightAdjuster:
         Returns:
             Normalized weights
         """
-        total = sum(w.current_weight for w in weights.values())
+        # Ten criteria: a C-level map/sum beats array packing at this size
+        weight_list = list(weights.values())
+        total = sum(map(_current_weight, weight_list))
         
         if total == 0:
             # Fallback to equal weights
-            equal_weight = 100.0 / len(weights)
-            for weight in weights.values():
+            equal_weight = 100.0 / len(weight_list)
+            for weight in weight_list:
                 weight.current_weight = equal_weight
         else:
             # Normalize to 100
             factor = 100.0 / total
-            for weight in weights.values():
+            for weight in weight_list:
                 weight.current_weight *= factor
         
         return weights
     
     def _map_risk_to_criterion(self, risk_type: str) -> str:
         """Map hidden risk type to evaluation criterion."""
-        mapping = {
-            "maintainer_health": "vendor_health",
-            "pricing_trap": "pricing",
-            "vendor_lockin": "integration_complexity"
-        }
-        return mapping.get(risk_type, "vendor_health")
+        return RISK_TO_CRITERION.get(risk_type, "vendor_health")
     
-    def _indicates_issue(self, text: str, keywords: List[str]) -> bool:
-        """Check if text indicates an issue based on keywords."""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in keywords)
+    def _indicates_issue(self, text: str, pattern: "re.Pattern") -> bool:
+        """Check if text indicates an issue based on a compiled keyword pattern."""
+        return pattern.search(text) is not None
     
     def _format_weights(self, weights: Dict[str, CriterionWeight]) -> str:
         """Format weights for logging."""
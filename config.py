@@ -2,48 +2,85 @@
 import os
 from typing import Optional
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Load environment variables
 load_dotenv()
 
 
+# Environment values are read once, when this module is imported, and used as
+# plain field defaults below.
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    return os.getenv(name, "true" if default else "false").lower() == "true"
+
+
 class OpenAIConfig(BaseModel):
     """OpenAI API configuration."""
-    api_key: str = Field(default_factory=lambda: os.getenv("OPENAI_API_KEY", ""))
-    model: str = Field(default_factory=lambda: os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview"))
+    model_config = ConfigDict(frozen=True)
+    
+    api_key: str = os.getenv("OPENAI_API_KEY", "")
+    model: str = os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview")
     temperature: float = 0.7
     max_tokens: int = 4000
+    # Cap on in-flight API requests across all agents in the process
+    max_concurrent_requests: int = _env_int("OPENAI_MAX_CONCURRENT_REQUESTS", 8)
+    # Pace request starts under the account's rate limit (0 disables pacing)
+    requests_per_minute: int = _env_int("OPENAI_REQUESTS_PER_MINUTE", 500)
 
 
 class TelegramConfig(BaseModel):
     """Telegram bot configuration."""
-    bot_token: str = Field(default_factory=lambda: os.getenv("TELEGRAM_BOT_TOKEN", ""))
+    model_config = ConfigDict(frozen=True)
+    
+    bot_token: str = os.getenv("TELEGRAM_BOT_TOKEN", "")
     enabled: bool = True
 
 
 class ClawHubConfig(BaseModel):
     """ClawHub web-search configuration."""
-    api_url: str = Field(default_factory=lambda: os.getenv("CLAWHUB_API_URL", "https://api.clawhub.com"))
-    search_timeout: int = Field(default_factory=lambda: int(os.getenv("CLAWHUB_SEARCH_TIMEOUT", "30")))
+    model_config = ConfigDict(frozen=True)
+    
+    api_url: str = os.getenv("CLAWHUB_API_URL", "https://api.clawhub.com")
+    search_timeout: int = _env_int("CLAWHUB_SEARCH_TIMEOUT", 30)
 
 
 class AgentConfig(BaseModel):
     """Agent behavior configuration."""
-    max_candidates: int = Field(default_factory=lambda: int(os.getenv("MAX_CANDIDATES", "5")))
-    research_depth: str = Field(default_factory=lambda: os.getenv("RESEARCH_DEPTH", "comprehensive"))
-    enable_dynamic_weighting: bool = Field(default_factory=lambda: os.getenv("ENABLE_DYNAMIC_WEIGHTING", "true").lower() == "true")
-    enable_hidden_risk_detection: bool = Field(default_factory=lambda: os.getenv("ENABLE_HIDDEN_RISK_DETECTION", "true").lower() == "true")
+    model_config = ConfigDict(frozen=True)
+    
+    max_candidates: int = _env_int("MAX_CANDIDATES", 5)
+    research_depth: str = os.getenv("RESEARCH_DEPTH", "comprehensive")
+    enable_dynamic_weighting: bool = _env_flag("ENABLE_DYNAMIC_WEIGHTING", True)
+    enable_hidden_risk_detection: bool = _env_flag("ENABLE_HIDDEN_RISK_DETECTION", True)
+    max_concurrent_llm: int = _env_int("MAX_CONCURRENT_LLM", 8)
+    max_concurrent_search: int = _env_int("MAX_CONCURRENT_SEARCH", 10)
+    # Seconds before a single candidate's research is abandoned
+    research_timeout: int = _env_int("RESEARCH_TIMEOUT", 300)
+    # Skip the LLM query parse when the keyword parser already recognises the
+    # category plus a region/domain/compliance hint (loses tech stack and
+    # priorities, so off by default)
+    fast_query_parse: bool = _env_flag("FAST_QUERY_PARSE", False)
+    # On-disk search cache directory; empty (the default) disables it
+    search_cache_dir: str = os.getenv("SEARCH_CACHE_DIR", "")
+    search_cache_ttl: int = _env_int("SEARCH_CACHE_TTL", 3600)
 
 
 class LoggingConfig(BaseModel):
     """Logging configuration."""
-    level: str = Field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
-    log_file: str = Field(default_factory=lambda: os.getenv("LOG_FILE", "agent.log"))
+    model_config = ConfigDict(frozen=True)
+    
+    level: str = os.getenv("LOG_LEVEL", "INFO")
+    log_file: str = os.getenv("LOG_FILE", "agent.log")
 
 
 class Config(BaseModel):
     """Main configuration class."""
+    model_config = ConfigDict(frozen=True)
+    
     openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
     telegram: TelegramConfig = Field(default_factory=TelegramConfig)
     clawhub: ClawHubConfig = Field(default_factory=ClawHubConfig)
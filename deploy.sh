@@ -79,7 +79,7 @@ echo ""
 
 # Step 5: Install dependencies if needed
 echo "Step 5: Installing Python dependencies..."
-docker exec $CONTAINER pip install --break-system-packages -q openai pydantic aiohttp tenacity python-dotenv flask 2>/dev/null || true
+docker exec $CONTAINER pip install --break-system-packages -q openai pydantic aiohttp python-dotenv flask gunicorn 2>/dev/null || true
 
 # Step 6: Deploy web report dashboard
 echo ""
@@ -87,7 +87,7 @@ echo "Step 6: Deploying web report dashboard..."
 WEB_DIR="$SKILL_DIR/web_report"
 docker exec $CONTAINER mkdir -p $WEB_DIR/templates $WEB_DIR/static $WEB_DIR/reports
 
-for f in app.py; do
+for f in app.py wsgi.py; do
     docker cp "$REPO_DIR/web_report/$f" "$CONTAINER:$WEB_DIR/$f"
 done
 for f in $REPO_DIR/web_report/templates/*.html; do
@@ -101,7 +101,8 @@ done
 echo ""
 echo "Step 7: Starting web dashboard on port 8080..."
 docker exec $CONTAINER bash -c "pkill -f 'python.*app.py' 2>/dev/null || true"
-docker exec -d $CONTAINER bash -c "cd $WEB_DIR && python app.py > /tmp/web_report.log 2>&1 &"
+docker exec $CONTAINER bash -c "pkill -f 'gunicorn.*wsgi:app' 2>/dev/null || true"
+docker exec -d $CONTAINER bash -c "cd $WEB_DIR && gunicorn -w 4 -k gthread --threads 4 -b 0.0.0.0:8080 wsgi:app > /tmp/web_report.log 2>&1 &"
 sleep 2
 echo "Web dashboard status:"
 docker exec $CONTAINER bash -c "curl -s -o /dev/null -w 'HTTP %{http_code}' http://localhost:8080/ 2>/dev/null || echo 'Starting up...'"
@@ -12,12 +12,253 @@ Provides web search capabilities for:
 
 import logging
 import asyncio
+import re
 import aiohttp
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from config import config
+from utils.disk_cache import DiskCache
+from utils.llm_cache import LLMCache
 
 logger = logging.getLogger(__name__)
 
+# Process-wide search response cache limits
+SEARCH_CACHE_MAX_SIZE = 1000
+SEARCH_CACHE_TTL = 3600.0
+
+# One keep-alive pool shared by every ClawHubClient in the process, so
+# searches reuse warm TCP/TLS connections instead of handshaking per batch.
+SESSION_CONNECTOR_LIMITS = {
+    "limit": 100,
+    "limit_per_host": 20,
+    "ttl_dns_cache": 300,
+    "keepalive_timeout": 60
+}
+
+_shared_session: Optional[aiohttp.ClientSession] = None
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    return " ".join(_PUNCTUATION_RE.sub(" ", query.lower()).split())
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the process-wide pooled HTTP session, creating it if needed."""
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(**SESSION_CONNECTOR_LIMITS),
+            timeout=aiohttp.ClientTimeout(total=config.clawhub.search_timeout)
+        )
+    return _shared_session
+
+
+async def close_shared_session():
+    """Close the pooled HTTP session (call once on shutdown)."""
+    global _shared_session
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+
+
+# Vendors returned by the mock backend for broad category searches
+MOCK_VENDORS = {
+    "payment": (
+        ("Stripe", "stripe.com", "Leading payment processing platform"),
+        ("Razorpay", "razorpay.com", "Payment gateway for India businesses"),
+        ("PayPal", "paypal.com", "Digital payment platform"),
+        ("Square", "squareup.com", "Payment processing and POS"),
+        ("Adyen", "adyen.com", "Global payment platform")
+    ),
+    "observability": (
+        ("Datadog", "datadoghq.com", "Cloud monitoring and observability"),
+        ("New Relic", "newrelic.com", "Full-stack observability platform"),
+        ("Grafana", "grafana.com", "Open source observability"),
+        ("Prometheus", "prometheus.io", "Open source monitoring"),
+        ("Dynatrace", "dynatrace.com", "Software intelligence platform")
+    ),
+    "crm": (
+        ("Salesforce", "salesforce.com", "Customer relationship management"),
+        ("HubSpot", "hubspot.com", "CRM and marketing platform"),
+        ("Zoho CRM", "zoho.com", "CRM for businesses"),
+        ("Pipedrive", "pipedrive.com", "Sales CRM platform"),
+        ("Freshsales", "freshsales.io", "Sales CRM software")
+    ),
+}
+
+def _format_vendor_results(vendors) -> List[Dict[str, any]]:
+    """Format vendor data as search results."""
+    return [
+        {
+            "url": f"https://{domain}",
+            "title": f"{name} - {description}",
+            "snippet": description,
+            "source": domain
+        }
+        for name, domain, description in vendors
+    ]
+
+
+# Formatted once at import; calls slice these instead of rebuilding them
+_MOCK_VENDOR_RESULTS = {
+    category: tuple(_format_vendor_results(vendors))
+    for category, vendors in MOCK_VENDORS.items()
+}
+
+# Query keywords for each mock result category, in priority order: when a
+# query mentions several categories, the earliest one listed wins.
+MOCK_CATEGORY_KEYWORDS = {
+    "payment": ("payment",),
+    "observability": ("observability", "monitoring"),
+    "crm": ("crm",),
+    "github": ("github",),
+    "status": ("status page", "uptime"),
+    "pricing": ("pricing",),
+    "compliance": ("pci", "compliance", "rbi", "soc2"),
+}
+
+_CATEGORY_PRIORITY = {category: i for i, category in enumerate(MOCK_CATEGORY_KEYWORDS)}
+_KEYWORD_CATEGORY = {
+    keyword: category
+    for category, keywords in MOCK_CATEGORY_KEYWORDS.items()
+    for keyword in keywords
+}
+# The lookahead reports a match at every position, so overlapping keywords
+# are all seen in one scan.
+_MOCK_CATEGORY_RE = re.compile("(?=(" + "|".join(map(re.escape, _KEYWORD_CATEGORY)) + "))")
+
+
+def _mock_category(query_lower: str) -> Optional[str]:
+    """Highest-priority mock category mentioned in a lower-cased query."""
+    categories = {_KEYWORD_CATEGORY[match.group(1)] for match in _MOCK_CATEGORY_RE.finditer(query_lower)}
+    return min(categories, key=_CATEGORY_PRIORITY.__getitem__, default=None)
+
+
+def _mock_github_results(query_lower: str) -> List[Dict[str, any]]:
+    """GitHub-specific searches."""
+    vendor_name = query_lower.split("github")[0].strip()
+    return [{
+        "url": f"https://github.com/{vendor_name.replace(' ', '-')}",
+        "title": f"{vendor_name} - GitHub Repository",
+        "snippet": f"Official GitHub repository for {vendor_name}. Stars, issues, and contributions.",
+        "source": "github.com"
+    }]
+
+
+def _mock_status_results(query_lower: str) -> List[Dict[str, any]]:
+    """Status page searches."""
+    vendor_name = query_lower.split("status")[0].strip()
+    return [{
+        "url": f"https://status.{vendor_name}.com",
+        "title": f"{vendor_name} Status Page",
+        "snippet": f"Current and historical status for {vendor_name}. 99.9% uptime over last 12 months.",
+        "source": "status page"
+    }]
+
+
+def _mock_pricing_results(query_lower: str) -> List[Dict[str, any]]:
+    """Pricing searches."""
+    vendor_name = query_lower.split("pricing")[0].strip()
+    return [{
+        "url": f"https://{vendor_name}.com/pricing",
+        "title": f"{vendor_name} Pricing",
+        "snippet": f"Transparent pricing tiers for {vendor_name}. Starts at $X/month.",
+        "source": f"{vendor_name}.com"
+    }]
+
+
+def _mock_compliance_results(query_lower: str) -> List[Dict[str, any]]:
+    """Compliance searches."""
+    vendor_name = query_lower.split()[0]
+    return [{
+        "url": f"https://{vendor_name}.com/compliance",
+        "title": f"{vendor_name} Compliance & Security",
+        "snippet": f"{vendor_name} is PCI-DSS Level 1 certified and SOC 2 Type II compliant.",
+        "source": f"{vendor_name}.com"
+    }]
+
+
+_MOCK_HANDLERS = {
+    "github": _mock_github_results,
+    "status": _mock_status_results,
+    "pricing": _mock_pricing_results,
+    "compliance": _mock_compliance_results,
+}
+
+
+class SearchResponseCache:
+    """
+    Tiered cache for search responses.
+    
+    L1 matches the normalized query exactly. L2 matches the query's set of
+    words, so reordered or repeated-word variants ("Stripe pricing" vs
+    "pricing stripe") reuse the same results. The optional disk tier keeps
+    exact-match results across runs, so repeat evaluations of overlapping
+    vendors skip the network. All tiers are keyed by search type and result
+    count as well.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = SEARCH_CACHE_MAX_SIZE,
+        ttl: float = SEARCH_CACHE_TTL,
+        disk: Optional[DiskCache] = None
+    ):
+        self._exact = LLMCache(max_size, ttl)
+        self._near = LLMCache(max_size, ttl)
+        self._disk = disk
+        self.disk_hits = 0
+    
+    @staticmethod
+    def _keys(query: str, num_results: int, search_type: str):
+        normalized = normalize_query(query)
+        prefix = f"{search_type}:{num_results}:"
+        return prefix + normalized, prefix + " ".join(sorted(set(normalized.split())))
+    
+    async def lookup(self, query: str, num_results: int, search_type: str) -> Optional[List[Dict]]:
+        """Return cached results for the query, or None on a miss."""
+        exact_key, near_key = self._keys(query, num_results, search_type)
+        results = await self._exact.get(exact_key)
+        if results is None:
+            results = await self._near.get(near_key)
+        if results is None and self._disk is not None:
+            results = await self._disk.get(exact_key)
+            if results is not None:
+                self.disk_hits += 1
+                await self._exact.set(exact_key, results)
+                await self._near.set(near_key, results)
+        return results
+    
+    async def update(self, query: str, num_results: int, search_type: str, results: List[Dict]):
+        """Store results under both tiers."""
+        exact_key, near_key = self._keys(query, num_results, search_type)
+        await self._exact.set(exact_key, results)
+        await self._near.set(near_key, results)
+        if self._disk is not None and results:
+            await self._disk.set(exact_key, results)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Return hit/miss counters (each tier only sees the previous tier's misses)."""
+        return {
+            "exact_hits": self._exact.hits,
+            "near_hits": self._near.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self._near.misses - self.disk_hits,
+            "size": self._exact.get_stats()["size"]
+        }
+
+
+# Shared by every ClawHubClient in the process; results also persist on disk
+# across runs when SEARCH_CACHE_DIR is set
+_response_cache = SearchResponseCache(
+    disk=(
+        DiskCache(config.agent.search_cache_dir, ttl=config.agent.search_cache_ttl)
+        if config.agent.search_cache_dir else None
+    )
+)
+
 
 class ClawHubClient:
     """Client for ClawHub web search API."""
@@ -27,16 +268,18 @@ class ClawHubClient:
         self.api_url = config.clawhub.api_url
         self.timeout = config.clawhub.search_timeout
         self.session: Optional[aiohttp.ClientSession] = None
+        self.cache = _response_cache
+        # Searches currently on the network, so concurrent duplicates share one call
+        self._inflight: Dict[Tuple[str, int, str], asyncio.Task] = {}
     
     async def __aenter__(self):
-        """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        """Async context manager entry (attaches the shared session)."""
+        self.session = await get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit; the shared session stays open for reuse."""
+        self.session = None
     
     async def web_search(
         self,
@@ -65,11 +308,36 @@ class ClawHubClient:
         # In production, this would call the actual ClawHub API
         # For now, we'll simulate with a simple web search or fallback
         
+        cached = await self.cache.lookup(query, num_results, search_type)
+        if cached is not None:
+            logger.debug("ClawHub cache hit")
+            return cached
+        
+        key = (search_type, num_results, normalize_query(query))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._search_uncached(query, num_results, search_type))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.debug("ClawHub joining in-flight search")
+        
+        # Shielded so one cancelled caller doesn't cancel the search for the others
+        return await asyncio.shield(task)
+    
+    async def _search_uncached(
+        self,
+        query: str,
+        num_results: int,
+        search_type: str
+    ) -> List[Dict[str, any]]:
+        """Run a search against the backend and cache successful results."""
         try:
             # Try to use actual web search (fallback to DuckDuckGo-like approach)
             results = await self._fallback_search(query, num_results)
             
             logger.debug(f"ClawHub returned {len(results)} results")
+            await self.cache.update(query, num_results, search_type, results)
             return results
         
         except Exception as e:
@@ -103,81 +371,15 @@ class ClawHubClient:
         
         In production, this would be replaced with actual ClawHub API calls.
         """
-        results = []
-        
-        # Parse query to generate relevant mock results
+        # Pick the mock category from keywords in the query (single scan)
         query_lower = query.lower()
+        category = _mock_category(query_lower)
         
-        # Common vendor-related queries
-        if "payment gateway" in query_lower or "payment" in query_lower:
-            mock_vendors = [
-                ("Stripe", "stripe.com", "Leading payment processing platform"),
-                ("Razorpay", "razorpay.com", "Payment gateway for India businesses"),
-                ("PayPal", "paypal.com", "Digital payment platform"),
-                ("Square", "squareup.com", "Payment processing and POS"),
-                ("Adyen", "adyen.com", "Global payment platform")
-            ]
-            results.extend(self._format_vendor_results(mock_vendors))
-        
-        elif "observability" in query_lower or "monitoring" in query_lower:
-            mock_vendors = [
-                ("Datadog", "datadoghq.com", "Cloud monitoring and observability"),
-                ("New Relic", "newrelic.com", "Full-stack observability platform"),
-                ("Grafana", "grafana.com", "Open source observability"),
-                ("Prometheus", "prometheus.io", "Open source monitoring"),
-                ("Dynatrace", "dynatrace.com", "Software intelligence platform")
-            ]
-            results.extend(self._format_vendor_results(mock_vendors))
-        
-        elif "crm" in query_lower:
-            mock_vendors = [
-                ("Salesforce", "salesforce.com", "Customer relationship management"),
-                ("HubSpot", "hubspot.com", "CRM and marketing platform"),
-                ("Zoho CRM", "zoho.com", "CRM for businesses"),
-                ("Pipedrive", "pipedrive.com", "Sales CRM platform"),
-                ("Freshsales", "freshsales.io", "Sales CRM software")
-            ]
-            results.extend(self._format_vendor_results(mock_vendors))
-        
-        # GitHub-specific searches
-        elif "github" in query_lower:
-            vendor_name = query_lower.split("github")[0].strip()
-            results.append({
-                "url": f"https://github.com/{vendor_name.replace(' ', '-')}",
-                "title": f"{vendor_name} - GitHub Repository",
-                "snippet": f"Official GitHub repository for {vendor_name}. Stars, issues, and contributions.",
-                "source": "github.com"
-            })
+        if category in _MOCK_VENDOR_RESULTS:
+            # Fresh list so callers may mutate it; the result dicts are shared
+            return list(_MOCK_VENDOR_RESULTS[category][:num_results])
         
-        # Status page searches
-        elif "status page" in query_lower or "uptime" in query_lower:
-            vendor_name = query_lower.split("status")[0].strip()
-            results.append({
-                "url": f"https://status.{vendor_name}.com",
-                "title": f"{vendor_name} Status Page",
-                "snippet": f"Current and historical status for {vendor_name}. 99.9% uptime over last 12 months.",
-                "source": "status page"
-            })
-        
-        # Pricing searches
-        elif "pricing" in query_lower:
-            vendor_name = query_lower.split("pricing")[0].strip()
-            results.append({
-                "url": f"https://{vendor_name}.com/pricing",
-                "title": f"{vendor_name} Pricing",
-                "snippet": f"Transparent pricing tiers for {vendor_name}. Starts at $X/month.",
-                "source": f"{vendor_name}.com"
-            })
-        
-        # Compliance searches
-        elif any(comp in query_lower for comp in ["pci", "compliance", "rbi", "soc2"]):
-            vendor_name = query_lower.split()[0]
-            results.append({
-                "url": f"https://{vendor_name}.com/compliance",
-                "title": f"{vendor_name} Compliance & Security",
-                "snippet": f"{vendor_name} is PCI-DSS Level 1 certified and SOC 2 Type II compliant.",
-                "source": f"{vendor_name}.com"
-            })
+        results = _MOCK_HANDLERS[category](query_lower) if category else []
         
         # Generic results if no specific pattern matched
         if not results:
@@ -193,21 +395,6 @@ class ClawHubClient:
         
         return results[:num_results]
     
-    def _format_vendor_results(
-        self,
-        vendors: List[tuple]
-    ) -> List[Dict[str, any]]:
-        """Format vendor data as search results."""
-        results = []
-        for name, domain, description in vendors:
-            results.append({
-                "url": f"https://{domain}",
-                "title": f"{name} - {description}",
-                "snippet": description,
-                "source": domain
-            })
-        return results
-    
     async def search_github(
         self,
         repo_name: str
@@ -274,17 +461,25 @@ class ClawHubClient:
         Returns:
             Dictionary mapping query -> results
         """
+        # Repeated queries are searched once; near-duplicates (same normalized
+        # form) are collapsed by web_search's in-flight map
+        unique_queries = list(dict.fromkeys(queries))
         tasks = [
             self.web_search(query, num_results)
-            for query in queries
+            for query in unique_queries
         ]
         
         results_list = await asyncio.gather(*tasks)
         
         return {
             query: results
-            for query, results in zip(queries, results_list)
+            for query, results in zip(unique_queries, results_list)
         }
+    
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Return search cache hit/miss counters."""
+        return self.cache.get_stats()
 
 
 # Convenience function for non-async context
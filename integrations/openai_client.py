@@ -8,18 +8,135 @@ Provides clean interface to OpenAI API for:
 - Error handling and retries
 """
 
+import asyncio
+import functools
+import importlib.util
 import logging
-from typing import List, Dict, Optional
-from openai import AsyncOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+import random
+from contextlib import aclosing
+from typing import Any, AsyncIterator, List, Dict, Optional
+import httpx
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
 from config import config
+from utils import json_codec
+from utils.analysis_batcher import AnalysisBatcher
+from utils.circuit_breaker import CircuitBreaker
+from utils.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# One keep-alive pool shared by every OpenAIClient in the process, so parallel
+# agent calls reuse warm TLS connections instead of each opening their own.
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+# With h2 installed (httpx[http2]) concurrent requests multiplex over one
+# connection instead of each needing its own.
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+# Non-streaming completions only send bytes once generation is done, so the
+# read timeout has to cover a full long response.
+HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+# Retry policy for transient API failures (APITimeoutError is an
+# APIConnectionError). Waits 2s, then 4s, capped at 10s, plus up to 10% jitter.
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+RETRY_MAX_ATTEMPTS = 3
+RETRY_INITIAL_DELAY = 2.0
+RETRY_MAX_DELAY = 10.0
+
+# Batch API (asynchronous, half price): completion window, how often a
+# submitted job is polled and how long a caller waits before giving up on it
+BATCH_API_ENDPOINT = "/v1/chat/completions"
+BATCH_API_COMPLETION_WINDOW = "24h"
+BATCH_API_POLL_INTERVAL = 5.0
+BATCH_API_MAX_WAIT = 3600.0
+BATCH_API_FAILED_STATUSES = frozenset({"failed", "expired", "cancelled"})
+
+# Shared by every OpenAIClient: after 5 consecutive failed calls (retries
+# exhausted), requests are rejected with CircuitOpenError for 30s
+circuit_breaker = CircuitBreaker("OpenAI API")
+
+# Shared by every OpenAIClient: paces request starts (including retries) to
+# OPENAI_REQUESTS_PER_MINUTE
+rate_limiter = RateLimiter(config.openai.requests_per_minute)
+
+_shared_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+_request_semaphore: Optional[asyncio.Semaphore] = None
+_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class JSONCodecClient(httpx.AsyncClient):
+    """httpx client that encodes JSON request bodies with utils.json_codec (orjson when installed)."""
+    
+    def build_request(self, method, url, *, json: Any = None, **kwargs) -> httpx.Request:
+        if json is not None and kwargs.get("content") is None:
+            try:
+                content = json_codec.dumps(json)
+            except TypeError:
+                # orjson rejects some types stdlib json accepts; let httpx handle them
+                pass
+            else:
+                headers = httpx.Headers(kwargs.pop("headers", None))
+                headers.setdefault("Content-Type", "application/json")
+                return super().build_request(method, url, content=content, headers=headers, **kwargs)
+        return super().build_request(method, url, json=json, **kwargs)
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Return the pooled HTTP client for the running event loop.
+    
+    Pooled connections belong to the loop that opened them, so the client is
+    rebuilt when the running loop changes (e.g. successive asyncio.run calls)
+    or after it has been closed.
+    """
+    global _shared_http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_http_client is None or _shared_http_client.is_closed or _http_client_loop is not loop:
+        _shared_http_client = JSONCodecClient(
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            http2=HTTP2_ENABLED
+        )
+        _http_client_loop = loop
+    return _shared_http_client
+
+
+async def close_shared_http_client():
+    """Close the pooled HTTP client (call once on shutdown)."""
+    global _shared_http_client
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        await _shared_http_client.aclose()
+    _shared_http_client = None
+
+
+def get_request_semaphore() -> asyncio.Semaphore:
+    """
+    Return the process-wide limit on in-flight OpenAI requests.
+    
+    Parallel research, risk detection and synthesis can otherwise fire
+    dozens of requests at once and trip rate limits. The semaphore is
+    rebuilt when the running event loop changes, since it is bound to one.
+    """
+    global _request_semaphore, _semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _request_semaphore is None or _semaphore_loop is not loop:
+        _request_semaphore = asyncio.Semaphore(config.openai.max_concurrent_requests)
+        _semaphore_loop = loop
+    return _request_semaphore
+
+
+def _cached_prompt_tokens(response) -> int:
+    """Prompt tokens served from the API's prefix cache (0 if not reported)."""
+    details = getattr(getattr(response, "usage", None), "prompt_tokens_details", None)
+    return getattr(details, "cached_tokens", None) or 0
+
 
 class OpenAIClient:
     """Wrapper for OpenAI API with error handling and retries."""
     
+    __slots__ = ("api_key", "model", "temperature", "max_tokens", "_client", "_http_client")
+    
     def __init__(self):
         """Initialize OpenAI client."""
         self.api_key = config.openai.api_key
@@ -30,13 +147,20 @@ class OpenAIClient:
         if not self.api_key:
             raise ValueError("OpenAI API key not configured. Set OPENAI_API_KEY in .env")
         
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        # Built on first use, on the running loop's connection pool
+        self._client: Optional[AsyncOpenAI] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
         logger.info(f"OpenAI client initialized with model: {self.model}")
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
+    @property
+    def client(self) -> AsyncOpenAI:
+        """AsyncOpenAI client bound to the current pooled HTTP client."""
+        http_client = get_shared_http_client()
+        if http_client is not self._http_client:
+            self._client = AsyncOpenAI(api_key=self.api_key, http_client=http_client)
+            self._http_client = http_client
+        return self._client
+    
     async def chat_completion(
         self,
         messages: List[Dict[str, str]],
@@ -47,6 +171,9 @@ class OpenAIClient:
         """
         Get chat completion from OpenAI.
         
+        Transient errors (rate limits, connection problems, timeouts, 5xx)
+        are retried with exponential backoff; anything else is raised at once.
+        
         Args:
             messages: List of message dicts with 'role' and 'content'
             temperature: Temperature for generation (overrides default)
@@ -56,32 +183,154 @@ class OpenAIClient:
         Returns:
             Generated text response
         """
+        temp = temperature if temperature is not None else self.temperature
+        tokens = max_tokens if max_tokens is not None else self.max_tokens
+        
+        logger.debug(f"Sending chat completion request (temp={temp}, max_tokens={tokens})")
+        
+        kwargs = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temp,
+            "max_tokens": tokens
+        }
+        
+        if response_format:
+            kwargs["response_format"] = response_format
+        
+        # Fail fast while the API is known to be down
+        circuit_breaker.before_call()
         try:
-            temp = temperature if temperature is not None else self.temperature
-            tokens = max_tokens if max_tokens is not None else self.max_tokens
-            
-            logger.debug(f"Sending chat completion request (temp={temp}, max_tokens={tokens})")
-            
-            kwargs = {
-                "model": self.model,
-                "messages": messages,
-                "temperature": temp,
-                "max_tokens": tokens
-            }
-            
-            if response_format:
-                kwargs["response_format"] = response_format
-            
-            response = await self.client.chat.completions.create(**kwargs)
-            
-            content = response.choices[0].message.content
-            
-            logger.debug(f"Received response ({len(content)} chars)")
-            return content
+            response = await self._create_with_retries(kwargs)
+        except RETRYABLE_ERRORS:
+            circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            circuit_breaker.release()
+            raise
+        circuit_breaker.record_success()
         
-        except Exception as e:
-            logger.error(f"OpenAI API error: {str(e)}")
+        content = response.choices[0].message.content
+        
+        logger.debug(
+            f"Received response ({len(content)} chars, "
+            f"{_cached_prompt_tokens(response)} prompt tokens from cache)"
+        )
+        return content
+    
+    async def _create_with_retries(self, kwargs: Dict) -> Any:
+        """Create a completion, retrying transient errors with backoff."""
+        delay = RETRY_INITIAL_DELAY
+        for attempt in range(1, RETRY_MAX_ATTEMPTS + 1):
+            try:
+                await rate_limiter.acquire()
+                # Held per attempt, so retries back off without occupying a slot
+                async with get_request_semaphore():
+                    return await self.client.chat.completions.create(**kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt == RETRY_MAX_ATTEMPTS:
+                    logger.error(f"OpenAI API error: {str(e)}")
+                    raise
+                logger.warning(f"OpenAI API error (attempt {attempt}/{RETRY_MAX_ATTEMPTS}), retrying in {delay:.0f}s: {str(e)}")
+                await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+                delay = min(RETRY_MAX_DELAY, delay * 2)
+            except Exception as e:
+                logger.error(f"OpenAI API error: {str(e)}")
+                raise
+    
+    async def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion from OpenAI.
+        
+        Consumers can stop iterating (and `aclose()` the generator) as soon
+        as they have what they need; the HTTP stream is closed so no further
+        tokens are generated for this request.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Temperature for generation (overrides default)
+            max_tokens: Max tokens for response (overrides default)
+        
+        Yields:
+            Text deltas as they arrive
+        """
+        temp = temperature if temperature is not None else self.temperature
+        tokens = max_tokens if max_tokens is not None else self.max_tokens
+        
+        logger.debug(f"Sending streaming chat completion request (temp={temp}, max_tokens={tokens})")
+        
+        kwargs = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temp,
+            "max_tokens": tokens,
+            "stream": True
+        }
+        
+        # Fail fast while the API is known to be down
+        circuit_breaker.before_call()
+        received = False
+        try:
+            # aclosing releases the request slot and HTTP stream as soon as
+            # the consumer stops, not when the generator is garbage collected
+            async with aclosing(self._stream_with_retries(kwargs)) as stream:
+                async for text in stream:
+                    received = True
+                    yield text
+        except RETRYABLE_ERRORS:
+            circuit_breaker.record_failure()
+            raise
+        except GeneratorExit:
+            # Closed early by the consumer; output means the API is healthy
+            if received:
+                circuit_breaker.record_success()
+            else:
+                circuit_breaker.release()
+            raise
+        except BaseException:
+            circuit_breaker.release()
             raise
+        circuit_breaker.record_success()
+    
+    async def _stream_with_retries(self, kwargs: Dict) -> AsyncIterator[str]:
+        """
+        Stream a completion, retrying transient errors with backoff.
+        
+        Only failures before the first text delta are retried; once output
+        has been yielded, an error is raised to the consumer.
+        """
+        delay = RETRY_INITIAL_DELAY
+        started = False
+        for attempt in range(1, RETRY_MAX_ATTEMPTS + 1):
+            try:
+                await rate_limiter.acquire()
+                # The slot is held until the stream is fully consumed or closed
+                async with get_request_semaphore():
+                    stream = await self.client.chat.completions.create(**kwargs)
+                    try:
+                        async for chunk in stream:
+                            if chunk.choices and chunk.choices[0].delta.content:
+                                started = True
+                                yield chunk.choices[0].delta.content
+                    finally:
+                        await stream.close()
+                return
+            except RETRYABLE_ERRORS as e:
+                if started or attempt == RETRY_MAX_ATTEMPTS:
+                    logger.error(f"OpenAI API error: {str(e)}")
+                    raise
+                logger.warning(f"OpenAI API error (attempt {attempt}/{RETRY_MAX_ATTEMPTS}), retrying in {delay:.0f}s: {str(e)}")
+            except Exception as e:
+                logger.error(f"OpenAI API error: {str(e)}")
+                raise
+            # Back off outside the semaphore so the slot is free meanwhile
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(RETRY_MAX_DELAY, delay * 2)
     
     async def chat_completion_with_json(
         self,
@@ -108,67 +357,194 @@ class OpenAIClient:
         self,
         system_prompt: str,
         user_prompt: str,
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        system_context: Optional[str] = None
     ) -> str:
         """
         Simple analysis with system and user prompts.
         
         Args:
-            system_prompt: System role/context
+            system_prompt: Static system instructions (keep constant across calls)
             user_prompt: User query
             temperature: Generation temperature
+            system_context: Optional per-call system context, sent after the
+                static instructions
         
         Returns:
             Analysis response
         """
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ]
+        messages = self.format_messages(system_prompt, user_prompt, system_context=system_context)
         
         return await self.chat_completion(messages, temperature=temperature)
     
     async def batch_completions(
         self,
         requests: List[Dict[str, any]]
-    ) -> List[str]:
+    ) -> List[Optional[str]]:
         """
         Process multiple completion requests in parallel.
         
+        Concurrency is bounded by the process-wide request semaphore
+        (OPENAI_MAX_CONCURRENT_REQUESTS) that every chat_completion call
+        acquires, so a large batch queues instead of bursting into rate limits.
+        
         Args:
             requests: List of dicts with 'messages', 'temperature', etc.
         
         Returns:
-            List of responses in same order as requests
+            List of responses in same order as requests; None for a request
+            that failed (the others still complete)
         """
-        import asyncio
-        
         tasks = [
             self.chat_completion(**request)
             for request in requests
         ]
         
-        return await asyncio.gather(*tasks)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        failures = [r for r in results if isinstance(r, Exception)]
+        if failures:
+            logger.warning(f"{len(failures)}/{len(results)} batch completions failed: {str(failures[0])}")
+        
+        return [None if isinstance(r, Exception) else r for r in results]
+    
+    async def submit_batch(self, requests: List[Dict[str, Any]]) -> str:
+        """
+        Submit chat completion requests as one Batch API job.
+        
+        Args:
+            requests: List of dicts with 'messages', 'temperature', etc.
+                (same shape as batch_completions); custom_id is the index
+        
+        Returns:
+            Batch ID to pass to await_batch
+        """
+        lines = []
+        for i, request in enumerate(requests):
+            temperature = request.get("temperature")
+            body = {
+                "model": self.model,
+                "messages": request["messages"],
+                "temperature": temperature if temperature is not None else self.temperature,
+                "max_tokens": request.get("max_tokens") or self.max_tokens
+            }
+            if request.get("response_format"):
+                body["response_format"] = request["response_format"]
+            lines.append(json_codec.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": BATCH_API_ENDPOINT,
+                "body": body
+            }))
+        
+        batch_file = await self.client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_API_ENDPOINT,
+            completion_window=BATCH_API_COMPLETION_WINDOW
+        )
+        logger.info(f"Submitted batch {batch.id} ({len(requests)} requests)")
+        return batch.id
+    
+    async def await_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = BATCH_API_POLL_INTERVAL,
+        timeout: float = BATCH_API_MAX_WAIT
+    ) -> Dict[str, str]:
+        """
+        Wait for a Batch API job and collect its responses.
+        
+        Args:
+            batch_id: ID returned by submit_batch
+            poll_interval: Seconds between status checks
+            timeout: Seconds to wait before cancelling the job
+        
+        Returns:
+            Dict of custom_id -> response text; requests that failed are missing
+        
+        Raises:
+            RuntimeError: If the job failed, expired or was cancelled
+            TimeoutError: If the job did not finish within timeout
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in BATCH_API_FAILED_STATUSES:
+                raise RuntimeError(f"OpenAI batch {batch_id} {batch.status}")
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                await self._cancel_batch(batch_id)
+                raise TimeoutError(f"OpenAI batch {batch_id} not done after {timeout:.0f}s")
+            await asyncio.sleep(min(poll_interval, remaining))
+        
+        results = {}
+        if batch.output_file_id:
+            output = await self.client.files.content(batch.output_file_id)
+            for line in output.content.splitlines():
+                if not line.strip():
+                    continue
+                entry = json_codec.loads(line)
+                response = entry.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        
+        failed = batch.request_counts.failed if batch.request_counts else 0
+        logger.info(f"Batch {batch_id} completed ({len(results)} responses, {failed} failed)")
+        return results
+    
+    async def _cancel_batch(self, batch_id: str):
+        """Cancel a batch job nobody is waiting for any more (best effort)."""
+        try:
+            await self.client.batches.cancel(batch_id)
+        except Exception as e:
+            logger.warning(f"Could not cancel batch {batch_id}: {str(e)}")
+    
+    async def batch_api_completions(self, requests: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Run requests through the Batch API (submit, then poll until done).
+        
+        Returns:
+            List of responses in same order as requests; None for a request
+            that failed
+        """
+        results = await self.await_batch(await self.submit_batch(requests))
+        return [results.get(str(i)) for i in range(len(requests))]
     
     def format_messages(
         self,
         system: str,
         user: str,
-        assistant_history: Optional[List[str]] = None
+        assistant_history: Optional[List[str]] = None,
+        system_context: Optional[str] = None
     ) -> List[Dict[str, str]]:
         """
         Helper to format messages list.
         
+        The API caches prompt prefixes automatically, so the static system
+        prompt always comes first and is sent byte-for-byte unchanged; anything
+        that varies per call (system_context, history, the user message)
+        follows it.
+        
         Args:
-            system: System prompt
+            system: Static system prompt (pass a module-level constant)
             user: User message
             assistant_history: Optional list of assistant responses
+            system_context: Optional per-call system context
         
         Returns:
             Formatted messages list
         """
         messages = [{"role": "system", "content": system}]
         
+        if system_context:
+            messages.append({"role": "system", "content": system_context})
+        
         if assistant_history:
             for msg in assistant_history:
                 messages.append({"role": "assistant", "content": msg})
@@ -178,6 +554,52 @@ class OpenAIClient:
         return messages
 
 
+@functools.lru_cache(maxsize=1)
 def create_openai_client() -> OpenAIClient:
-    """Create an OpenAI client instance."""
+    """Return the process-wide OpenAI client instance (created on first call)."""
     return OpenAIClient()
+
+
+class BatchAPIClient:
+    """
+    OpenAIClient wrapper that sends chat completions through the Batch API.
+    
+    Completions requested within `window` seconds of each other are submitted
+    as one batch job, at half the realtime price and outside the per-minute
+    rate limits, in exchange for minutes of latency. Meant for non-interactive
+    runs; streaming completions still go to the realtime API. All other
+    attributes are delegated to the wrapped client.
+    """
+    
+    def __init__(self, openai_client: OpenAIClient, window: float = 1.0, max_batch: int = 1000):
+        """
+        Initialize wrapper.
+        
+        Args:
+            openai_client: Underlying OpenAIClient
+            window: Seconds to collect requests before submitting a batch
+            max_batch: Maximum requests per batch job
+        """
+        self._client = openai_client
+        self._batcher = AnalysisBatcher(openai_client.batch_api_completions, window=window, max_batch=max_batch)
+    
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+    
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict] = None
+    ) -> str:
+        """Chat completion served by the next batch job."""
+        content = await self._batcher.submit({
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_format": response_format
+        })
+        if content is None:
+            raise RuntimeError("OpenAI batch request failed")
+        return content
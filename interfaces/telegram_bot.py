@@ -9,8 +9,10 @@ Provides conversational interface for:
 - Delivering final recommendations
 """
 
+import asyncio
 import logging
-from typing import Dict, Optional
+import time
+from typing import Dict, List, Optional
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
     Application,
@@ -19,19 +21,241 @@ from telegram.ext import (
     ConversationHandler,
     CallbackQueryHandler,
     ContextTypes,
+    TypeHandler,
     filters
 )
+from agents.synthesizer import format_as_markdown
 from config import config
+from utils.circuit_breaker import CircuitOpenError
 
 logger = logging.getLogger(__name__)
 
 # Conversation states
 (CATEGORY, TECH_STACK, DOMAIN, REGION, SCALE, PRIORITIES, COMPLIANCE, CONFIRM) = range(8)
 
+# Idle conversations (and their user_data) are dropped after this many seconds
+CONVERSATION_TIMEOUT = 600
+
+# Telegram rate-limits message edits to roughly one per second per chat
+STREAM_EDIT_INTERVAL = 1.0
+STREAM_CURSOR = " ▍"
+STREAM_MAX_LENGTH = 4000
+PROGRESS_MAX_LINES = 10
+
+# Static replies, built once at import
+_WELCOME_MSG = """
+👋 **Welcome to the Adaptive Vendor Evaluation Agent!**
+
+I'm an intelligent evaluation system powered by SOUL.md and OpenClaw. I don't just compare vendors—I adapt my evaluation criteria based on discoveries during research.
+
+**What makes me different:**
+✅ Dynamic criteria re-weighting based on findings
+✅ Deep research (GitHub, status pages, community sentiment)
+✅ Hidden risk detection (maintainer churn, pricing traps)
+✅ Context-aware recommendations
+
+**Commands:**
+/evaluate - Start a new vendor evaluation
+/example - See an example evaluation
+/help - Get help
+
+Ready to find the best vendor for your needs? Use /evaluate to begin!
+"""
+
+_EVALUATE_PROMPT = (
+    "🔍 **Let's evaluate some vendors!**\n\n"
+    "I'll ask you a few questions to understand your needs.\n\n"
+    "**Step 1/7: Category**\n"
+    "What type of vendor are you looking for?\n"
+    "Examples: payment gateway, observability platform, CRM, database, etc.\n\n"
+    "Type /cancel anytime to stop."
+)
+
+_HELP_MSG = """
+**Adaptive Vendor Evaluation Agent - Help**
+
+**Commands:**
+/evaluate - Start a new vendor evaluation
+/example - See an example evaluation
+/help - Show this help message
+/cancel - Cancel current evaluation
+
+**How it works:**
+1. Tell me what you're looking for (category)
+2. Provide context (tech stack, domain, scale, etc.)
+3. I identify relevant vendor candidates
+4. I research each across multiple dimensions
+5. I dynamically adjust evaluation criteria based on findings
+6. I deliver a detailed recommendation with reasoning
+
+**What makes me adaptive?**
+- I don't use fixed criteria weights
+- Discoveries reshape my evaluation (e.g., finding outages increases uptime weight)
+- I detect hidden risks (maintainer churn, pricing traps)
+- I provide context-specific recommendations
+
+**Example evaluation request:**
+Category: Payment Gateway
+Tech Stack: Golang, AWS
+Domain: Fintech
+Region: India
+Scale: Startup (10K transactions/month)
+Priorities: Security, RBI compliance, ease of integration
+Compliance: PCI-DSS, RBI
+
+Questions? Just ask!
+"""
+
+_EXAMPLE_MSG = """
+**Example: Payment Gateway Evaluation for Indian Fintech Startup**
+
+**Context:**
+• Category: Payment Gateway
+• Tech Stack: Golang, Python, AWS
+• Domain: Fintech
+• Region: India
+• Scale: Early-stage (1K → 100K transactions/month)
+• Priorities: RBI compliance, ease of integration, uptime
+
+**Candidates Identified:**
+1. Stripe - Global leader
+2. Razorpay - India-focused
+3. Cashfree - Local alternative
+4. PayPal - Established player
+
+**Key Discoveries:**
+🔍 Discovery 1: Razorpay has native RBI compliance & local support
+→ Increased "Compliance" weight 20% → 30%
+
+🔍 Discovery 2: Stripe India had 2-hour outage last month
+→ Increased "Uptime" weight 15% → 25%
+→ Triggered deeper SLA investigation
+
+**Final Weights (After Adjustments):**
+Compliance: 30% (was 20%)
+Uptime: 25% (was 15%)
+Integration: 20% (was 15%)
+Support: 15% (unchanged)
+Pricing: 10% (unchanged)
+
+**Recommendation: Razorpay**
+
+**Why:**
+• Native RBI compliance (critical for fintech)
+• Strong local support team (12hr vs Stripe's 24hr)
+• Golang SDK officially supported
+• 99.95% uptime (no recent incidents)
+
+**Trade-offs:**
+❌ Less global reach than Stripe
+❌ Fewer advanced features
+
+**Alternative:** If you expand globally → Switch to Stripe
+
+Use /evaluate to start your own evaluation!
+"""
+
+_CONFIRM_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("✅ Start Evaluation", callback_data="confirm_yes"),
+        InlineKeyboardButton("❌ Cancel", callback_data="confirm_no")
+    ]
+])
+
+
+def _parse_csv(text: str) -> List[str]:
+    """Split comma-separated input into lowercase items, dropping blanks (normalized so cache keys match)."""
+    return [item for item in (part.strip().lower() for part in text.split(",")) if item]
+
+
+class StreamingReply:
+    """A reply message that is edited in place as streamed text arrives."""
+    
+    cursor = STREAM_CURSOR
+    
+    def __init__(self, message, interval: float = STREAM_EDIT_INTERVAL):
+        """
+        Initialize streaming reply.
+        
+        Args:
+            message: Telegram message to reply to
+            interval: Minimum seconds between edits
+        """
+        self.message = message
+        self.interval = interval
+        
+        self._parts = []
+        self._reply = None
+        self._shown = ""
+        self._last_edit = 0.0
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+    
+    async def append(self, text: str):
+        """Add streamed text; the message is refreshed at most once per interval."""
+        self._parts.append(text)
+        wait = self.interval - (time.monotonic() - self._last_edit)
+        if wait <= 0:
+            await self._render(self.cursor)
+        elif self._flush_task is None:
+            # Show text that arrives during the quiet period once it ends
+            self._flush_task = asyncio.create_task(self._flush_later(wait))
+    
+    async def finish(self):
+        """Show the complete text without the typing cursor."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._parts:
+            await self._render("")
+    
+    async def _flush_later(self, delay: float):
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self._render(self.cursor)
+    
+    def _text(self) -> str:
+        """Text to display for everything received so far."""
+        text = "".join(self._parts).strip()
+        if len(text) > STREAM_MAX_LENGTH:
+            # Keep the tail visible; the full report follows separately
+            text = "…" + text[-STREAM_MAX_LENGTH:]
+        return text
+    
+    async def _render(self, suffix: str):
+        """Send or edit the reply with the text received so far."""
+        text = self._text() + suffix
+        if not text.strip() or text == self._shown:
+            return
+        
+        self._last_edit = time.monotonic()
+        # Serialized so two renders can't both send the first message
+        async with self._lock:
+            try:
+                # Plain text: partially streamed markdown is often unbalanced
+                if self._reply is None:
+                    self._reply = await self.message.reply_text(text)
+                else:
+                    await self._reply.edit_text(text)
+                self._shown = text
+            except Exception as e:
+                logger.warning(f"Failed to update streamed reply: {str(e)}")
+
+
+class ProgressReply(StreamingReply):
+    """One progress message showing the latest updates, edited in place."""
+    
+    cursor = ""
+    
+    def _text(self) -> str:
+        return "\n".join(f"⏳ {message}" for message in self._parts[-PROGRESS_MAX_LINES:])
+
 
 class TelegramBot:
     """Telegram bot interface for vendor evaluation agent."""
     
+    __slots__ = ("token", "orchestrator", "app")
+    
     def __init__(self, evaluation_orchestrator):
         """
         Initialize Telegram bot.
@@ -66,9 +290,15 @@ class TelegramBot:
                 SCALE: [MessageHandler(filters.TEXT & ~filters.COMMAND, self.receive_scale)],
                 PRIORITIES: [MessageHandler(filters.TEXT & ~filters.COMMAND, self.receive_priorities)],
                 COMPLIANCE: [MessageHandler(filters.TEXT & ~filters.COMMAND, self.receive_compliance)],
-                CONFIRM: [CallbackQueryHandler(self.confirm_evaluation)]
+                # Non-blocking so /cancel (and other chats) are handled mid-evaluation
+                CONFIRM: [CallbackQueryHandler(self.confirm_evaluation, block=False)],
+                ConversationHandler.WAITING: [CommandHandler("cancel", self.cancel_command)],
+                ConversationHandler.TIMEOUT: [TypeHandler(Update, self.timeout_conversation)]
             },
-            fallbacks=[CommandHandler("cancel", self.cancel_command)]
+            fallbacks=[CommandHandler("cancel", self.cancel_command)],
+            conversation_timeout=CONVERSATION_TIMEOUT,
+            name="evaluate",
+            persistent=False
         )
         self.app.add_handler(eval_handler)
         
@@ -80,37 +310,11 @@ class TelegramBot:
     
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command."""
-        welcome_message = """
-👋 **Welcome to the Adaptive Vendor Evaluation Agent!**
-
-I'm an intelligent evaluation system powered by SOUL.md and OpenClaw. I don't just compare vendors—I adapt my evaluation criteria based on discoveries during research.
-
-**What makes me different:**
-✅ Dynamic criteria re-weighting based on findings
-✅ Deep research (GitHub, status pages, community sentiment)
-✅ Hidden risk detection (maintainer churn, pricing traps)
-✅ Context-aware recommendations
-
-**Commands:**
-/evaluate - Start a new vendor evaluation
-/example - See an example evaluation
-/help - Get help
-
-Ready to find the best vendor for your needs? Use /evaluate to begin!
-        """
-        await update.message.reply_text(welcome_message, parse_mode="Markdown")
+        await update.message.reply_text(_WELCOME_MSG, parse_mode="Markdown")
     
     async def evaluate_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /evaluate command - start evaluation flow."""
-        await update.message.reply_text(
-            "🔍 **Let's evaluate some vendors!**\n\n"
-            "I'll ask you a few questions to understand your needs.\n\n"
-            "**Step 1/7: Category**\n"
-            "What type of vendor are you looking for?\n"
-            "Examples: payment gateway, observability platform, CRM, database, etc.\n\n"
-            "Type /cancel anytime to stop.",
-            parse_mode="Markdown"
-        )
+        await update.message.reply_text(_EVALUATE_PROMPT, parse_mode="Markdown")
         return CATEGORY
     
     async def receive_category(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -130,7 +334,7 @@ Ready to find the best vendor for your needs? Use /evaluate to begin!
     
     async def receive_tech_stack(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Receive tech stack input."""
-        tech_stack = [t.strip() for t in update.message.text.split(",")]
+        tech_stack = _parse_csv(update.message.text)
         context.user_data["tech_stack"] = tech_stack
         
         await update.message.reply_text(
@@ -187,7 +391,7 @@ Ready to find the best vendor for your needs? Use /evaluate to begin!
     
     async def receive_priorities(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Receive priorities input."""
-        priorities = [p.strip() for p in update.message.text.split(",")]
+        priorities = _parse_csv(update.message.text)
         context.user_data["priorities"] = priorities
         
         await update.message.reply_text(
@@ -207,25 +411,17 @@ Ready to find the best vendor for your needs? Use /evaluate to begin!
         if compliance_text == "none" or not compliance_text:
             compliance = []
         else:
-            compliance = [c.strip() for c in compliance_text.split(",")]
+            compliance = _parse_csv(compliance_text)
         
         context.user_data["compliance"] = compliance
         
         # Show summary and confirm
         summary = self._format_summary(context.user_data)
         
-        keyboard = [
-            [
-                InlineKeyboardButton("✅ Start Evaluation", callback_data="confirm_yes"),
-                InlineKeyboardButton("❌ Cancel", callback_data="confirm_no")
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
         await update.message.reply_text(
             f"📋 **Evaluation Summary**\n\n{summary}\n\n"
             "Ready to start? This will take ~3-4 minutes.",
-            reply_markup=reply_markup,
+            reply_markup=_CONFIRM_KEYBOARD,
             parse_mode="Markdown"
         )
         return CONFIRM
@@ -249,16 +445,38 @@ Ready to find the best vendor for your needs? Use /evaluate to begin!
                 "compliance": context.user_data.get("compliance", [])
             }
             
-            # Run evaluation
+            # Run evaluation as a task so /cancel can stop it
+            progress = ProgressReply(query.message)
+            draft = StreamingReply(query.message)
+            task = asyncio.create_task(self.orchestrator.run_evaluation(
+                eval_context,
+                progress_callback=progress.append,
+                stream_callback=draft.append
+            ))
+            context.user_data["evaluation_task"] = task
+            
             try:
-                recommendation = await self.orchestrator.run_evaluation(
-                    eval_context,
-                    progress_callback=lambda msg: self._send_progress(query, msg)
-                )
+                recommendation = await task
+                await progress.finish()
+                await draft.finish()
                 
                 # Send final recommendation
                 await self._send_recommendation(query, recommendation)
             
+            except asyncio.CancelledError:
+                if context.user_data.get("evaluation_task") is task:
+                    # Not cancelled by the user (e.g. shutdown)
+                    raise
+                logger.info("Evaluation cancelled by user")
+            
+            except CircuitOpenError:
+                # The AI service is failing; don't invite an immediate retry storm
+                logger.warning("Evaluation rejected: AI service circuit open")
+                await query.message.reply_text(
+                    "⏳ **Temporarily unavailable**\n\n"
+                    "Our AI provider is having trouble right now. Please try again in a minute."
+                )
+            
             except Exception as e:
                 logger.error(f"Evaluation failed: {str(e)}", exc_info=True)
                 await query.message.reply_text(
@@ -266,6 +484,11 @@ Ready to find the best vendor for your needs? Use /evaluate to begin!
                     "Please try again or contact support."
                 )
             
+            finally:
+                await progress.finish()
+                if context.user_data.get("evaluation_task") is task:
+                    del context.user_data["evaluation_task"]
+            
             return ConversationHandler.END
         else:
             await query.edit_message_text("❌ Evaluation cancelled. Use /evaluate to start again.")
@@ -273,98 +496,28 @@ Ready to find the best vendor for your needs? Use /evaluate to begin!
     
     async def cancel_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /cancel command."""
+        task = context.user_data.pop("evaluation_task", None)
+        if task is not None and not task.done():
+            task.cancel()
+        
         await update.message.reply_text("❌ Evaluation cancelled. Use /evaluate to start a new one.")
         return ConversationHandler.END
     
+    async def timeout_conversation(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle an evaluation flow abandoned for CONVERSATION_TIMEOUT seconds."""
+        context.user_data.clear()
+        if update.effective_message:
+            await update.effective_message.reply_text(
+                "⌛ Your session expired. Use /evaluate to start again."
+            )
+    
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command."""
-        help_text = """
-**Adaptive Vendor Evaluation Agent - Help**
-
-**Commands:**
-/evaluate - Start a new vendor evaluation
-/example - See an example evaluation
-/help - Show this help message
-/cancel - Cancel current evaluation
-
-**How it works:**
-1. Tell me what you're looking for (category)
-2. Provide context (tech stack, domain, scale, etc.)
-3. I identify relevant vendor candidates
-4. I research each across multiple dimensions
-5. I dynamically adjust evaluation criteria based on findings
-6. I deliver a detailed recommendation with reasoning
-
-**What makes me adaptive?**
-- I don't use fixed criteria weights
-- Discoveries reshape my evaluation (e.g., finding outages increases uptime weight)
-- I detect hidden risks (maintainer churn, pricing traps)
-- I provide context-specific recommendations
-
-**Example evaluation request:**
-Category: Payment Gateway
-Tech Stack: Golang, AWS
-Domain: Fintech
-Region: India
-Scale: Startup (10K transactions/month)
-Priorities: Security, RBI compliance, ease of integration
-Compliance: PCI-DSS, RBI
-
-Questions? Just ask!
-        """
-        await update.message.reply_text(help_text, parse_mode="Markdown")
+        await update.message.reply_text(_HELP_MSG, parse_mode="Markdown")
     
     async def example_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /example command - show example evaluation."""
-        example_text = """
-**Example: Payment Gateway Evaluation for Indian Fintech Startup**
-
-**Context:**
-• Category: Payment Gateway
-• Tech Stack: Golang, Python, AWS
-• Domain: Fintech
-• Region: India
-• Scale: Early-stage (1K → 100K transactions/month)
-• Priorities: RBI compliance, ease of integration, uptime
-
-**Candidates Identified:**
-1. Stripe - Global leader
-2. Razorpay - India-focused
-3. Cashfree - Local alternative
-4. PayPal - Established player
-
-**Key Discoveries:**
-🔍 Discovery 1: Razorpay has native RBI compliance & local support
-→ Increased "Compliance" weight 20% → 30%
-
-🔍 Discovery 2: Stripe India had 2-hour outage last month
-→ Increased "Uptime" weight 15% → 25%
-→ Triggered deeper SLA investigation
-
-**Final Weights (After Adjustments):**
-Compliance: 30% (was 20%)
-Uptime: 25% (was 15%)
-Integration: 20% (was 15%)
-Support: 15% (unchanged)
-Pricing: 10% (unchanged)
-
-**Recommendation: Razorpay**
-
-**Why:**
-• Native RBI compliance (critical for fintech)
-• Strong local support team (12hr vs Stripe's 24hr)
-• Golang SDK officially supported
-• 99.95% uptime (no recent incidents)
-
-**Trade-offs:**
-❌ Less global reach than Stripe
-❌ Fewer advanced features
-
-**Alternative:** If you expand globally → Switch to Stripe
-
-Use /evaluate to start your own evaluation!
-        """
-        await update.message.reply_text(example_text, parse_mode="Markdown")
+        await update.message.reply_text(_EXAMPLE_MSG, parse_mode="Markdown")
     
     def _format_summary(self, user_data: Dict) -> str:
         """Format evaluation summary."""
@@ -383,21 +536,10 @@ Use /evaluate to start your own evaluation!
         
         return "\n".join(lines)
     
-    async def _send_progress(self, query, message: str):
-        """Send progress update to user."""
-        try:
-            await query.message.reply_text(f"⏳ {message}")
-        except Exception as e:
-            logger.warning(f"Failed to send progress update: {str(e)}")
-    
     async def _send_recommendation(self, query, recommendation):
         """Send final recommendation to user."""
-        # Import here to avoid circular dependency
-        from agents.synthesizer import RecommendationSynthesizer
-        
         # Format recommendation as markdown
-        synthesizer = RecommendationSynthesizer(None)
-        markdown_report = synthesizer.format_as_markdown(recommendation)
+        markdown_report = format_as_markdown(recommendation)
         
         # Telegram has message length limits, so split if needed
         max_length = 4000
@@ -421,17 +563,20 @@ Use /evaluate to start your own evaluation!
     def _split_message(self, text: str, max_length: int) -> list:
         """Split long message into chunks."""
         chunks = []
-        current_chunk = ""
+        current_lines = []
+        current_len = 0
         
+        # Join once per chunk; repeated str += is quadratic on long reports
         for line in text.split("\n"):
-            if len(current_chunk) + len(line) + 1 > max_length:
-                chunks.append(current_chunk)
-                current_chunk = line + "\n"
-            else:
-                current_chunk += line + "\n"
+            if current_lines and current_len + len(line) + 1 > max_length:
+                chunks.append("\n".join(current_lines))
+                current_lines = []
+                current_len = 0
+            current_lines.append(line)
+            current_len += len(line) + 1
         
-        if current_chunk:
-            chunks.append(current_chunk)
+        if current_lines:
+            chunks.append("\n".join(current_lines))
         
         return chunks
     
@@ -11,6 +11,7 @@ import signal
 import sys
 import os
 from utils.logger import setup_logging, get_logger
+from utils.event_loop import enable_eager_tasks, install_fast_event_loop
 
 logger = get_logger(__name__)
 
@@ -35,18 +36,20 @@ if IS_OPENCLAW:
 # Standalone Application Mode
 # ============================================================
 else:
-    from orchestrator import EvaluationOrchestrator
+    from orchestrator import create_orchestrator
     from interfaces.telegram_bot import TelegramBot
 
 
     class Application:
         """Main application."""
         
+        __slots__ = ("orchestrator", "bot", "_stop_event")
+        
         def __init__(self):
             """Initialize application."""
             self.orchestrator = None
             self.bot = None
-            self.running = False
+            self._stop_event = asyncio.Event()
         
         async def start(self):
             """Start the application."""
@@ -58,14 +61,13 @@ else:
             try:
                 # Initialize orchestrator
                 logger.info("Initializing evaluation orchestrator...")
-                self.orchestrator = EvaluationOrchestrator()
+                self.orchestrator = await create_orchestrator()
                 
                 # Initialize Telegram bot
                 logger.info("Initializing Telegram bot...")
                 self.bot = TelegramBot(self.orchestrator)
                 
                 # Start bot
-                self.running = True
                 logger.info("Starting bot...")
                 await self.bot.run()
                 
@@ -74,9 +76,8 @@ else:
                 logger.info("Send /start to your Telegram bot to begin")
                 logger.info("="*60)
                 
-                # Keep running
-                while self.running:
-                    await asyncio.sleep(1)
+                # Keep running until a termination signal arrives
+                await self._stop_event.wait()
             
             except KeyboardInterrupt:
                 logger.info("Received interrupt signal")
@@ -89,7 +90,6 @@ else:
         async def stop(self):
             """Stop the application."""
             logger.info("Stopping application...")
-            self.running = False
             
             if self.bot:
                 await self.bot.stop()
@@ -102,13 +102,15 @@ else:
         def handle_signal(self, sig, frame):
             """Handle termination signals."""
             logger.info(f"Received signal {sig}")
-            self.running = False
+            # Signal handlers can't touch asyncio state directly
+            asyncio.get_event_loop().call_soon_threadsafe(self._stop_event.set)
 
 
     async def main():
         """Main entry point."""
         # Setup logging
         setup_logging()
+        enable_eager_tasks()
         
         # Create application
         app = Application()
@@ -127,6 +129,7 @@ if __name__ == "__main__":
         logger.info("Import it in OpenClaw rather than running directly.")
         sys.exit(0)
     else:
+        install_fast_event_loop()
         try:
             asyncio.run(main())
         except KeyboardInterrupt:
@@ -6,28 +6,49 @@ Main coordination logic that ties all agents together.
 import logging
 from typing import Dict, Optional, Callable
 import asyncio
-from agents.candidate_identifier import CandidateIdentifier
+from agents.candidate_identifier import CandidateIdentifier, _load_soul
 from agents.researcher import MultiCriteriaResearcher
 from agents.weight_adjuster import DynamicWeightAdjuster
 from agents.synthesizer import RecommendationSynthesizer, FinalRecommendation
-from integrations.clawhub import ClawHubClient
-from integrations.openai_client import OpenAIClient
+from integrations.clawhub import ClawHubClient, close_shared_session
+from integrations.openai_client import BatchAPIClient, close_shared_http_client, create_openai_client
+from utils.llm_cache import CachedOpenAIClient
+from config import config
 
 logger = logging.getLogger(__name__)
 
+LOG_SEPARATOR = "=" * 60
+
 
 class EvaluationOrchestrator:
     """Orchestrates the entire evaluation process across all agents."""
     
-    def __init__(self):
-        """Initialize orchestrator and all agents."""
+    def __init__(self, batch_mode: bool = False):
+        """
+        Initialize orchestrator and all agents.
+        
+        Args:
+            batch_mode: Send completions through the OpenAI Batch API (half
+                the cost, minutes of extra latency); for non-interactive runs
+        """
         # Initialize integration clients
         self.clawhub = ClawHubClient()
-        self.openai = OpenAIClient()
+        openai_client = create_openai_client()
+        if batch_mode:
+            openai_client = BatchAPIClient(openai_client)
+        # Low-temperature (deterministic) completions are served from one
+        # shared cache for every agent; creative calls pass straight through
+        self.openai = CachedOpenAIClient(openai_client)
         
         # Initialize agents (Logic Layer)
         self.candidate_identifier = CandidateIdentifier(self.clawhub, self.openai)
-        self.researcher = MultiCriteriaResearcher(self.clawhub, self.openai)
+        # Batch jobs can take far longer than the realtime research timeout;
+        # each batch wait is bounded by the client instead
+        self.researcher = MultiCriteriaResearcher(
+            self.clawhub,
+            self.openai,
+            research_timeout=None if batch_mode else config.agent.research_timeout
+        )
         self.weight_adjuster = DynamicWeightAdjuster(self.openai)
         self.synthesizer = RecommendationSynthesizer(self.openai)
         
@@ -36,7 +57,8 @@ class EvaluationOrchestrator:
     async def run_evaluation(
         self,
         context: Dict[str, any],
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        stream_callback: Optional[Callable] = None
     ) -> FinalRecommendation:
         """
         Run complete vendor evaluation process.
@@ -51,47 +73,60 @@ class EvaluationOrchestrator:
                 - priorities: List of priorities
                 - compliance: List of compliance requirements
             progress_callback: Optional callback for progress updates
+            stream_callback: Optional callback receiving the recommendation
+                text piece by piece as the model writes it
         
         Returns:
             FinalRecommendation object
         """
-        logger.info("="*60)
-        logger.info("Starting vendor evaluation")
-        logger.info(f"Category: {context.get('category')}")
-        logger.info(f"Context: {context}")
-        logger.info("="*60)
+        logger.info("%s\nStarting vendor evaluation\nCategory: %s\n%s", LOG_SEPARATOR, context.get("category"), LOG_SEPARATOR)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Context: %r", context)
+        
+        # Progress messages are queued and delivered by a background task, so
+        # a slow receiver never holds up the evaluation
+        progress: Optional[asyncio.Queue] = None
+        drainer: Optional[asyncio.Task] = None
+        if progress_callback:
+            progress = asyncio.Queue()
+            drainer = asyncio.create_task(self._drain_progress(progress, progress_callback))
+        
+        async def on_vendor(vendor: str):
+            self._progress(progress, f"✍️ Leaning towards {vendor}, writing up the rationale...")
         
         try:
             # Phase 1: Candidate Identification (30 min)
-            await self._progress(progress_callback, "🔍 Identifying vendor candidates...")
+            self._progress(progress, "🔍 Identifying vendor candidates...")
             candidates = await self.candidate_identifier.identify_candidates(
                 category=context["category"],
                 context=context
             )
             
             candidate_names = [c.name for c in candidates]
-            logger.info(f"Identified candidates: {candidate_names}")
-            await self._progress(
-                progress_callback,
+            logger.info("Identified candidates: %s", candidate_names)
+            self._progress(
+                progress,
                 f"✅ Found {len(candidates)} candidates: {', '.join(candidate_names)}"
             )
             
+            # Initial weights depend only on the context, so they are settled
+            # before research rather than on the path between Phases 2 and 3
+            initial_weights = self.weight_adjuster.get_initial_weights(context)
+            
             # Phase 2: Multi-Criteria Research (1 hr)
-            await self._progress(progress_callback, "🔬 Researching candidates (deep analysis)...")
+            self._progress(progress, "🔬 Researching candidates (deep analysis)...")
             research_findings = await self.researcher.research_candidates(
                 candidates=candidates,
                 context=context
             )
-            logger.info(f"Research completed for {len(research_findings)} candidates")
-            await self._progress(
-                progress_callback,
+            logger.info("Research completed for %d candidates", len(research_findings))
+            self._progress(
+                progress,
                 f"✅ Research complete! Analyzed {len(research_findings)} vendors across 10+ dimensions"
             )
             
             # Phase 3: Dynamic Weight Adjustment (45 min)
-            await self._progress(progress_callback, "⚖️ Adjusting evaluation criteria based on discoveries...")
-            initial_weights = self.weight_adjuster.get_initial_weights(context)
-            
+            self._progress(progress, "⚖️ Adjusting evaluation criteria based on discoveries...")
             final_weights, weight_adjustments = await self.weight_adjuster.adjust_weights(
                 initial_weights=initial_weights,
                 research_findings=research_findings,
@@ -99,60 +134,84 @@ class EvaluationOrchestrator:
             )
             
             if weight_adjustments:
-                logger.info(f"Applied {len(weight_adjustments)} weight adjustments")
-                await self._progress(
-                    progress_callback,
+                logger.info("Applied %d weight adjustments", len(weight_adjustments))
+                self._progress(
+                    progress,
                     f"✅ Adapted criteria! Made {len(weight_adjustments)} adjustments based on discoveries"
                 )
             else:
                 logger.info("No weight adjustments made")
-                await self._progress(progress_callback, "✅ Criteria weights finalized")
+                self._progress(progress, "✅ Criteria weights finalized")
             
             # Phase 4: Recommendation Synthesis (30 min)
-            await self._progress(progress_callback, "📊 Synthesizing final recommendation...")
+            self._progress(progress, "📊 Synthesizing final recommendation...")
             recommendation = await self.synthesizer.synthesize_recommendation(
                 context=context,
                 candidates=candidate_names,
                 research_findings=research_findings,
                 initial_weights=initial_weights,
                 final_weights=final_weights,
-                weight_adjustments=weight_adjustments
+                weight_adjustments=weight_adjustments,
+                on_vendor=on_vendor,
+                on_chunk=stream_callback
             )
             
-            logger.info(f"Recommendation: {recommendation.recommended_vendor}")
-            await self._progress(
-                progress_callback,
+            logger.info("Recommendation: %s", recommendation.recommended_vendor)
+            self._progress(
+                progress,
                 f"✅ Recommendation ready! Best fit: {recommendation.recommended_vendor}"
             )
             
-            logger.info("="*60)
-            logger.info("Evaluation completed successfully")
-            logger.info("="*60)
+            logger.info("%s\nEvaluation completed successfully\n%s", LOG_SEPARATOR, LOG_SEPARATOR)
             
             return recommendation
         
         except Exception as e:
-            logger.error(f"Evaluation failed: {str(e)}", exc_info=True)
-            await self._progress(progress_callback, f"❌ Evaluation failed: {str(e)}")
+            logger.error("Evaluation failed: %s", e, exc_info=True)
+            self._progress(progress, f"❌ Evaluation failed: {str(e)}")
             raise
+        
+        finally:
+            if drainer is not None:
+                # Deliver what is queued, then stop
+                progress.put_nowait(None)
+                await drainer
     
-    async def _progress(self, callback: Optional[Callable], message: str):
-        """Send progress update via callback."""
-        logger.info(f"Progress: {message}")
-        if callback:
+    def _progress(self, queue: Optional[asyncio.Queue], message: str):
+        """Queue a progress update for the callback (if any)."""
+        logger.info("Progress: %s", message)
+        if queue is not None:
+            queue.put_nowait(message)
+    
+    async def _drain_progress(self, queue: asyncio.Queue, callback: Callable):
+        """Deliver queued progress updates to the callback until None arrives."""
+        while True:
+            message = await queue.get()
+            if message is None:
+                return
             try:
                 await callback(message)
             except Exception as e:
-                logger.warning(f"Progress callback failed: {str(e)}")
+                logger.warning("Progress callback failed: %s", e)
     
     async def close(self):
         """Cleanup resources."""
         logger.info("Closing orchestrator resources")
-        # ClawHub session cleanup if needed
-        if hasattr(self.clawhub, 'session') and self.clawhub.session:
-            await self.clawhub.session.close()
+        # Pooled connections shared by all ClawHub clients
+        await close_shared_session()
+        # Pooled connections shared by all OpenAI clients
+        await close_shared_http_client()
 
 
-async def create_orchestrator() -> EvaluationOrchestrator:
-    """Create and initialize orchestrator."""
-    return EvaluationOrchestrator()
+async def create_orchestrator(batch_mode: bool = False) -> EvaluationOrchestrator:
+    """
+    Create and initialize orchestrator.
+    
+    SOUL.md is read on a worker thread first so agent construction only
+    hits the in-memory cache and never blocks the event loop on disk IO.
+    
+    Args:
+        batch_mode: Route completions through the OpenAI Batch API
+    """
+    await asyncio.to_thread(_load_soul)
+    return EvaluationOrchestrator(batch_mode=batch_mode)
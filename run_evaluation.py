@@ -11,24 +11,29 @@ import os
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from orchestrator import EvaluationOrchestrator
 from config import config
-from utils.query_parser import QueryParser
-import json
+from utils.event_loop import enable_eager_tasks, install_fast_event_loop
 
 
-async def run_evaluation(query: str):
+async def run_evaluation(query: str, batch_mode: bool = False):
     """Run evaluation from command line."""
-    print(f"🚀 Starting evaluation for: {query}\n")
-    print("⏳ This will take 3-4 minutes...\n")
-    
-    # Verify API key is configured
+    # Verify API key is configured before paying for the heavy imports
     if not config.openai.api_key:
         raise ValueError("OPENAI_API_KEY not set in environment. Please check .env file.")
     
+    from orchestrator import create_orchestrator
+    from utils.query_parser import get_query_parser
+    
+    enable_eager_tasks()
+    print(f"🚀 Starting evaluation for: {query}\n")
+    if batch_mode:
+        print("⏳ Batch mode: half the API cost, but this can take much longer...\n")
+    else:
+        print("⏳ This will take 3-4 minutes...\n")
+    
     # Parse query into structured context
     print("📝 Parsing query...\n")
-    parser = QueryParser()
+    parser = get_query_parser()
     context = await parser.parse_query(query)
     
     print(f"   Category: {context.get('category')}")
@@ -37,11 +42,14 @@ async def run_evaluation(query: str):
     print(f"   Domain: {context.get('domain')}\n")
     
     # Create orchestrator (uses config from environment)
-    orchestrator = EvaluationOrchestrator()
+    orchestrator = await create_orchestrator(batch_mode=batch_mode)
+    
+    async def print_progress(message: str):
+        print(f"   {message}", flush=True)
     
     try:
-        # Run evaluation with parsed context
-        result = await orchestrator.run_evaluation(context)
+        # Run evaluation with parsed context, printing each phase as it happens
+        result = await orchestrator.run_evaluation(context, progress_callback=print_progress)
         
         # Format output
         print("\n" + "="*80)
@@ -98,17 +106,22 @@ async def run_evaluation(query: str):
         import traceback
         traceback.print_exc()
         return None
+    
+    finally:
+        await orchestrator.close()
 
 
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(description='Run vendor evaluation')
     parser.add_argument('--query', required=True, help='Evaluation query')
+    parser.add_argument('--batch', action='store_true', help='Use the OpenAI Batch API (cheaper, slower)')
     
     args = parser.parse_args()
     
     # Run evaluation
-    result = asyncio.run(run_evaluation(args.query))
+    install_fast_event_loop()
+    result = asyncio.run(run_evaluation(args.query, batch_mode=args.batch))
     
     # Exit with appropriate code
     sys.exit(0 if result else 1)
@@ -7,18 +7,80 @@ import asyncio
 import logging
 import os
 import json
+import re
 from typing import Dict, Any, Optional
-from datetime import datetime
+from itertools import chain
 
 # Import our evaluation components
-from orchestrator import EvaluationOrchestrator
+from orchestrator import EvaluationOrchestrator, create_orchestrator
+from agents.candidate_identifier import DEFAULT_SOUL_CONTEXT, _load_soul
 from agents.synthesizer import RecommendationSynthesizer
+from utils.keyword_scan import scan_keywords
+from utils.llm_cache import LLMCache
 
 logger = logging.getLogger(__name__)
 
+# Intent triggers, scanned in one pass; when several match, the first intent
+# in INTENT_PRIORITY wins
+_INTENT_RE = re.compile(
+    r"(?P<help>help|how to|what can you)"
+    r"|(?P<evaluate>evaluate)"
+    r"|(?P<compare>^compare| vs | versus )"
+    r"|(?P<research>^research|^analyze)"
+)
+INTENT_PRIORITY = ("help", "evaluate", "compare", "research")
+
+# Keyword tables for context extraction, in priority order (the first hit
+# wins for single-valued fields); matching is by substring
+CATEGORY_KEYWORDS = (
+    "payment gateway", "crm", "database", "observability", "monitoring",
+    "analytics", "cdn", "cms", "email service", "hosting", "storage",
+    "authentication", "messaging", "video", "search", "cache"
+)
+TECH_KEYWORDS = (
+    "python", "golang", "go", "javascript", "java", "ruby", "php",
+    "aws", "azure", "gcp", "kubernetes", "docker", "react", "vue"
+)
+DOMAIN_KEYWORDS = ("fintech", "e-commerce", "healthcare", "saas", "enterprise", "startup")
+REGION_KEYWORDS = ("india", "us", "usa", "europe", "asia", "global")
+SCALE_KEYWORDS = {
+    "startup": ("startup", "early stage"),
+    "enterprise": ("enterprise", "large scale")
+}
+PRIORITY_KEYWORDS = {
+    "security": ("security", "secure"),
+    "uptime": ("uptime", "reliability"),
+    "cost-effective": ("cost", "cheap", "affordable"),
+    "easy integration": ("integration", "easy to integrate")
+}
+COMPLIANCE_KEYWORDS = {
+    "PCI-DSS": ("pci", "pci-dss"),
+    "SOC2": ("soc2", "soc 2"),
+    "HIPAA": ("hipaa",),
+    "RBI": ("rbi",)
+}
+# Common vendor names
+VENDOR_KEYWORDS = (
+    "stripe", "razorpay", "paypal", "square", "adyen",
+    "salesforce", "hubspot", "zoho", "pipedrive",
+    "datadog", "new relic", "grafana", "prometheus",
+    "aws", "azure", "gcp", "digitalocean", "heroku"
+)
+_CONTEXT_KEYWORDS = tuple(dict.fromkeys(chain(
+    CATEGORY_KEYWORDS,
+    TECH_KEYWORDS,
+    DOMAIN_KEYWORDS,
+    REGION_KEYWORDS,
+    *SCALE_KEYWORDS.values(),
+    *PRIORITY_KEYWORDS.values(),
+    *COMPLIANCE_KEYWORDS.values()
+)))
+
 # Global orchestrator instance
 _orchestrator: Optional[EvaluationOrchestrator] = None
-_conversation_states: Dict[str, Dict] = {}
+# In-progress evaluation conversations by session; abandoned ones expire
+# after 30 minutes without a message, and the oldest are evicted beyond 10k
+_conversation_states = LLMCache(max_size=10000, ttl=1800.0)
 
 
 async def initialize():
@@ -40,15 +102,14 @@ async def initialize():
             return False
         
         # Initialize orchestrator
-        _orchestrator = EvaluationOrchestrator()
+        _orchestrator = await create_orchestrator()
         logger.info("✅ Orchestrator initialized")
         
         # Load SOUL.md
-        try:
-            with open("SOUL.md", "r") as f:
-                soul_content = f.read()
+        # Warms the per-process cache the candidate identifier reads from
+        if _load_soul() is not DEFAULT_SOUL_CONTEXT:
             logger.info("✅ SOUL.md loaded")
-        except FileNotFoundError:
+        else:
             logger.warning("⚠️  SOUL.md not found, agent personality may be limited")
         
         logger.info("=" * 60)
@@ -122,15 +183,14 @@ async def _handle_evaluation(message: str, session_id: str, context: Dict) -> st
     """Handle full vendor evaluation request."""
     global _conversation_states, _orchestrator
     
-    # Get or create conversation state
-    if session_id not in _conversation_states:
-        _conversation_states[session_id] = {
+    # Get or create conversation state (storing it again restarts its TTL)
+    state = await _conversation_states.get(session_id)
+    if state is None:
+        state = {
             "stage": "gathering",
-            "data": {},
-            "started_at": datetime.now().isoformat()
+            "data": {}
         }
-    
-    state = _conversation_states[session_id]
+    await _conversation_states.set(session_id, state)
     
     # Extract context from message
     extracted = _extract_evaluation_context(message)
@@ -146,13 +206,12 @@ async def _handle_evaluation(message: str, session_id: str, context: Dict) -> st
     
     # We have enough info - run evaluation
     try:
-        response = "🚀 **Starting Evaluation**\n\n"
-        response += f"Category: {state['data']['category']}\n"
+        parts = ["🚀 **Starting Evaluation**\n\n", f"Category: {state['data']['category']}\n"]
         if state["data"].get("tech_stack"):
-            response += f"Tech Stack: {', '.join(state['data']['tech_stack'])}\n"
+            parts.append(f"Tech Stack: {', '.join(state['data']['tech_stack'])}\n")
         if state["data"].get("domain"):
-            response += f"Domain: {state['data']['domain']}\n"
-        response += "\n⏳ This will take ~3-4 minutes. Analyzing vendors...\n"
+            parts.append(f"Domain: {state['data']['domain']}\n")
+        parts.append("\n⏳ This will take ~3-4 minutes. Analyzing vendors...\n")
         
         # Send initial response (OpenClaw should support streaming)
         # For now, we'll do a single comprehensive response
@@ -174,9 +233,11 @@ async def _handle_evaluation(message: str, session_id: str, context: Dict) -> st
         formatted = _format_recommendation_for_chat(recommendation)
         
         # Clear conversation state
-        del _conversation_states[session_id]
+        await _conversation_states.delete(session_id)
         
-        return response + "\n" + formatted
+        parts.append("\n")
+        parts.append(formatted)
+        return "".join(parts)
     
     except Exception as e:
         logger.error(f"Evaluation failed: {str(e)}", exc_info=True)
@@ -236,92 +297,48 @@ What would you like to evaluate?"""
 
 def _parse_intent(message: str) -> str:
     """Parse user intent from message."""
-    msg_lower = message.lower().strip()
-    
-    if any(word in msg_lower for word in ["help", "how to", "what can you"]):
-        return "help"
-    
-    if msg_lower.startswith("evaluate") or "evaluate" in msg_lower:
-        return "evaluate"
-    
-    if msg_lower.startswith("compare") or " vs " in msg_lower or " versus " in msg_lower:
-        return "compare"
-    
-    if msg_lower.startswith("research") or msg_lower.startswith("analyze"):
-        return "research"
-    
-    return "general"
+    intents = {match.lastgroup for match in _INTENT_RE.finditer(message.lower().strip())}
+    return next((intent for intent in INTENT_PRIORITY if intent in intents), "general")
 
 
 def _extract_evaluation_context(message: str) -> Dict[str, Any]:
     """Extract evaluation context from natural language message."""
     context = {}
-    msg_lower = message.lower()
+    # One pass over the message finds every keyword of every table
+    hits = scan_keywords([message], _CONTEXT_KEYWORDS)[0]
     
     # Extract category
-    categories = [
-        "payment gateway", "crm", "database", "observability", "monitoring",
-        "analytics", "cdn", "cms", "email service", "hosting", "storage",
-        "authentication", "messaging", "video", "search", "cache"
-    ]
-    
-    for cat in categories:
-        if cat in msg_lower:
-            context["category"] = cat
-            break
+    category = next((cat for cat in CATEGORY_KEYWORDS if hits[cat]), None)
+    if category:
+        context["category"] = category
     
     # Extract tech stack
-    tech_keywords = ["python", "golang", "go", "javascript", "java", "ruby", "php",
-                     "aws", "azure", "gcp", "kubernetes", "docker", "react", "vue"]
-    found_tech = [tech for tech in tech_keywords if tech in msg_lower]
+    found_tech = [tech for tech in TECH_KEYWORDS if hits[tech]]
     if found_tech:
         context["tech_stack"] = found_tech
     
     # Extract domain
-    domains = ["fintech", "e-commerce", "healthcare", "saas", "enterprise", "startup"]
-    for domain in domains:
-        if domain in msg_lower:
-            context["domain"] = domain
-            break
+    domain = next((domain for domain in DOMAIN_KEYWORDS if hits[domain]), None)
+    if domain:
+        context["domain"] = domain
     
     # Extract region
-    regions = ["india", "us", "usa", "europe", "asia", "global"]
-    for region in regions:
-        if region in msg_lower:
-            context["region"] = region.title()
-            break
+    region = next((region for region in REGION_KEYWORDS if hits[region]), None)
+    if region:
+        context["region"] = region.title()
     
     # Extract scale
-    if "startup" in msg_lower or "early stage" in msg_lower:
-        context["scale"] = "startup"
-    elif "enterprise" in msg_lower or "large scale" in msg_lower:
-        context["scale"] = "enterprise"
+    scale = next((scale for scale, keywords in SCALE_KEYWORDS.items() if any(hits[k] for k in keywords)), None)
+    if scale:
+        context["scale"] = scale
     
     # Extract priorities
-    priorities = []
-    if "security" in msg_lower or "secure" in msg_lower:
-        priorities.append("security")
-    if "uptime" in msg_lower or "reliability" in msg_lower:
-        priorities.append("uptime")
-    if "cost" in msg_lower or "cheap" in msg_lower or "affordable" in msg_lower:
-        priorities.append("cost-effective")
-    if "integration" in msg_lower or "easy to integrate" in msg_lower:
-        priorities.append("easy integration")
-    
+    priorities = [p for p, keywords in PRIORITY_KEYWORDS.items() if any(hits[k] for k in keywords)]
     if priorities:
         context["priorities"] = priorities
     
     # Extract compliance
-    compliance = []
-    if "pci" in msg_lower or "pci-dss" in msg_lower:
-        compliance.append("PCI-DSS")
-    if "soc2" in msg_lower or "soc 2" in msg_lower:
-        compliance.append("SOC2")
-    if "hipaa" in msg_lower:
-        compliance.append("HIPAA")
-    if "rbi" in msg_lower:
-        compliance.append("RBI")
-    
+    compliance = [c for c, keywords in COMPLIANCE_KEYWORDS.items() if any(hits[k] for k in keywords)]
     if compliance:
         context["compliance"] = compliance
     
@@ -330,17 +347,8 @@ def _extract_evaluation_context(message: str) -> Dict[str, Any]:
 
 def _extract_vendor_names(message: str) -> list:
     """Extract vendor names from message."""
-    # Common vendor names
-    vendors = [
-        "stripe", "razorpay", "paypal", "square", "adyen",
-        "salesforce", "hubspot", "zoho", "pipedrive",
-        "datadog", "new relic", "grafana", "prometheus",
-        "aws", "azure", "gcp", "digitalocean", "heroku"
-    ]
-    
-    msg_lower = message.lower()
-    found = [v for v in vendors if v in msg_lower]
-    return found
+    hits = scan_keywords([message], VENDOR_KEYWORDS)[0]
+    return [v for v in VENDOR_KEYWORDS if hits[v]]
 
 
 def _ask_for_missing_info(missing: list, current_data: Dict) -> str:
@@ -364,55 +372,54 @@ Please specify the category."""
 def _format_recommendation_for_chat(recommendation) -> str:
     """Format recommendation for chat display."""
     # Create a concise chat-friendly version
-    msg = "✅ **Evaluation Complete!**\n\n"
+    parts = ["✅ **Evaluation Complete!**\n\n"]
+    add = parts.append
     
     # Candidates
-    msg += f"**Candidates Evaluated:** {', '.join(recommendation.candidates)}\n\n"
+    add(f"**Candidates Evaluated:** {', '.join(recommendation.candidates)}\n\n")
     
     # Key discoveries
     if recommendation.key_discoveries:
-        msg += "**🔍 Key Discoveries:**\n"
+        add("**🔍 Key Discoveries:**\n")
         for i, disc in enumerate(recommendation.key_discoveries[:2], 1):
-            msg += f"{i}. {disc['finding']}\n"
-            msg += f"   Impact: {disc['impact']}\n"
-        msg += "\n"
+            add(f"{i}. {disc['finding']}\n")
+            add(f"   Impact: {disc['impact']}\n")
+        add("\n")
     
     # Recommendation
-    msg += f"**🎯 Recommended: {recommendation.recommended_vendor}**\n\n"
-    msg += f"**Why:**\n{recommendation.rationale}\n\n"
+    add(f"**🎯 Recommended: {recommendation.recommended_vendor}**\n\n")
+    add(f"**Why:**\n{recommendation.rationale}\n\n")
     
     # Trade-offs
     if recommendation.trade_offs:
-        msg += "**⚖️ Trade-offs:**\n"
+        add("**⚖️ Trade-offs:**\n")
         for trade in recommendation.trade_offs[:2]:
-            msg += f"• {trade}\n"
-        msg += "\n"
+            add(f"• {trade}\n")
+        add("\n")
     
     # Comparison scores
-    msg += "**📊 Scores:**\n"
+    add("**📊 Scores:**\n")
     for vendor_score in recommendation.vendor_scores[:3]:
-        msg += f"• {vendor_score.vendor_name}: {vendor_score.weighted_score:.1f}/10\n"
+        add(f"• {vendor_score.vendor_name}: {vendor_score.weighted_score:.1f}/10\n")
     
     # Hidden risks
     if recommendation.hidden_risks:
-        msg += f"\n**🚨 Hidden Risks Detected: {len(recommendation.hidden_risks)}**\n"
+        add(f"\n**🚨 Hidden Risks Detected: {len(recommendation.hidden_risks)}**\n")
         for risk in recommendation.hidden_risks[:2]:
-            msg += f"• {risk['vendor']}: {risk['type']}\n"
+            add(f"• {risk['vendor']}: {risk['type']}\n")
     
     # Next steps
     if recommendation.next_steps:
-        msg += "\n**📋 Next Steps:**\n"
+        add("\n**📋 Next Steps:**\n")
         for step in recommendation.next_steps[:3]:
-            msg += f"• {step}\n"
+            add(f"• {step}\n")
     
-    msg += "\n_Full details available in logs_"
+    add("\n_Full details available in logs_")
     
-    return msg
+    return "".join(parts)
 
 
-def _get_help_message() -> str:
-    """Return help message."""
-    return """**🤖 Adaptive Vendor Evaluation Agent**
+_HELP_MSG = """**🤖 Adaptive Vendor Evaluation Agent**
 
 I help you find and compare vendors with intelligent, context-aware analysis.
 
@@ -450,6 +457,11 @@ Priorities: security, compliance
 What would you like to evaluate?"""
 
 
+def _get_help_message() -> str:
+    """Return help message."""
+    return _HELP_MSG
+
+
 # Cleanup function called when OpenClaw unloads the skill
 async def cleanup():
     """Cleanup resources when skill is unloaded."""
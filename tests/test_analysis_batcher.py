@@ -0,0 +1,65 @@
+"""Tests for micro-batching concurrent analysis tasks."""
+
+import asyncio
+import unittest
+
+from utils.analysis_batcher import AnalysisBatcher
+
+
+class AnalysisBatcherTest(unittest.IsolatedAsyncioTestCase):
+    
+    async def asyncSetUp(self):
+        self.batches = []
+    
+    async def upper(self, items):
+        self.batches.append(list(items))
+        return [item.upper() for item in items]
+    
+    async def test_concurrent_items_share_one_batch(self):
+        batcher = AnalysisBatcher(self.upper)
+        
+        results = await asyncio.gather(*(batcher.submit(item) for item in ("a", "b", "c")))
+        
+        self.assertEqual(results, ["A", "B", "C"])
+        self.assertEqual(self.batches, [["a", "b", "c"]])
+    
+    async def test_full_batch_is_sent_without_waiting(self):
+        batcher = AnalysisBatcher(self.upper, window=60.0, max_batch=2)
+        
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("a"), batcher.submit("b")), timeout=1.0
+        )
+        
+        self.assertEqual(results, ["A", "B"])
+    
+    async def test_oversized_input_is_split_into_batches(self):
+        batcher = AnalysisBatcher(self.upper, max_batch=2)
+        
+        await asyncio.gather(*(batcher.submit(item) for item in ("a", "b", "c")))
+        
+        self.assertEqual(self.batches, [["a", "b"], ["c"]])
+    
+    async def test_batch_failure_fails_every_item(self):
+        async def broken(items):
+            raise RuntimeError("model down")
+        
+        batcher = AnalysisBatcher(broken)
+        results = await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+        
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+    
+    async def test_exception_result_fails_only_its_item(self):
+        async def partly_broken(items):
+            return [ValueError(item) if item == "b" else item.upper() for item in items]
+        
+        batcher = AnalysisBatcher(partly_broken)
+        tasks = [asyncio.ensure_future(batcher.submit(item)) for item in ("a", "b", "c")]
+        
+        self.assertEqual(await tasks[0], "A")
+        with self.assertRaises(ValueError):
+            await tasks[1]
+        self.assertEqual(await tasks[2], "C")
+
+
+if __name__ == "__main__":
+    unittest.main()
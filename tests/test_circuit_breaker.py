@@ -0,0 +1,74 @@
+"""Tests for the consecutive-failure circuit breaker."""
+
+import unittest
+from unittest import mock
+
+from utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch("utils.circuit_breaker.time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker("api", failure_threshold=3, timeout_duration=30.0, success_threshold=2)
+    
+    def fail(self, times=1):
+        for _ in range(times):
+            self.breaker.before_call()
+            self.breaker.record_failure()
+    
+    def test_opens_after_consecutive_failures(self):
+        self.fail(2)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.fail()
+        self.assertEqual(self.breaker.state, OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+    
+    def test_success_resets_the_failure_count(self):
+        self.fail(2)
+        self.breaker.before_call()
+        self.breaker.record_success()
+        self.fail(2)
+        self.assertEqual(self.breaker.state, CLOSED)
+    
+    def test_half_open_allows_one_probe_at_a_time(self):
+        self.fail(3)
+        self.now += 30.0
+        self.breaker.before_call()
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+    
+    def test_closes_after_enough_successful_probes(self):
+        self.fail(3)
+        self.now += 30.0
+        for _ in range(2):
+            self.breaker.before_call()
+            self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+    
+    def test_failed_probe_reopens(self):
+        self.fail(3)
+        self.now += 30.0
+        self.fail()
+        self.assertEqual(self.breaker.state, OPEN)
+        self.now += 29.0
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+    
+    def test_release_frees_the_probe_without_counting(self):
+        self.fail(3)
+        self.now += 30.0
+        self.breaker.before_call()
+        self.breaker.release()
+        self.breaker.before_call()
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertEqual(self.breaker.success_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""Tests for the single-pass keyword scanner."""
+
+import unittest
+
+from utils.keyword_scan import scan_keywords
+
+
+class ScanKeywordsTest(unittest.TestCase):
+    
+    def test_hits_are_reported_per_text(self):
+        result = scan_keywords(["Go and Python SDKs", "java only", ""], ["go", "python", "java"])
+        
+        self.assertEqual(result, [
+            {"go": True, "python": True, "java": False},
+            {"go": False, "python": False, "java": True},
+            {"go": False, "python": False, "java": False},
+        ])
+    
+    def test_keyword_inside_a_longer_keyword_is_found(self):
+        result = scan_keywords(["PCI-DSS certified"], ["pci", "pci-dss"])
+        
+        self.assertEqual(result, [{"pci": True, "pci-dss": True}])
+    
+    def test_lowercasing_that_changes_length_keeps_offsets(self):
+        # "İ".lower() is two characters long
+        result = scan_keywords(["İİİİİİİİ stripe", "razorpay"], ["stripe"])
+        
+        self.assertEqual(result, [{"stripe": True}, {"stripe": False}])
+    
+    def test_no_keywords(self):
+        self.assertEqual(scan_keywords(["a", "b"], []), [{}, {}])
+
+
+if __name__ == "__main__":
+    unittest.main()
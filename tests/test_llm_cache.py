@@ -0,0 +1,101 @@
+"""Tests for the in-process LLM response cache."""
+
+import unittest
+from unittest import mock
+
+from utils.llm_cache import CachedOpenAIClient, LLMCache
+
+
+class FakeOpenAIClient:
+    """Records chat_completion calls and answers with a numbered reply."""
+    
+    model = "test-model"
+    
+    def __init__(self):
+        self.calls = []
+    
+    async def chat_completion(self, messages, temperature=None, max_tokens=None, response_format=None):
+        self.calls.append(messages)
+        return f"reply {len(self.calls)}"
+
+
+class LLMCacheTest(unittest.IsolatedAsyncioTestCase):
+    
+    async def test_set_then_get(self):
+        cache = LLMCache()
+        await cache.set("k", "v")
+        self.assertEqual(await cache.get("k"), "v")
+        self.assertIsNone(await cache.get("missing"))
+        self.assertEqual(cache.get_stats(), {"hits": 1, "misses": 1, "size": 1})
+    
+    async def test_evicts_least_recently_used(self):
+        cache = LLMCache(max_size=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+        self.assertEqual(await cache.get("a"), 1)
+        self.assertIsNone(await cache.get("b"))
+        self.assertEqual(await cache.get("c"), 3)
+    
+    async def test_entries_expire_after_ttl(self):
+        cache = LLMCache(ttl=10.0)
+        with mock.patch("utils.llm_cache.time.monotonic", return_value=100.0):
+            await cache.set("k", "v")
+        with mock.patch("utils.llm_cache.time.monotonic", return_value=109.0):
+            self.assertEqual(await cache.get("k"), "v")
+        with mock.patch("utils.llm_cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(await cache.get("k"))
+        self.assertEqual(cache.get_stats()["size"], 0)
+    
+    def test_cache_key_depends_on_every_input(self):
+        messages = [{"role": "user", "content": "hi"}]
+        key = LLMCache.cache_key("m", messages, 0.1)
+        self.assertEqual(key, LLMCache.cache_key("m", [dict(messages[0])], 0.1))
+        self.assertNotEqual(key, LLMCache.cache_key("other", messages, 0.1))
+        self.assertNotEqual(key, LLMCache.cache_key("m", messages, 0.2))
+        self.assertNotEqual(key, LLMCache.cache_key("m", messages, 0.1, {"max_tokens": 5}))
+
+
+class CachedOpenAIClientTest(unittest.IsolatedAsyncioTestCase):
+    
+    async def test_low_temperature_requests_are_cached(self):
+        inner = FakeOpenAIClient()
+        client = CachedOpenAIClient(inner)
+        messages = [{"role": "user", "content": "hi"}]
+        
+        first = await client.chat_completion(messages, temperature=0.1)
+        second = await client.chat_completion(messages, temperature=0.1)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(len(inner.calls), 1)
+        self.assertEqual(client.get_stats()["hits"], 1)
+    
+    async def test_output_settings_are_part_of_the_key(self):
+        inner = FakeOpenAIClient()
+        client = CachedOpenAIClient(inner)
+        messages = [{"role": "user", "content": "hi"}]
+        
+        await client.chat_completion(messages, temperature=0.1, max_tokens=10)
+        await client.chat_completion(messages, temperature=0.1, max_tokens=20)
+        
+        self.assertEqual(len(inner.calls), 2)
+    
+    async def test_high_or_unset_temperature_bypasses_cache(self):
+        inner = FakeOpenAIClient()
+        client = CachedOpenAIClient(inner)
+        messages = [{"role": "user", "content": "hi"}]
+        
+        await client.chat_completion(messages, temperature=0.7)
+        await client.chat_completion(messages, temperature=0.7)
+        await client.chat_completion(messages)
+        
+        self.assertEqual(len(inner.calls), 3)
+        self.assertEqual(client.get_stats()["size"], 0)
+    
+    def test_other_attributes_are_delegated(self):
+        self.assertEqual(CachedOpenAIClient(FakeOpenAIClient()).model, "test-model")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Tests for OpenAIClient's streaming completions."""
+
+import types
+import unittest
+from unittest import mock
+
+from integrations import openai_client
+from integrations.openai_client import OpenAIClient
+from utils.circuit_breaker import CircuitBreaker
+from utils.rate_limiter import RateLimiter
+
+
+def _chunk(text):
+    return types.SimpleNamespace(choices=[types.SimpleNamespace(delta=types.SimpleNamespace(content=text))])
+
+
+class FakeStream:
+    """Async chunk stream that records whether it was closed."""
+    
+    def __init__(self, texts):
+        self.texts = texts
+        self.closed = False
+    
+    async def __aiter__(self):
+        for text in self.texts:
+            yield _chunk(text)
+    
+    async def close(self):
+        self.closed = True
+
+
+class StubOpenAIClient(OpenAIClient):
+    """OpenAIClient whose API client is a stand-in returning FakeStreams."""
+    
+    client = None
+    
+    def __init__(self, texts):
+        self.model = "test-model"
+        self.temperature = 0.0
+        self.max_tokens = 100
+        self.streams = []
+        self.client = types.SimpleNamespace(chat=types.SimpleNamespace(
+            completions=types.SimpleNamespace(create=self._create)
+        ))
+        self._texts = texts
+    
+    async def _create(self, **kwargs):
+        stream = FakeStream(self._texts)
+        self.streams.append(stream)
+        return stream
+
+
+class ChatCompletionStreamTest(unittest.IsolatedAsyncioTestCase):
+    
+    async def asyncSetUp(self):
+        self.breaker = CircuitBreaker("test", failure_threshold=3)
+        for name, value in (("circuit_breaker", self.breaker), ("rate_limiter", RateLimiter(0))):
+            patcher = mock.patch.object(openai_client, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    async def test_full_stream_is_yielded_and_counted_as_success(self):
+        client = StubOpenAIClient(["a", "b", "c"])
+        self.breaker.failure_count = 2
+        
+        chunks = [text async for text in client.chat_completion_stream([])]
+        
+        self.assertEqual(chunks, ["a", "b", "c"])
+        self.assertTrue(client.streams[0].closed)
+        self.assertEqual(self.breaker.failure_count, 0)
+    
+    async def test_early_close_releases_the_stream_at_once(self):
+        client = StubOpenAIClient(["a", "b", "c"])
+        self.breaker.failure_count = 2
+        semaphore = openai_client.get_request_semaphore()
+        slots = semaphore._value
+        
+        stream = client.chat_completion_stream([])
+        self.assertEqual(await stream.__anext__(), "a")
+        await stream.aclose()
+        
+        self.assertTrue(client.streams[0].closed)
+        self.assertEqual(semaphore._value, slots)
+        # Output arrived before the close, so the API counts as healthy
+        self.assertEqual(self.breaker.failure_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""Tests for QueryParser's parsed-context cache."""
+
+import json
+import unittest
+
+from utils.llm_cache import LLMCache
+from utils.query_parser import QueryParser
+
+PARSED = {
+    "category": "payment gateway", "tech_stack": [], "domain": "fintech",
+    "region": "India", "scale": "startup", "priorities": [], "compliance": []
+}
+
+
+class FakeOpenAIClient:
+    """Answers every parse request with the same context and counts calls."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def chat_completion(self, messages, temperature=None, max_tokens=None, response_format=None):
+        self.calls += 1
+        return json.dumps(PARSED)
+
+
+class QueryParserCacheTest(unittest.IsolatedAsyncioTestCase):
+    
+    def make_parser(self, **kwargs):
+        self.openai = FakeOpenAIClient()
+        return QueryParser(openai_client=self.openai, cache=LLMCache(), **kwargs)
+    
+    async def test_equivalent_queries_share_one_parse(self):
+        parser = self.make_parser()
+        
+        first = await parser.parse_query("Payment gateway for an Indian startup")
+        second = await parser.parse_query("indian startup, payment gateway!")
+        
+        self.assertEqual(self.openai.calls, 1)
+        self.assertEqual(second["raw_query"], "indian startup, payment gateway!")
+        self.assertEqual({**first, "raw_query": None}, {**second, "raw_query": None})
+    
+    async def test_cached_context_is_not_shared_by_reference(self):
+        parser = self.make_parser()
+        
+        first = await parser.parse_query("payment gateway for fintech")
+        first["tech_stack"].append("Go")
+        second = await parser.parse_query("payment gateway for fintech")
+        
+        self.assertEqual(second["tech_stack"], [])
+    
+    async def test_different_queries_are_parsed_separately(self):
+        parser = self.make_parser()
+        
+        await parser.parse_query("C payment gateway")
+        await parser.parse_query("C++ payment gateway")
+        
+        self.assertEqual(self.openai.calls, 2)
+    
+    async def test_non_ascii_words_are_part_of_the_key(self):
+        parser = self.make_parser()
+        
+        await parser.parse_query("支付 gateway")
+        await parser.parse_query("认证 gateway")
+        
+        self.assertEqual(self.openai.calls, 2)
+    
+    async def test_stopword_only_queries_are_not_cached(self):
+        parser = self.make_parser()
+        
+        await parser.parse_query("find the best")
+        await parser.parse_query("please evaluate")
+        
+        self.assertEqual(self.openai.calls, 2)
+
+
+class QueryParserFastPathTest(unittest.IsolatedAsyncioTestCase):
+    
+    def make_parser(self, fast_path):
+        self.openai = FakeOpenAIClient()
+        return QueryParser(openai_client=self.openai, cache=LLMCache(), fast_path=fast_path)
+    
+    async def test_confident_keyword_parse_skips_the_llm(self):
+        parser = self.make_parser(fast_path=True)
+        
+        context = await parser.parse_query("payment gateway for a fintech startup in India, PCI-DSS")
+        
+        self.assertEqual(self.openai.calls, 0)
+        self.assertEqual(context["category"], "payment gateway")
+        self.assertEqual(context["region"], "India")
+        self.assertEqual(context["domain"], "fintech")
+        self.assertEqual(parser.get_stats(), {"fast_path_hits": 1, "llm_parses": 0})
+    
+    async def test_category_alone_still_uses_the_llm(self):
+        parser = self.make_parser(fast_path=True)
+        
+        await parser.parse_query("payment gateway")
+        
+        self.assertEqual(self.openai.calls, 1)
+    
+    async def test_disabled_fast_path_always_uses_the_llm(self):
+        parser = self.make_parser(fast_path=False)
+        
+        await parser.parse_query("payment gateway for a fintech startup in India")
+        
+        self.assertEqual(self.openai.calls, 1)
+    
+    def test_region_and_domain_hints_match_whole_words(self):
+        parser = self.make_parser(fast_path=True)
+        
+        business = parser._fallback_parse("payment gateway for a small business")
+        self.assertEqual(business["region"], "Global")
+        self.assertEqual(parser._fallback_parse("payment gateway for us")["region"], "Us")
+        self.assertEqual(parser._fallback_parse("crm for saasy teams")["domain"], "general")
+
+
+if __name__ == "__main__":
+    unittest.main()
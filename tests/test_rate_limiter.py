@@ -0,0 +1,55 @@
+"""Tests for the requests-per-minute token bucket."""
+
+import unittest
+from unittest import mock
+
+from utils.rate_limiter import RateLimiter
+
+
+class RateLimiterTest(unittest.IsolatedAsyncioTestCase):
+    
+    async def asyncSetUp(self):
+        self.now = 0.0
+        self.sleeps = []
+        
+        async def fake_sleep(delay):
+            self.sleeps.append(delay)
+        
+        for target, kwargs in (
+            ("utils.rate_limiter.time.monotonic", {"side_effect": lambda: self.now}),
+            ("utils.rate_limiter.asyncio.sleep", {"new": fake_sleep}),
+        ):
+            patcher = mock.patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    async def test_burst_passes_without_waiting(self):
+        limiter = RateLimiter(rate=60, burst=3)
+        for _ in range(3):
+            await limiter.acquire()
+        self.assertEqual(self.sleeps, [])
+    
+    async def test_requests_beyond_the_burst_are_spaced_out(self):
+        limiter = RateLimiter(rate=60, burst=1)
+        for _ in range(3):
+            await limiter.acquire()
+        self.assertEqual(self.sleeps, [1.0, 2.0])
+    
+    async def test_tokens_refill_while_idle(self):
+        limiter = RateLimiter(rate=60, burst=2)
+        await limiter.acquire()
+        await limiter.acquire()
+        self.now += 2.0
+        await limiter.acquire()
+        await limiter.acquire()
+        self.assertEqual(self.sleeps, [])
+    
+    async def test_zero_rate_disables_limiting(self):
+        limiter = RateLimiter(rate=0, burst=1)
+        for _ in range(5):
+            await limiter.acquire()
+        self.assertEqual(self.sleeps, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
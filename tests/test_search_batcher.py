@@ -0,0 +1,75 @@
+"""Tests for coalescing concurrent web searches into batches."""
+
+import asyncio
+import unittest
+
+from utils.search_batcher import SearchBatcher
+
+
+class FakeClawHub:
+    """Records batch_search calls and returns one result per query."""
+    
+    def __init__(self, fail: bool = False):
+        self.batches = []
+        self.fail = fail
+    
+    async def batch_search(self, queries, num_results=5):
+        self.batches.append((list(queries), num_results))
+        if self.fail:
+            raise RuntimeError("search down")
+        return {query: [{"title": query, "num_results": num_results}] for query in queries}
+
+
+class SearchBatcherTest(unittest.IsolatedAsyncioTestCase):
+    
+    async def test_concurrent_queries_share_one_batch(self):
+        clawhub = FakeClawHub()
+        batcher = SearchBatcher(clawhub)
+        
+        results = await asyncio.gather(batcher.submit("stripe"), batcher.submit("razorpay"))
+        
+        self.assertEqual(clawhub.batches, [(["stripe", "razorpay"], 5)])
+        self.assertEqual([r[0]["title"] for r in results], ["stripe", "razorpay"])
+    
+    async def test_identical_queries_are_searched_once(self):
+        clawhub = FakeClawHub()
+        batcher = SearchBatcher(clawhub)
+        
+        first, second = await asyncio.gather(batcher.submit("stripe"), batcher.submit("stripe"))
+        
+        self.assertEqual(clawhub.batches, [(["stripe"], 5)])
+        self.assertEqual(first, second)
+    
+    async def test_batches_are_split_by_result_count(self):
+        clawhub = FakeClawHub()
+        batcher = SearchBatcher(clawhub, num_results=5)
+        
+        await asyncio.gather(batcher.submit("stripe"), batcher.submit("stripe", num_results=3))
+        
+        self.assertCountEqual(clawhub.batches, [(["stripe"], 5), (["stripe"], 3)])
+    
+    async def test_failure_reaches_every_waiter_and_is_not_remembered(self):
+        clawhub = FakeClawHub(fail=True)
+        batcher = SearchBatcher(clawhub)
+        
+        results = await asyncio.gather(
+            batcher.submit("stripe"), batcher.submit("stripe"), return_exceptions=True
+        )
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+        
+        clawhub.fail = False
+        self.assertEqual((await batcher.submit("stripe"))[0]["title"], "stripe")
+        self.assertEqual(len(clawhub.batches), 2)
+    
+    async def test_finished_searches_are_not_reused(self):
+        clawhub = FakeClawHub()
+        batcher = SearchBatcher(clawhub)
+        
+        await batcher.submit("stripe")
+        await batcher.submit("stripe")
+        
+        self.assertEqual(len(clawhub.batches), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""Tests for ClawHub's tiered search response cache."""
+
+import tempfile
+import unittest
+
+from integrations.clawhub import SearchResponseCache
+from utils.disk_cache import DiskCache
+
+RESULTS = [{"title": "Stripe", "url": "https://stripe.com", "snippet": ""}]
+
+
+class SearchResponseCacheTest(unittest.IsolatedAsyncioTestCase):
+    
+    async def asyncSetUp(self):
+        self.cache = SearchResponseCache()
+        await self.cache.update("Stripe pricing", 5, "web", RESULTS)
+    
+    async def test_exact_query_hits_first_tier(self):
+        self.assertEqual(await self.cache.lookup("stripe  PRICING!", 5, "web"), RESULTS)
+        self.assertEqual(self.cache.get_stats()["exact_hits"], 1)
+    
+    async def test_reordered_words_hit_second_tier(self):
+        self.assertEqual(await self.cache.lookup("pricing stripe stripe", 5, "web"), RESULTS)
+        self.assertEqual(self.cache.get_stats()["near_hits"], 1)
+    
+    async def test_search_type_and_result_count_are_part_of_the_key(self):
+        self.assertIsNone(await self.cache.lookup("Stripe pricing", 10, "web"))
+        self.assertIsNone(await self.cache.lookup("Stripe pricing", 5, "github"))
+    
+    async def test_overlapping_queries_for_other_vendors_miss(self):
+        await self.cache.update("Google Cloud Storage", 5, "web", RESULTS)
+        self.assertIsNone(await self.cache.lookup("Google Cloud SQL", 5, "web"))
+        self.assertIsNone(await self.cache.lookup("Stripe Atlas pricing", 5, "web"))
+        self.assertEqual(self.cache.get_stats()["misses"], 2)
+    
+    async def test_disk_tier_survives_a_new_process_cache(self):
+        with tempfile.TemporaryDirectory() as path:
+            await SearchResponseCache(disk=DiskCache(path)).update("Stripe pricing", 5, "web", RESULTS)
+            fresh = SearchResponseCache(disk=DiskCache(path))
+            
+            self.assertEqual(await fresh.lookup("stripe pricing", 5, "web"), RESULTS)
+            self.assertEqual(await fresh.lookup("stripe pricing", 5, "web"), RESULTS)
+            self.assertEqual(fresh.get_stats()["disk_hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
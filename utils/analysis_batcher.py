@@ -0,0 +1,102 @@
+"""
+Analysis Batcher
+
+Coalesces LLM analysis tasks issued by concurrent research coroutines.
+Tasks submitted within a short window are handed to a batch function
+together, so the ~10 dimension analyses for a candidate (whose searches
+complete in the same search batch) go out as one chat completion instead
+of ten.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BatchFn = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+class AnalysisBatcher:
+    """Micro-batcher in front of a batch coroutine."""
+    
+    def __init__(self, batch_fn: BatchFn, window: float = 0.01, max_batch: int = 10):
+        """
+        Initialize batcher.
+        
+        Args:
+            batch_fn: Coroutine taking a list of items and returning one result
+                per item; an exception in place of a result fails only that item
+            window: Seconds to wait for more items before flushing a batch
+            max_batch: Maximum items per batch call
+        """
+        self.batch_fn = batch_fn
+        self.window = window
+        self.max_batch = max_batch
+        
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: set = set()
+    
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item and wait for its result.
+        
+        Args:
+            item: One task for the batch function
+        
+        Returns:
+            The batch function's result for this item
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Futures are bound to the loop that created them
+            self._loop = loop
+            self._pending = []
+            self._flush_handle = None
+        
+        future = loop.create_future()
+        self._pending.append((item, future))
+        
+        if len(self._pending) >= self.max_batch:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """Send everything queued so far as one batch."""
+        self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        
+        task = asyncio.ensure_future(self._run_batch(batch))
+        # Hold a reference until done so the task is not garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Execute one batch and resolve the waiting futures."""
+        logger.debug(f"Analysis batch: {len(batch)} tasks")
+        
+        try:
+            results = await self.batch_fn([item for item, _ in batch])
+        except Exception as e:
+            logger.warning(f"Analysis batch failed: {str(e)}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,98 @@
+"""
+Circuit Breaker
+
+Fails fast while an upstream service is down. After `failure_threshold`
+consecutive failures the circuit opens and calls are rejected immediately
+for `timeout_duration` seconds; then it goes half-open and lets one probe
+call through at a time. `success_threshold` successful probes close it
+again, and any failed probe re-opens it.
+"""
+
+import logging
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a service whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one upstream service."""
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        timeout_duration: float = 30.0,
+        success_threshold: int = 2
+    ):
+        """
+        Initialize breaker.
+        
+        Args:
+            name: Service name used in logs and errors
+            failure_threshold: Consecutive failures that open the circuit
+            timeout_duration: Seconds to stay open before probing
+            success_threshold: Successful probes needed to close again
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.timeout_duration = timeout_duration
+        self.success_threshold = success_threshold
+        
+        self.state = CLOSED
+        self.failure_count = 0
+        self.success_count = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+    
+    def before_call(self):
+        """
+        Check whether a call may proceed.
+        
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                probe already in flight
+        """
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.timeout_duration:
+                raise CircuitOpenError(f"{self.name} is temporarily unavailable")
+            self.state = HALF_OPEN
+            self.success_count = 0
+            logger.info(f"Circuit for {self.name} half-open, probing")
+        
+        if self.state == HALF_OPEN:
+            if self._probe_in_flight:
+                raise CircuitOpenError(f"{self.name} is temporarily unavailable")
+            self._probe_in_flight = True
+    
+    def record_success(self):
+        """Record a successful call."""
+        self._probe_in_flight = False
+        if self.state == HALF_OPEN:
+            self.success_count += 1
+            if self.success_count >= self.success_threshold:
+                self.state = CLOSED
+                logger.info(f"Circuit for {self.name} closed")
+        self.failure_count = 0
+    
+    def record_failure(self):
+        """Record a failed call (only failures that indicate the service is unhealthy)."""
+        self._probe_in_flight = False
+        self.failure_count += 1
+        if self.state == HALF_OPEN or self.failure_count >= self.failure_threshold:
+            if self.state != OPEN:
+                logger.warning(f"Circuit for {self.name} opened after {self.failure_count} failures")
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+    
+    def release(self):
+        """Record a call that says nothing about service health (e.g. a bad request)."""
+        self._probe_in_flight = False
@@ -0,0 +1,68 @@
+"""
+On-Disk Search Cache
+
+Persists raw web search results between runs so repeated evaluations
+(CI, scheduled refreshes) don't re-fetch evidence that is still fresh.
+Each entry is a small JSON file named by a hash of the query; entries
+older than the TTL are ignored and overwritten.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Optional
+from utils import json_codec
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """TTL'd JSON file cache keyed by an arbitrary string."""
+    
+    def __init__(self, path: str, ttl: float = 24 * 3600.0):
+        """
+        Initialize cache.
+        
+        Args:
+            path: Directory to store entries in (created on first write)
+            ttl: Seconds before an entry is considered stale
+        """
+        self.path = path
+        self.ttl = ttl
+    
+    def _file_for(self, key: str) -> str:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.path, f"{digest}.json")
+    
+    def get_sync(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing, stale or unreadable."""
+        file_path = self._file_for(key)
+        try:
+            if time.time() - os.path.getmtime(file_path) > self.ttl:
+                return None
+            with open(file_path, "rb") as f:
+                return json_codec.loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def set_sync(self, key: str, value: Any):
+        """Write a value atomically (write to temp file, then rename)."""
+        file_path = self._file_for(key)
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(json_codec.dumps(value))
+            os.replace(tmp_path, file_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Disk cache write failed: {str(e)}")
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Async lookup; file IO runs on a worker thread."""
+        return await asyncio.to_thread(self.get_sync, key)
+    
+    async def set(self, key: str, value: Any):
+        """Async store; file IO runs on a worker thread."""
+        await asyncio.to_thread(self.set_sync, key, value)
@@ -0,0 +1,54 @@
+"""
+Event Loop Setup
+
+Installs uvloop as the asyncio event loop policy when it is available.
+Evaluations schedule hundreds of small tasks and HTTP requests, where
+uvloop's libuv-based loop has noticeably lower per-task overhead.
+"""
+
+import asyncio
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Use uvloop for loops created after this call (e.g. by asyncio.run).
+    
+    Only standalone entry points should call this; under OpenClaw the host
+    owns the event loop.
+    
+    Returns:
+        True if uvloop was installed, False if the default loop is kept
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using default asyncio event loop")
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+    return True
+
+
+def enable_eager_tasks() -> bool:
+    """
+    Make the running loop start new tasks eagerly (Python 3.12+).
+    
+    An eager task runs synchronously until its first suspension, so tasks
+    that finish without awaiting (cache hits, fast-path helpers) skip a
+    round-trip through the scheduler. Like install_fast_event_loop, only
+    standalone entry points should call this.
+    
+    Returns:
+        True if eager tasks were enabled, False on older Pythons
+    """
+    if sys.version_info < (3, 12):
+        return False
+    
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    logger.debug("Using eager task factory")
+    return True
@@ -0,0 +1,29 @@
+"""
+JSON Codec
+
+Byte-oriented JSON helpers for hot paths (cache keys, cached search
+results, batched LLM responses). Uses orjson when it is installed and
+falls back to the standard library otherwise; both produce bytes.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up
+    orjson = None
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":")).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text; raises ValueError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,65 @@
+"""
+Keyword Scan
+
+Case-insensitive keyword lookup across many texts in a single regex pass.
+Used for tech stack support, scoring indicator words and the keyword
+parsers that read user queries.
+"""
+
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Sequence
+
+
+@lru_cache(maxsize=64)
+def keyword_pattern(keywords: FrozenSet[str]) -> "re.Pattern":
+    """
+    Single-pass matcher for a set of lower-cased keywords.
+    
+    The lookahead reports a match at every start position, longest keyword
+    first, so a shorter keyword that is a prefix of a longer one is still
+    recoverable from the matched text.
+    """
+    alternatives = sorted(keywords, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, alternatives)) + "))")
+
+
+def scan_keywords(texts: Sequence[str], keywords: Sequence[str]) -> List[Dict[str, bool]]:
+    """
+    Case-insensitive substring check of many keywords across many texts.
+    
+    All texts are lower-cased into one NUL-separated buffer and scanned by a
+    single compiled pattern; each hit is mapped back to its text by offset.
+    Each text is lower-cased on its own before joining, since lower-casing
+    can change a string's length and would otherwise shift the offsets.
+    
+    Args:
+        texts: Texts to scan (e.g. analyses for every candidate)
+        keywords: Keywords to look for
+    
+    Returns:
+        One {keyword: found} map per text, in input order
+    """
+    if not keywords:
+        return [{} for _ in texts]
+    
+    lowered = {keyword: keyword.lower() for keyword in keywords}
+    pattern = keyword_pattern(frozenset(lowered.values()))
+    
+    lowered_texts = [text.lower() for text in texts]
+    starts = []
+    offset = 0
+    for text in lowered_texts:
+        starts.append(offset)
+        offset += len(text) + 1
+    buffer = "\0".join(lowered_texts)
+    
+    found = [set() for _ in texts]
+    for match in pattern.finditer(buffer):
+        found[bisect_right(starts, match.start()) - 1].add(match.group(1))
+    
+    return [
+        {keyword: any(name in hit for hit in hits) for keyword, name in lowered.items()}
+        for hits in found
+    ]
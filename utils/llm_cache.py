@@ -0,0 +1,201 @@
+"""
+LLM Response Cache
+
+In-process cache for deterministic (low-temperature) chat completions.
+Identical requests - same model, messages and sampling settings - are
+answered from memory instead of paying for another API round-trip.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from utils import json_codec
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """Bounded LRU cache with per-entry TTL for LLM responses."""
+    
+    def __init__(self, max_size: int = 1024, ttl: float = 3600.0):
+        """
+        Initialize cache.
+        
+        Args:
+            max_size: Maximum number of cached responses
+            ttl: Seconds before an entry expires
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def cache_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        tools: Optional[Any] = None
+    ) -> str:
+        """Build a stable key for a completion request."""
+        payload = json_codec.dumps(
+            {"model": model, "messages": messages, "temperature": temperature, "tools": tools},
+            sort_keys=True
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Return cached value or None on miss/expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    async def set(self, key: str, value: Any):
+        """Store a value, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    async def delete(self, key: str):
+        """Drop an entry if present."""
+        self._entries.pop(key, None)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Return hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class CachedOpenAIClient:
+    """
+    OpenAIClient wrapper that serves repeat deterministic requests from cache.
+    
+    Only calls at or below `max_temperature` are cached; anything more
+    creative always goes to the API. All other attributes are delegated
+    to the wrapped client.
+    """
+    
+    def __init__(self, openai_client, cache: Optional[LLMCache] = None, max_temperature: float = 0.2):
+        """
+        Initialize wrapper.
+        
+        Args:
+            openai_client: Underlying OpenAIClient
+            cache: Cache instance (a private one is created if omitted)
+            max_temperature: Highest temperature considered cacheable
+        """
+        self._client = openai_client
+        self.cache = cache or LLMCache()
+        self.max_temperature = max_temperature
+    
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+    
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict] = None
+    ) -> str:
+        """Chat completion with a cache check for low-temperature requests."""
+        if temperature is None or temperature > self.max_temperature:
+            return await self._client.chat_completion(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=response_format
+            )
+        
+        key = LLMCache.cache_key(
+            getattr(self._client, "model", ""),
+            messages,
+            temperature,
+            {"max_tokens": max_tokens, "response_format": response_format}
+        )
+        
+        cached = await self.cache.get(key)
+        if cached is not None:
+            logger.debug("LLM cache hit")
+            return cached
+        
+        response = await self._client.chat_completion(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format
+        )
+        await self.cache.set(key, response)
+        return response
+    
+    async def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Streaming chat completion with the same caching rules.
+        
+        A cache hit is replayed as a single chunk. On a miss the text seen so
+        far is stored once the stream finishes or the consumer closes it early,
+        so a repeat request that stops at the same point is still served from
+        cache. Streams that fail mid-way are not cached.
+        """
+        if temperature is None or temperature > self.max_temperature:
+            async for delta in self._client.chat_completion_stream(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            ):
+                yield delta
+            return
+        
+        key = LLMCache.cache_key(
+            getattr(self._client, "model", ""),
+            messages,
+            temperature,
+            {"max_tokens": max_tokens, "stream": True}
+        )
+        
+        cached = await self.cache.get(key)
+        if cached is not None:
+            logger.debug("LLM cache hit (stream)")
+            yield cached
+            return
+        
+        chunks = []
+        stream = self._client.chat_completion_stream(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        try:
+            async for delta in stream:
+                chunks.append(delta)
+                yield delta
+        except GeneratorExit:
+            await self.cache.set(key, "".join(chunks))
+            raise
+        finally:
+            await stream.aclose()
+        
+        await self.cache.set(key, "".join(chunks))
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Return cache hit/miss counters."""
+        return self.cache.get_stats()
@@ -1,12 +1,83 @@
 """
 Logging configuration and utilities.
+
+Records are handed to a queue and written by a background listener thread,
+so logging calls on the request path never block on console or file IO.
 """
 
+import atexit
+import io
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Optional
 from config import config
 
+# Background thread that owns the real handlers; stopped at exit to flush
+_log_listener: Optional[QueueListener] = None
+
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+
+
+class SecondCachedFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted asctime within the same second.
+    
+    Only valid for date formats without sub-second fields, which is what
+    setup_logging uses.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = -1
+        self._last_str = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = super().formatTime(record, datefmt)
+            self._last_sec = sec
+        return self._last_str
+
+
+class BufferedFileHandler(logging.StreamHandler):
+    """
+    Append-only file handler that batches writes in a 64 KB buffer.
+    
+    Records are flushed to disk as soon as a WARNING or worse arrives, and
+    otherwise when the buffer fills or the handler is flushed/closed (which
+    logging does at interpreter exit).
+    """
+    
+    def __init__(self, filename: str, buffer_size: int = LOG_FILE_BUFFER_SIZE):
+        raw = open(filename, "ab", buffering=0)
+        stream = io.TextIOWrapper(
+            io.BufferedWriter(raw, buffer_size=buffer_size),
+            encoding="utf-8"
+        )
+        super().__init__(stream)
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        self.acquire()
+        try:
+            try:
+                self.flush()
+            finally:
+                self.stream.close()
+        finally:
+            self.release()
+            super().close()
+
 
 def setup_logging():
     """Setup logging configuration."""
@@ -14,7 +85,7 @@ def setup_logging():
     log_file = config.logging.log_file
     
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = SecondCachedFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -25,15 +96,26 @@ def setup_logging():
     console_handler.setFormatter(formatter)
     
     # File handler
-    file_handler = logging.FileHandler(log_file)
+    file_handler = BufferedFileHandler(log_file)
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
     
-    # Root logger
+    # Root logger only enqueues; formatting and IO happen in the listener
+    global _log_listener
+    stop_logging()
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(stop_logging)
+    
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
     
     # Reduce noise from external libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -45,6 +127,14 @@ def setup_logging():
     logging.info(f"Log file: {log_file}")
 
 
+def stop_logging():
+    """Flush queued records and stop the listener thread (safe to call twice)."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance."""
     return logging.getLogger(name)
@@ -1,44 +1,43 @@
 """
 Query Parser - Extracts structured context from natural language queries
 """
+import copy
+import hashlib
 import json
 import logging
-from typing import Dict, Any
-from integrations.openai_client import OpenAIClient
+import re
+from functools import lru_cache
+from typing import Dict, Any, Optional
+from config import config
+from integrations.openai_client import OpenAIClient, create_openai_client
+from utils import json_codec
+from utils.keyword_scan import scan_keywords
+from utils.llm_cache import CachedOpenAIClient, LLMCache
 
 logger = logging.getLogger(__name__)
 
+# Parsed contexts keyed by canonical query, shared by every parser, so a
+# repeated query (any casing, punctuation, filler words or word order)
+# skips the LLM round-trip
+_parse_cache = LLMCache(max_size=512, ttl=3600.0)
 
-class QueryParser:
-    """Parses natural language queries into structured evaluation context."""
-    
-    def __init__(self, openai_client: OpenAIClient = None):
-        """Initialize parser."""
-        self.openai = openai_client or OpenAIClient()
-    
-    async def parse_query(self, raw_query: str) -> Dict[str, Any]:
-        """
-        Parse a natural language query into structured context.
-        
-        Args:
-            raw_query: Natural language query like "evaluate payment gateways for Indian startup"
-        
-        Returns:
-            Structured context dict with:
-                - category: Vendor category (e.g., "payment gateway")
-                - tech_stack: List of technologies mentioned
-                - domain: Industry domain
-                - region: Geographic region
-                - scale: Usage scale
-                - priorities: List of priorities
-                - compliance: List of compliance requirements
-                - raw_query: Original query
-        """
-        logger.info(f"Parsing query: {raw_query}")
-        
-        prompt = f"""Extract structured evaluation context from this vendor evaluation query.
+# Words that never change the parsed context; "us" is deliberately absent
+# because it is a region
+_QUERY_STOPWORDS = frozenset({
+    "a", "an", "the", "for", "with", "of", "in", "on", "to", "and", "or",
+    "me", "my", "our", "we", "i", "please", "some", "best", "find", "evaluate"
+})
+_QUERY_TOKEN_RE = re.compile(r"[\w+#]+")
+
+
+# Parsing prompts; the terse one is used by default, the verbose one (with
+# rules and a worked example) is kept for debugging odd parses
+_PARSE_PROMPT = """Extract vendor evaluation context from: "{query}"
+Return only a JSON object with keys: category (vendor type), tech_stack (array), domain (industry, inferred; "general" if unknown), region ("Global" if unknown), scale (keep the original phrasing, e.g. "10K transactions/month"), priorities (array), compliance (array, e.g. "HIPAA", "PCI-DSS")."""
+
+_PARSE_PROMPT_VERBOSE = """Extract structured evaluation context from this vendor evaluation query.
 
-Query: "{raw_query}"
+Query: "{query}"
 
 Extract and return a JSON object with these fields:
 - category: The type of vendor/tool being evaluated (e.g., "payment gateway", "authentication", "CRM", "CDN")
@@ -61,9 +60,121 @@ Example:
 Query: "evaluate authentication for healthcare startup with 5000 users"
 Output: {{"category": "authentication", "tech_stack": [], "domain": "healthcare", "region": "Global", "scale": "5000 users", "priorities": [], "compliance": []}}
 """
+
+
+def _is_confident_parse(context: Dict[str, Any]) -> bool:
+    """Whether a fallback parse found a category plus at least one other hint."""
+    return context["category"] != "software vendor" and (
+        context["region"] != "Global"
+        or context["domain"] != "general"
+        or bool(context["compliance"])
+    )
+
+
+def _canonical_query_key(raw_query: str) -> Optional[str]:
+    """
+    Cache key shared by queries with the same multiset of meaningful words.
+    
+    Returns None when only stopwords remain, since such queries have
+    nothing to tell them apart and must not share a cached parse.
+    """
+    tokens = sorted(
+        token for token in _QUERY_TOKEN_RE.findall(raw_query.lower())
+        if token not in _QUERY_STOPWORDS
+    )
+    if not tokens:
+        return None
+    return hashlib.blake2b(" ".join(tokens).encode(), digest_size=16).hexdigest()
+
+# Fallback parser keyword tables, in priority order (the first listed hit
+# wins for single-valued fields); matching is by substring, except for
+# regions and domains, which must be whole words ("us" is not in "business")
+FALLBACK_CATEGORIES = (
+    "payment gateway", "authentication", "crm", "cdn", "database", "analytics",
+    "email", "sms", "monitoring", "logging", "storage"
+)
+FALLBACK_REGIONS = ("india", "indian", "us", "usa", "europe", "asia", "global")
+FALLBACK_SCALES = ("startup", "enterprise")
+FALLBACK_DOMAINS = ("healthcare", "fintech", "e-commerce", "saas", "education")
+FALLBACK_COMPLIANCE = ("hipaa", "pci-dss", "pci", "gdpr", "soc2", "rbi")
+_FALLBACK_KEYWORDS = tuple(dict.fromkeys(
+    FALLBACK_CATEGORIES + FALLBACK_SCALES + ("transaction",) + FALLBACK_COMPLIANCE
+))
+_FALLBACK_WORDS_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, FALLBACK_REGIONS + FALLBACK_DOMAINS)) + r")\b"
+)
+_TRANSACTIONS_RE = re.compile(r'(\d+[kKmM]?)\s*transactions?')
+
+
+class QueryParser:
+    """Parses natural language queries into structured evaluation context."""
+    
+    def __init__(
+        self,
+        openai_client: OpenAIClient = None,
+        cache: LLMCache = None,
+        fast_path: bool = None,
+        verbose_prompt: bool = False
+    ):
+        """
+        Initialize parser.
+        
+        Args:
+            openai_client: Client for the parsing call (defaults to the shared one)
+            cache: Parsed-context cache (defaults to the process-wide one)
+            fast_path: Return confident keyword parses without calling the
+                LLM (defaults to config.agent.fast_query_parse)
+            verbose_prompt: Send the long prompt with rules and an example
+        """
+        # Parsing runs at temperature 0.1, so repeated queries hit the cache
+        self.openai = openai_client or CachedOpenAIClient(create_openai_client())
+        self.cache = cache if cache is not None else _parse_cache
+        self.fast_path = config.agent.fast_query_parse if fast_path is None else fast_path
+        self.verbose_prompt = verbose_prompt
+        self.fast_path_hits = 0
+        self.llm_parses = 0
+    
+    async def parse_query(self, raw_query: str) -> Dict[str, Any]:
+        """
+        Parse a natural language query into structured context.
+        
+        Args:
+            raw_query: Natural language query like "evaluate payment gateways for Indian startup"
+        
+        Returns:
+            Structured context dict with:
+                - category: Vendor category (e.g., "payment gateway")
+                - tech_stack: List of technologies mentioned
+                - domain: Industry domain
+                - region: Geographic region
+                - scale: Usage scale
+                - priorities: List of priorities
+                - compliance: List of compliance requirements
+                - raw_query: Original query
+        """
+        logger.info("Parsing query: %s", raw_query)
         
-        response = await self.openai.generate_text(
-            prompt=prompt,
+        cache_key = _canonical_query_key(raw_query)
+        cached = await self.cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            logger.info("Parsed context served from cache")
+            context = copy.deepcopy(cached)
+            context['raw_query'] = raw_query
+            return context
+        
+        if self.fast_path:
+            context = self._fallback_parse(raw_query)
+            if _is_confident_parse(context):
+                self.fast_path_hits += 1
+                logger.info("Parsed context served by the keyword parser")
+                return context
+        self.llm_parses += 1
+        
+        template = _PARSE_PROMPT_VERBOSE if self.verbose_prompt else _PARSE_PROMPT
+        prompt = template.format(query=raw_query)
+        
+        response = await self.openai.chat_completion(
+            messages=[{"role": "user", "content": prompt}],
             max_tokens=500,
             temperature=0.1
         )
@@ -81,7 +192,7 @@ Output: {{"category": "authentication", "tech_stack": [], "domain": "healthcare"
                 raise ValueError("No JSON object found in response")
             
             json_str = response_text[start_idx:end_idx]
-            context = json.loads(json_str)
+            context = json_codec.loads(json_str)
             
             # Add raw query
             context['raw_query'] = raw_query
@@ -90,66 +201,56 @@ Output: {{"category": "authentication", "tech_stack": [], "domain": "healthcare"
             required = ['category', 'tech_stack', 'domain', 'region', 'scale', 'priorities', 'compliance']
             for field in required:
                 if field not in context:
-                    logger.warning(f"Missing field '{field}' in parsed context, using default")
+                    logger.warning("Missing field '%s' in parsed context, using default", field)
                     context[field] = [] if field in ['tech_stack', 'priorities', 'compliance'] else "unknown"
             
-            logger.info(f"Parsed context: {json.dumps(context, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Parsed context: %r", context)
+            # Only model-parsed contexts are cached; the fallback is cheap
+            if cache_key is not None:
+                await self.cache.set(cache_key, copy.deepcopy(context))
             return context
             
         except (json.JSONDecodeError, ValueError) as e:
-            logger.error(f"Failed to parse OpenAI response as JSON: {e}")
-            logger.error(f"Response was: {response}")
+            logger.error("Failed to parse OpenAI response as JSON: %s", e)
+            logger.error("Response was: %s", response)
             
             # Fallback: create minimal context from query
             logger.warning("Using fallback context extraction")
             return self._fallback_parse(raw_query)
     
+    def get_stats(self) -> Dict[str, int]:
+        """Return how many parses skipped or used the LLM."""
+        return {"fast_path_hits": self.fast_path_hits, "llm_parses": self.llm_parses}
+    
     def _fallback_parse(self, raw_query: str) -> Dict[str, Any]:
         """
         Fallback parser using simple heuristics if OpenAI parsing fails.
         """
         query_lower = raw_query.lower()
+        # One pass over the query for every keyword table
+        hits = scan_keywords([query_lower], _FALLBACK_KEYWORDS)[0]
+        words = set(_FALLBACK_WORDS_RE.findall(query_lower))
         
         # Try to extract category (first meaningful noun phrase)
-        category = "software vendor"
-        for keyword in ["payment gateway", "authentication", "crm", "cdn", "database", "analytics", 
-                       "email", "sms", "monitoring", "logging", "storage"]:
-            if keyword in query_lower:
-                category = keyword
-                break
+        category = next((c for c in FALLBACK_CATEGORIES if hits[c]), "software vendor")
         
         # Extract region
-        region = "Global"
-        for r in ["india", "indian", "us", "usa", "europe", "asia", "global"]:
-            if r in query_lower:
-                region = r.title()
-                break
+        region = next((r.title() for r in FALLBACK_REGIONS if r in words), "Global")
         
         # Extract scale indicators
-        scale = "unknown"
-        if "startup" in query_lower:
-            scale = "startup"
-        elif "enterprise" in query_lower:
-            scale = "enterprise"
-        elif "transaction" in query_lower:
+        scale = next((sc for sc in FALLBACK_SCALES if hits[sc]), "unknown")
+        if scale == "unknown" and hits["transaction"]:
             # Try to extract number
-            import re
-            match = re.search(r'(\d+[kKmM]?)\s*transactions?', query_lower)
+            match = _TRANSACTIONS_RE.search(query_lower)
             if match:
                 scale = f"{match.group(1)} transactions/month"
         
         # Extract domain
-        domain = "general"
-        for d in ["healthcare", "fintech", "e-commerce", "saas", "education"]:
-            if d in query_lower:
-                domain = d
-                break
+        domain = next((d for d in FALLBACK_DOMAINS if d in words), "general")
         
         # Extract compliance
-        compliance = []
-        for c in ["hipaa", "pci-dss", "pci", "gdpr", "soc2", "rbi"]:
-            if c in query_lower:
-                compliance.append(c.upper())
+        compliance = [c.upper() for c in FALLBACK_COMPLIANCE if hits[c]]
         
         context = {
             "category": category,
@@ -162,5 +263,12 @@ Output: {{"category": "authentication", "tech_stack": [], "domain": "healthcare"
             "raw_query": raw_query
         }
         
-        logger.info(f"Fallback parsed context: {json.dumps(context, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fallback parsed context: %r", context)
         return context
+
+
+@lru_cache(maxsize=1)
+def get_query_parser() -> QueryParser:
+    """Return the process-wide parser, so every caller shares one response cache."""
+    return QueryParser()
@@ -0,0 +1,45 @@
+"""
+Rate Limiter
+
+Token bucket that paces outbound API requests to stay under a provider's
+requests-per-minute limit. Concurrency limits alone still let bursts of
+short requests exceed RPM and come back as 429s; pacing starts keeps
+throughput steady just under the limit instead.
+"""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Async token bucket allowing `rate` acquisitions per `period` seconds."""
+    
+    def __init__(self, rate: float, period: float = 60.0, burst: int = 10):
+        """
+        Initialize limiter.
+        
+        Args:
+            rate: Acquisitions allowed per period (0 disables limiting)
+            period: Length of the rate window in seconds
+            burst: Acquisitions allowed back-to-back after an idle spell
+        """
+        self.refill_rate = rate / period if rate > 0 else 0.0
+        self.capacity = float(burst)
+        
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+    
+    async def acquire(self):
+        """Wait until a request may start."""
+        if not self.refill_rate:
+            return
+        
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+        
+        # Reserve a token now; waiters queue up by going into debt, and each
+        # sleeps until its own token has been refilled
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.refill_rate)
@@ -0,0 +1,122 @@
+"""
+Search Batcher
+
+Coalesces web searches issued by concurrent research tasks. Queries
+submitted within a short window are sent together through
+`ClawHubClient.batch_search`, and identical (query, num_results) pairs
+share a single in-flight request. Finished results are not kept here;
+caching them is left to ClawHub's search cache and its TTL.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SearchKey = Tuple[str, int]
+
+
+class SearchBatcher:
+    """Request coalescer in front of a ClawHub client."""
+    
+    def __init__(
+        self,
+        clawhub_client,
+        num_results: int = 5,
+        window: float = 0.005
+    ):
+        """
+        Initialize batcher.
+        
+        Args:
+            clawhub_client: ClawHub client providing batch_search()
+            num_results: Default number of results per query
+            window: Seconds to wait for more queries before flushing a batch
+        """
+        self.clawhub = clawhub_client
+        self.num_results = num_results
+        self.window = window
+        
+        # In-flight searches only; entries are dropped once resolved
+        self._futures: Dict[SearchKey, asyncio.Future] = {}
+        self._pending: List[Tuple[SearchKey, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: set = set()
+    
+    async def submit(self, query: str, num_results: Optional[int] = None) -> List[Dict]:
+        """
+        Queue a search and wait for its results.
+        
+        Args:
+            query: Search query string
+            num_results: Number of results (defaults to the batcher's setting)
+        
+        Returns:
+            Search results for the query
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Futures are bound to the loop that created them
+            self._reset(loop)
+        
+        key = (query, num_results or self.num_results)
+        future = self._futures.get(key)
+        
+        if future is None:
+            future = loop.create_future()
+            self._futures[key] = future
+            self._pending.append((key, future))
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+        
+        # Shield so one cancelled waiter does not cancel the shared result
+        return await asyncio.shield(future)
+    
+    def _reset(self, loop: asyncio.AbstractEventLoop):
+        """Drop state tied to a previous event loop."""
+        self._loop = loop
+        self._futures.clear()
+        self._pending = []
+        self._flush_handle = None
+    
+    def _flush(self):
+        """Send everything queued so far, one batch per result count."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, []
+        
+        by_size: Dict[int, List[Tuple[str, asyncio.Future]]] = {}
+        for (query, num_results), future in pending:
+            by_size.setdefault(num_results, []).append((query, future))
+        
+        for num_results, batch in by_size.items():
+            task = asyncio.ensure_future(self._run_batch(batch, num_results))
+            # Hold a reference until done so the task is not garbage collected
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]], num_results: int):
+        """Execute one batch and resolve the waiting futures."""
+        queries = [query for query, _ in batch]
+        logger.debug(f"Search batch: {len(queries)} queries (num_results={num_results})")
+        
+        try:
+            results_by_query = await self.clawhub.batch_search(queries, num_results=num_results)
+        except Exception as e:
+            logger.warning(f"Search batch failed: {str(e)}")
+            for query, future in batch:
+                self._forget(query, num_results, future)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for query, future in batch:
+            self._forget(query, num_results, future)
+            if not future.done():
+                future.set_result(results_by_query.get(query, []))
+    
+    def _forget(self, query: str, num_results: int, future: asyncio.Future):
+        """Stop coalescing onto a future that is about to resolve."""
+        if self._futures.get((query, num_results)) is future:
+            del self._futures[(query, num_results)]
@@ -5,11 +5,19 @@ Serves beautiful interactive reports with PDF export
 import os
 import json
 import asyncio
+import bisect
 import hashlib
+import threading
+import time
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import Flask, Response, render_template, request, jsonify, redirect, url_for
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up
+    orjson = None
+
 app = Flask(__name__)
 app.secret_key = os.getenv("FLASK_SECRET", "vendor-eval-secret-key")
 
@@ -20,53 +28,151 @@ REPORTS_DIR.mkdir(exist_ok=True)
 # In-memory cache
 reports_cache = {}
 
+# Last-seen mtime per report file, so unchanged files are not re-read, and of
+# the directory itself (files are replaced by rename, which bumps it), so an
+# unchanged directory is not re-scanned. Scans are serialized so a request
+# never sees the new directory mtime before the scan it belongs to is done.
+_mtimes = {}
+_dir_mtime = None
+_scan_lock = threading.Lock()
+# An mtime this close to the scan may be shared by a later change in the
+# same filesystem timestamp tick, so it is not trusted until it is older
+_MTIME_SETTLE_NS = 2_000_000_000
+
+# (etag, serialized JSON) per report, served as-is by the report API
+_payloads = {}
+
+# ((-created epoch, report id), view model) per report, kept sorted newest
+# first as reports are loaded/saved
+_index = []
+_index_lock = threading.Lock()
+
+# Bumped on every index change; the rendered dashboard is reused until then
+_reports_version = 0
+_cached_index = (None, -1)
+_list_cache = (b"", -1)
+
+
+def _loads(raw):
+    """Parse a report file's bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data, indent=True):
+    """Serialize as JSON bytes, indented (report files) or compact (API lists)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _store_payload(report_id, payload):
+    """Remember a report's serialized form and its ETag."""
+    _payloads[report_id] = (hashlib.blake2b(payload, digest_size=8).hexdigest(), payload)
+
+
+def _reindex(report_id, data):
+    """Insert or replace a report's dashboard view model in the sorted index."""
+    candidates = data.get("candidates", [])
+    rec = data.get("recommendation", {})
+    created = data.get("created_at", "")
+    try:
+        created_dt = datetime.fromisoformat(created)
+        date_str = created_dt.strftime("%b %d, %Y %H:%M")
+        created_epoch = created_dt.timestamp()
+    except Exception:
+        date_str = created[:10] if created else "—"
+        created_epoch = 0.0
+    view = {
+        "id": report_id,
+        "query": data.get("query", "Untitled evaluation"),
+        "date": date_str,
+        "candidates_count": len(candidates),
+        "winner": rec.get("primary", ""),
+        "status": data.get("status", "pending"),
+    }
+    global _reports_version
+    with _index_lock:
+        _index[:] = [item for item in _index if item[1]["id"] != report_id]
+        # Keys are unique per report, so the view dicts are never compared
+        bisect.insort(_index, ((-created_epoch, report_id), view))
+        _reports_version += 1
+
 
 def load_reports():
-    """Load all saved reports from disk."""
-    for f in REPORTS_DIR.glob("*.json"):
+    """Load new or changed reports from disk."""
+    global _dir_mtime
+    with _scan_lock:
+        settled_before = time.time_ns() - _MTIME_SETTLE_NS
         try:
-            data = json.loads(f.read_text())
-            reports_cache[f.stem] = data
-        except Exception:
-            pass
+            dir_mtime = REPORTS_DIR.stat().st_mtime_ns
+        except OSError:
+            return
+        if dir_mtime == _dir_mtime:
+            return
+
+        with os.scandir(REPORTS_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                report_id = entry.name[:-len(".json")]
+                try:
+                    mtime = entry.stat().st_mtime_ns
+                    if _mtimes.get(report_id) == mtime:
+                        continue
+                    with open(entry.path, "rb") as f:
+                        payload = f.read()
+                    data = _loads(payload)
+                    reports_cache[report_id] = data
+                    _store_payload(report_id, payload)
+                    _mtimes[report_id] = mtime if mtime < settled_before else None
+                    _reindex(report_id, data)
+                except Exception:
+                    pass
+
+        # Only once the scan is complete; a recent mtime forces a rescan
+        _dir_mtime = dir_mtime if dir_mtime < settled_before else None
 
 
 def save_report(report_id, data):
-    """Save report to disk and cache."""
+    """Save report to disk (atomically: temp file, then rename) and cache."""
+    payload = _dumps(data)
+    path = REPORTS_DIR / f"{report_id}.json"
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+    _mtimes[report_id] = path.stat().st_mtime_ns
     reports_cache[report_id] = data
-    (REPORTS_DIR / f"{report_id}.json").write_text(json.dumps(data, indent=2))
+    _store_payload(report_id, payload)
+    _reindex(report_id, data)
 
 
 def generate_report_id(query):
     """Generate a short unique ID for a report."""
     ts = datetime.now().strftime("%Y%m%d%H%M%S")
-    h = hashlib.md5(f"{query}{ts}".encode()).hexdigest()[:6]
-    return f"eval-{ts}-{h}"
+    h = hashlib.blake2b(digest_size=3)
+    h.update(query.encode())
+    h.update(ts.encode())
+    return f"eval-{ts}-{h.hexdigest()}"
 
 
 @app.route("/")
 def index():
     """Dashboard home — list all reports."""
+    global _cached_index
     load_reports()
-    reports_list = []
-    for rid, rdata in reports_cache.items():
-        candidates = rdata.get("candidates", [])
-        rec = rdata.get("recommendation", {})
-        created = rdata.get("created_at", "")
-        try:
-            date_str = datetime.fromisoformat(created).strftime("%b %d, %Y %H:%M")
-        except Exception:
-            date_str = created[:10] if created else "—"
-        reports_list.append({
-            "id": rid,
-            "query": rdata.get("query", "Untitled evaluation"),
-            "date": date_str,
-            "candidates_count": len(candidates),
-            "winner": rec.get("primary", ""),
-            "status": rdata.get("status", "pending"),
-        })
-    reports_list.sort(key=lambda x: x["date"], reverse=True)
-    return render_template("index.html", reports=reports_list)
+    with _index_lock:
+        version = _reports_version
+        reports_list = [view for _, view in _index]
+    html, cached_version = _cached_index
+    if cached_version == version:
+        return html
+    html = render_template("index.html", reports=reports_list)
+    _cached_index = (html, version)
+    return html
 
 
 @app.route("/report/<report_id>")
@@ -105,31 +211,38 @@ def create_report():
 def get_report_api(report_id):
     """API endpoint to fetch report data."""
     load_reports()
-    report = reports_cache.get(report_id)
-    if not report:
+    cached = _payloads.get(report_id)
+    if not cached:
         return jsonify({"error": "Report not found"}), 404
-    return jsonify(report)
+    # Serve the stored bytes; clients polling with If-None-Match get a 304
+    etag, payload = cached
+    response = Response(payload, mimetype="application/json")
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 
 @app.route("/api/reports", methods=["GET"])
 def list_reports_api():
     """API endpoint to list all reports."""
+    global _list_cache
     load_reports()
-    return jsonify({
-        "reports": [
-            {
+    with _index_lock:
+        version = _reports_version
+        ids = [view["id"] for _, view in _index]
+    payload, cached_version = _list_cache
+    if cached_version != version:
+        reports = []
+        for rid in ids:
+            r = reports_cache[rid]
+            reports.append({
                 "id": rid,
                 "query": r.get("query", ""),
                 "created_at": r.get("created_at", ""),
                 "recommendation": r.get("recommendation", {}).get("primary", "")
-            }
-            for rid, r in sorted(
-                reports_cache.items(),
-                key=lambda x: x[1].get("created_at", ""),
-                reverse=True
-            )
-        ]
-    })
+            })
+        payload = _dumps({"reports": reports}, indent=False)
+        _list_cache = (payload, version)
+    return Response(payload, mimetype="application/json")
 
 
 @app.route("/new", methods=["GET", "POST"])
@@ -336,4 +449,5 @@ def demo_report():
 if __name__ == "__main__":
     load_reports()
     port = int(os.getenv("REPORT_PORT", 8080))
-    app.run(host="0.0.0.0", port=port, debug=True)
+    # Development server only; deployments run wsgi:app under gunicorn
+    app.run(host="0.0.0.0", port=port, debug=os.getenv("FLASK_ENV") == "development", threaded=True)
@@ -0,0 +1,12 @@
+"""
+WSGI entry point for the web report dashboard.
+
+Run from this directory with a production server, e.g.:
+    gunicorn -w 4 -k gthread --threads 4 -b 0.0.0.0:${REPORT_PORT:-8080} wsgi:app
+"""
+from app import app, load_reports
+
+__all__ = ["app"]
+
+# Each worker process keeps its own in-memory index; warm it at startup
+load_reports()